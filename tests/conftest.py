@@ -0,0 +1,20 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def frame():
+    """Mixed-type frame with missing values, split into 1,500 base rows and 500 appended ones."""
+    rng = np.random.default_rng(0)
+    n = 2000
+    price = rng.lognormal(7, 1, n)
+    price[rng.random(n) < 0.05] = np.nan
+    return pd.DataFrame({
+        "cut": pd.Categorical(rng.choice(["Fair", "Good", "Ideal", "Premium"], n, p=[0.1, 0.2, 0.4, 0.3])),
+        "color": rng.choice(list("DEFGHIJ"), n),
+        "carat": rng.gamma(2.0, 0.4, n),
+        "price": price,
+        "depth": rng.normal(61.7, 1.4, n),
+        "qty": rng.integers(-50, 500, n),
+    })
@@ -0,0 +1,33 @@
+import pandas as pd
+import pytest
+
+from vizlab.aggregate import aggregate, aggregate_label, append_rows
+
+
+@pytest.mark.parametrize("how", ["sum", "mean", "count"])
+def test_aggregate_matches_groupby(frame, how):
+    got = aggregate(frame, "cut", "price", how)
+    expected = getattr(frame.groupby("cut", observed=True)["price"], how)()
+    assert got["cut"].tolist() == expected.index.tolist()
+    assert got[aggregate_label("price", how)].tolist() == pytest.approx(expected.tolist(), rel=1e-12)
+
+
+def test_appended_aggregates_match_a_fresh_groupby(frame):
+    start = 1500
+    base, rows = frame.iloc[:start], frame.iloc[start:]
+    for how in ("sum", "count", "mean"):
+        aggregate(base, ["cut", "color"], "price", how, dataset_key="agg-base")
+    assert append_rows("agg-base", "agg-grown", rows) == 3
+    for how in ("sum", "count", "mean"):
+        got = aggregate(frame, ["cut", "color"], "price", how, dataset_key="agg-grown")
+        expected = aggregate(frame, ["cut", "color"], "price", how)
+        pd.testing.assert_frame_equal(got, expected, check_dtype=False, rtol=1e-12)
+
+
+def test_appended_rows_can_add_groups(frame):
+    base = frame[frame["color"] != "J"]
+    grown = pd.concat([base, frame[frame["color"] == "J"]], ignore_index=True)
+    aggregate(base, "color", "carat", "sum", dataset_key="agg-new-base")
+    append_rows("agg-new-base", "agg-new-grown", grown.iloc[len(base):])
+    got = aggregate(grown, "color", "carat", "sum", dataset_key="agg-new-grown")
+    pd.testing.assert_frame_equal(got, aggregate(grown, "color", "carat", "sum"), check_dtype=False, rtol=1e-12)
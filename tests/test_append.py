@@ -0,0 +1,50 @@
+import io
+
+import pandas as pd
+import pytest
+
+from vizlab.append import append_dataset
+from vizlab.ingest import SchemaError, load_dataset
+from vizlab.profile import DatasetProfile, get_profile
+from vizlab.store import DatasetStore
+
+
+class Upload(io.BytesIO):
+    def __init__(self, name, data):
+        super().__init__(data)
+        self.name = name
+
+
+def csv_upload(name, df):
+    return Upload(name, df.to_csv(index=False).encode())
+
+
+@pytest.fixture
+def store(monkeypatch):
+    # Parse every upload instead of going through on-disk snapshots.
+    monkeypatch.setattr("vizlab.snapshot.read_snapshot", lambda key: None)
+    monkeypatch.setattr("vizlab.snapshot.write_snapshot", lambda key, df, report: None)
+    return DatasetStore()
+
+
+def test_append_dataset_matches_loading_everything(frame, store):
+    base, rows = frame.iloc[:1500], frame.iloc[1500:]
+    handle = load_dataset(csv_upload("base.csv", base), store=store)
+    get_profile(handle.df, handle.key)
+    grown = append_dataset(handle, csv_upload("rows.csv", rows), store)
+    whole = load_dataset(csv_upload("all.csv", frame), store=store)
+    pd.testing.assert_frame_equal(grown.df, whole.df, check_categorical=False)
+    assert grown.report["rows_appended"] == len(rows)
+    assert grown.report["carried"]["profile"] == 1
+    profile = get_profile(grown.df, grown.key)
+    fresh = DatasetProfile(whole.df)
+    assert profile.cardinality == fresh.cardinality
+    pd.testing.assert_frame_equal(profile.describe, fresh.describe, rtol=1e-9)
+    # The same file appended again leaves the dataset as it is.
+    assert append_dataset(grown, csv_upload("rows.csv", rows), store) is grown
+
+
+def test_append_dataset_rejects_other_columns(frame, store):
+    handle = load_dataset(csv_upload("base.csv", frame.iloc[:100]), store=store)
+    with pytest.raises(SchemaError):
+        append_dataset(handle, csv_upload("rows.csv", frame.iloc[100:].drop(columns="depth")), store)
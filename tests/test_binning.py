@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+
+from vizlab.binning import BIN_CACHE, append_rows, category_counts, histogram, histogram2d
+
+
+def test_histogram_matches_numpy(frame):
+    counts, edges = histogram(frame, "price", bins=30)
+    values = frame["price"].dropna().to_numpy()
+    expected, expected_edges = np.histogram(values, bins=30)
+    np.testing.assert_array_equal(counts, expected)
+    np.testing.assert_allclose(edges, expected_edges)
+
+
+def test_appended_bins_match_a_fresh_binning(frame):
+    # The appended rows stay inside the base rows' range, so the edges hold.
+    base = frame[frame["carat"].between(0.05, 3.0) | (frame.index < 10)]
+    extra = frame[frame["carat"].between(0.2, 2.0)]
+    grown = pd.concat([base, extra], ignore_index=True)
+    rows = grown.iloc[len(base):]
+    histogram(base, "carat", 25, dataset_key="bins-base")
+    histogram(base, "price", 25, range=(0.0, 1e5), dataset_key="bins-base")
+    histogram2d(base, "carat", "depth", 20, range=((0.0, 6.0), (50.0, 75.0)), dataset_key="bins-base")
+    category_counts(base, "color", dataset_key="bins-base")
+    assert append_rows("bins-base", "bins-grown", rows) == 4
+
+    for got, expected in [
+        (BIN_CACHE.get(("hist", "bins-grown", "carat", 25, None)), histogram(grown, "carat", 25)),
+        (BIN_CACHE.get(("hist", "bins-grown", "price", 25, (0.0, 1e5))), histogram(grown, "price", 25, (0.0, 1e5))),
+        (BIN_CACHE.get(("hist2d", "bins-grown", "carat", "depth", 20, ((0.0, 6.0), (50.0, 75.0)))),
+         histogram2d(grown, "carat", "depth", 20, ((0.0, 6.0), (50.0, 75.0)))),
+    ]:
+        for a, b in zip(got, expected):
+            np.testing.assert_allclose(a, b)
+    labels, counts = BIN_CACHE.get(("counts", "bins-grown", "color"))
+    expected = grown["color"].value_counts()
+    assert dict(zip(labels, counts)) == expected.to_dict()
+
+
+def test_rows_outside_data_derived_edges_are_not_carried(frame):
+    base = frame.iloc[:100]
+    rows = pd.DataFrame({c: frame[c].iloc[:1] for c in frame.columns}).assign(carat=base["carat"].max() + 1)
+    histogram(base, "carat", 10, dataset_key="bins-edge")
+    assert append_rows("bins-edge", "bins-edge-grown", rows) == 0
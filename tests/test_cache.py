@@ -0,0 +1,75 @@
+from vizlab.cache import LRUCache
+
+
+def test_hits_misses_and_compute_once():
+    cache = LRUCache(max_entries=4)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return "value"
+
+    assert cache.get_or_compute("a", compute) == "value"
+    assert cache.get_or_compute("a", compute) == "value"
+    assert cache.get("missing") is None
+    assert len(calls) == 1
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 2, 1)
+
+
+def test_evicts_least_recently_used_entry():
+    evicted = []
+    cache = LRUCache(max_entries=2, on_evict=evicted.append)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+    assert cache.keys() == ["a", "c"]
+    assert evicted == [2]
+    assert cache.stats()["evictions"] == 1
+
+
+def test_byte_budget_evicts_oldest_and_keeps_newest():
+    cache = LRUCache(max_entries=10, max_bytes=100, sizeof=len)
+    cache.put("a", "x" * 40)
+    cache.put("b", "x" * 40)
+    cache.put("c", "x" * 40)
+    assert cache.keys() == ["b", "c"]
+    assert cache.nbytes == 80
+    # A single entry over the budget is kept rather than leaving the cache empty.
+    cache.put("d", "x" * 500)
+    assert cache.keys() == ["d"]
+    assert cache.nbytes == 500
+
+
+def test_replacing_a_key_updates_its_size():
+    cache = LRUCache(max_bytes=100, sizeof=len)
+    cache.put("a", "x" * 30)
+    cache.put("a", "x" * 10)
+    assert cache.nbytes == 10
+    assert cache.pop("a") == "x" * 10
+    assert cache.nbytes == 0
+
+
+def test_pinned_values_are_skipped_until_trimmed():
+    pinned = {"a"}
+    evicted = []
+    cache = LRUCache(max_entries=2, on_evict=evicted.append, pinned=lambda v: v in pinned)
+    cache.put("a", "a")
+    cache.put("b", "b")
+    cache.put("c", "c")
+    assert cache.keys() == ["a", "c"]
+    pinned.update({"c", "d"})
+    cache.put("d", "d")
+    assert cache.keys() == ["a", "c", "d"]
+    pinned.clear()
+    cache.trim()
+    assert cache.keys() == ["c", "d"]
+    assert evicted == ["b", "a"]
+
+
+def test_everything_pinned_lets_the_cache_overflow():
+    cache = LRUCache(max_entries=1, pinned=lambda v: True)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.keys() == ["a", "b"]
@@ -0,0 +1,22 @@
+import pandas as pd
+
+from vizlab.categories import collapse, collapse_counts
+
+
+def test_collapse_keeps_top_categories_and_folds_the_rest(frame):
+    out = collapse(frame, "color", 3)
+    top = frame["color"].value_counts().index[:3]
+    assert list(out["color"].cat.categories) == list(top) + ["Other"]
+    assert (out["color"] == "Other").sum() == (~frame["color"].isin(top)).sum()
+    assert collapse(frame, "color", 0) is frame
+    assert collapse(frame, "color", 50) is frame
+
+
+def test_other_label_never_clashes_with_a_kept_category():
+    df = pd.DataFrame({"c": ["Other"] * 5 + ["a"] * 3 + ["b", "c"]})
+    assert list(collapse(df, "c", 2)["c"].cat.categories) == ["Other", "a", "Other "]
+    labels, counts = collapse_counts(["Other", "a", "b", "c"], [10, 5, 1, 1], n=2)
+    assert labels.tolist() == ["Other", "a", "Other "]
+    assert counts.tolist() == [10, 5, 2]
+    labels, _ = collapse_counts(["x", "a", "b"], [3, 2, 1], n=2)
+    assert labels.tolist() == ["x", "a", "Other"]
@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from vizlab.correlation import CORR_CACHE, PearsonState, append_rows, correlation
+
+COLS = ["carat", "price", "depth", "qty"]
+
+
+def test_pearson_matches_pandas_with_missing_values(frame):
+    got = correlation(frame, COLS)
+    pd.testing.assert_frame_equal(got, frame[COLS].corr(), rtol=1e-9)
+
+
+@pytest.mark.parametrize("split", [1, 700, 1999])
+def test_merged_states_match_a_single_pass(frame, split):
+    merged = PearsonState(COLS).update(frame.iloc[:split]).merge(PearsonState(COLS).update(frame.iloc[split:]))
+    fresh = PearsonState(COLS).update(frame)
+    np.testing.assert_allclose(merged.n, fresh.n)
+    pd.testing.assert_frame_equal(merged.matrix(), fresh.matrix(), rtol=1e-9)
+
+
+def test_merge_rejects_other_columns():
+    with pytest.raises(ValueError):
+        PearsonState(["a"]).merge(PearsonState(["b"]))
+
+
+def test_append_rows_extends_the_cached_sums(frame):
+    start = 1500
+    correlation(frame.iloc[:start], dataset_key="corr-base")
+    assert append_rows("corr-base", "corr-grown", frame.iloc[start:])
+    assert ("corr-grown", "pearson") in CORR_CACHE
+    numeric = frame.select_dtypes(include="number").columns
+    pd.testing.assert_frame_equal(correlation(frame, dataset_key="corr-grown"), frame[numeric].corr(), rtol=1e-9)
@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from vizlab.downsample import downsample, lttb_indices, minmax_indices
+
+
+@pytest.fixture
+def series():
+    rng = np.random.default_rng(2)
+    y = np.cumsum(rng.normal(size=20_000))
+    y[rng.integers(0, len(y), 50)] = np.nan
+    return np.arange(len(y), dtype="float64"), y
+
+
+def assert_keeps_shape(rows, y, n_out):
+    valid = np.flatnonzero(~np.isnan(y))
+    assert len(rows) <= n_out + 4
+    assert np.all(np.diff(rows) > 0)
+    assert {valid[0], valid[-1], np.nanargmin(y), np.nanargmax(y)} <= set(rows.tolist())
+
+
+@pytest.mark.parametrize("n_out", [10, 100, 1000])
+def test_lttb_keeps_endpoints_and_extremes(series, n_out):
+    x, y = series
+    assert_keeps_shape(lttb_indices(x, y, n_out), y, n_out)
+
+
+@pytest.mark.parametrize("n_out", [10, 100, 1000])
+def test_minmax_keeps_endpoints_and_extremes(series, n_out):
+    _, y = series
+    rows = minmax_indices(y, n_out)
+    assert_keeps_shape(rows, y, n_out)
+    # Every bucket's extremes survive, so the min/max envelope is exact.
+    assert np.nanmax(y[rows]) == np.nanmax(y) and np.nanmin(y[rows]) == np.nanmin(y)
+
+
+def test_short_series_are_returned_whole(series):
+    x, y = series
+    df = pd.DataFrame({"x": x[:50], "y": y[:50]})
+    assert downsample(df, "x", "y", 100, "LTTB") is df
+    np.testing.assert_array_equal(lttb_indices(x[:50], y[:50], 100), np.flatnonzero(~np.isnan(y[:50])))
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from vizlab.filters import (
+    apply_filters, condition_bitmap, drop_dataset, range_filter, row_mask, values_filter, VIEW_CACHE,
+)
+
+
+def unpack(bitmap, n):
+    return np.unpackbits(bitmap, count=n).view(bool)
+
+
+@pytest.mark.parametrize("condition, expected", [
+    (range_filter("price", 500, 2000), lambda df: df["price"].between(500, 2000)),
+    (range_filter("qty", -10, 10), lambda df: df["qty"].between(-10, 10)),
+    (values_filter("cut", ["Ideal", "Fair"]), lambda df: df["cut"].isin(["Ideal", "Fair"])),
+    (values_filter("color", list("DEFGHIJ")), lambda df: df["color"].isin(list("DEFGHIJ"))),
+    (values_filter("color", ["nope"]), lambda df: df["color"].isin(["nope"])),
+])
+def test_condition_bitmaps_match_boolean_masks(frame, condition, expected):
+    for key in (None, "filters-bitmaps"):
+        bitmap = condition_bitmap(frame, condition, key)
+        np.testing.assert_array_equal(unpack(bitmap, len(frame)), expected(frame).to_numpy())
+
+
+def test_many_selected_values_use_the_code_lookup(frame):
+    df = frame.assign(code=(np.arange(len(frame)) % 40).astype(str))
+    chosen = [str(i) for i in range(0, 40, 2)]
+    mask = unpack(condition_bitmap(df, values_filter("code", chosen)), len(df))
+    np.testing.assert_array_equal(mask, df["code"].isin(chosen).to_numpy())
+
+
+def test_date_ranges(frame):
+    df = frame.assign(day=pd.date_range("2024-01-01", periods=len(frame), freq="h"))
+    df.loc[5, "day"] = pd.NaT
+    lo, hi = pd.Timestamp("2024-01-10"), pd.Timestamp("2024-01-20 12:00")
+    mask = unpack(condition_bitmap(df, range_filter("day", lo, hi)), len(df))
+    np.testing.assert_array_equal(mask, df["day"].between(lo, hi).to_numpy())
+
+
+def test_filters_are_anded_and_views_cached(frame):
+    filters = [range_filter("carat", 0.5, 1.5), values_filter("cut", ["Ideal"])]
+    expected = frame[frame["carat"].between(0.5, 1.5) & (frame["cut"] == "Ideal")]
+    np.testing.assert_array_equal(row_mask(frame, filters), frame.index.isin(expected.index))
+    view, key = apply_filters(frame, filters, "filters-view")
+    pd.testing.assert_frame_equal(view, expected)
+    assert key.startswith("filters-view:")
+    again, same_key = apply_filters(frame, filters[::-1], "filters-view")
+    assert again is view and same_key == key
+    drop_dataset("filters-view")
+    assert not any(k[0] == "filters-view" for k in VIEW_CACHE.keys())
+
+
+def test_no_filters_returns_the_dataset(frame):
+    assert apply_filters(frame, (), "filters-none") == (frame, "filters-none")
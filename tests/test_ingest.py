@@ -0,0 +1,76 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from vizlab.ingest import SchemaError, append_frame, compact_dtypes, content_hash, file_hash
+
+
+def test_integers_take_the_narrowest_dtype_for_their_range():
+    df = pd.DataFrame({
+        "small": [-5, 0, 120],
+        "price": [326, 18823, 5000],
+        "wide": [0, 70_000, 1],
+        "huge": [-2 ** 40, 0, 1],
+    })
+    out, report = compact_dtypes(df)
+    assert out.dtypes.astype(str).to_dict() == {
+        "small": "int8", "price": "int16", "wide": "int32", "huge": "int64",
+    }
+    assert report["changes"]["price"] == ("int64", "int16")
+    pd.testing.assert_frame_equal(out.astype("int64"), df)
+
+
+def test_floats_go_to_float32_only_with_six_significant_digits():
+    df = pd.DataFrame({
+        "carat": [0.23, 1.01, 5.01],
+        "depth": [61.5, 59.8, 62.45],
+        "precise": [0.1234567, 1.0, 2.0],
+        "tiny": [1e-40, 1.0, 2.0],
+        "large": [1e39, 1.0, 2.0],
+    })
+    out, _ = compact_dtypes(df)
+    assert out["carat"].dtype == np.float32
+    assert out["depth"].dtype == np.float32
+    for col in ("precise", "tiny", "large"):
+        assert out[col].dtype == np.float64
+    back = out["depth"].astype("float64").to_numpy()
+    assert [float(f"{v:.6g}") for v in back] == df["depth"].tolist()
+
+
+def test_low_cardinality_strings_become_categories():
+    df = pd.DataFrame({
+        "cut": ["Ideal", "Good", "Ideal", "Ideal"],
+        "id": ["a", "b", "c", "d"],
+        "flag": [True, False, True, True],
+    })
+    out, report = compact_dtypes(df)
+    assert isinstance(out["cut"].dtype, pd.CategoricalDtype)
+    assert not isinstance(out["id"].dtype, pd.CategoricalDtype)
+    assert out["flag"].dtype == bool
+    assert set(report["changes"]) == {"cut"}
+    assert report["after"] <= report["before"]
+
+
+def test_file_hash_matches_content_hash():
+    data = b"a,b\n" + b"1,2\n" * 1000
+    assert file_hash(io.BytesIO(data), chunk_size=7) == content_hash(data)
+
+
+def test_append_frame_extends_categories_and_widens_integers():
+    df, _ = compact_dtypes(pd.DataFrame({"cut": ["Ideal", "Good"] * 3, "n": [1, 2, 3, 4, 5, 6]}))
+    rows = pd.DataFrame({"n": [100_000], "cut": ["Fair"]})
+    out = append_frame(df, rows)
+    assert out["cut"].tolist()[-1] == "Fair"
+    assert list(out["cut"].cat.categories[:2]) == list(df["cut"].cat.categories)
+    assert out["n"].dtype == np.int32
+    assert out["n"].tolist() == [1, 2, 3, 4, 5, 6, 100_000]
+
+
+def test_append_frame_rejects_mismatched_columns():
+    df = pd.DataFrame({"a": [1, 2], "b": [1.0, 2.0]})
+    with pytest.raises(SchemaError, match="missing b"):
+        append_frame(df, pd.DataFrame({"a": [3]}))
+    with pytest.raises(SchemaError, match="holds numbers"):
+        append_frame(df, pd.DataFrame({"a": ["x"], "b": [1.0]}))
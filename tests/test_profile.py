@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from vizlab.profile import DatasetProfile, append_rows, get_profile
+
+
+def assert_same_profile(got, expected):
+    assert (got.rows, got.n_columns) == (expected.rows, expected.n_columns)
+    assert got.numeric_cols == expected.numeric_cols
+    assert got.categorical_cols == expected.categorical_cols
+    assert got.missing == expected.missing
+    pd.testing.assert_series_equal(got.nulls, expected.nulls)
+    assert got.cardinality == expected.cardinality
+    assert got.monotonic == expected.monotonic
+    for col in expected.numeric_cols:
+        assert got.skew[col] == pytest.approx(expected.skew[col], rel=1e-9)
+    pd.testing.assert_frame_equal(got.describe, expected.describe, rtol=1e-9)
+
+
+def test_appended_profile_matches_a_fresh_one(frame):
+    start = 1500
+    merged = DatasetProfile(frame.iloc[:start]).appended(frame, start)
+    assert_same_profile(merged, DatasetProfile(frame))
+
+
+def test_appended_rows_can_break_or_keep_monotonic_order():
+    df = pd.DataFrame({"t": np.arange(10.0), "v": np.arange(10.0)[::-1]})
+    kept = pd.concat([df, pd.DataFrame({"t": [10.0, 11.0], "v": [-1.0, -2.0]})], ignore_index=True)
+    broken = pd.concat([df, pd.DataFrame({"t": [3.0], "v": [50.0]})], ignore_index=True)
+    profile = DatasetProfile(df)
+    assert profile.monotonic == {"t": "increasing", "v": "decreasing"}
+    assert_same_profile(profile.appended(kept, len(df)), DatasetProfile(kept))
+    assert_same_profile(profile.appended(broken, len(df)), DatasetProfile(broken))
+    assert profile.appended(broken, len(df)).monotonic == {"t": None, "v": None}
+
+
+def test_append_rows_carries_the_cached_profile(frame):
+    start = 1500
+    get_profile(frame.iloc[:start], "profile-base")
+    assert append_rows("profile-base", "profile-grown", frame, start)
+    assert_same_profile(get_profile(frame, "profile-grown"), DatasetProfile(frame))
+    assert not append_rows("profile-missing", "profile-other", frame, start)
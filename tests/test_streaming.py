@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from vizlab.streaming import ColumnMoments, StreamSummary
+
+
+@pytest.mark.parametrize("split", [1, 2, 500, 1999])
+def test_merged_moments_match_a_single_pass(split):
+    rng = np.random.default_rng(1)
+    values = rng.gamma(2.0, 3.0, 2000)
+    merged = ColumnMoments.from_values(values[:split]).merge(ColumnMoments.from_values(values[split:]))
+    series = pd.Series(values)
+    assert merged.count == len(values)
+    assert merged.mean == pytest.approx(series.mean(), rel=1e-12)
+    assert merged.std == pytest.approx(series.std(), rel=1e-10)
+    assert merged.skew == pytest.approx(series.skew(), rel=1e-9)
+    assert (merged.min, merged.max) == (values.min(), values.max())
+
+
+def test_merge_with_empty_moments_and_missing_values():
+    values = np.array([1.0, np.nan, 3.0, 8.0])
+    moments = ColumnMoments.from_values(values)
+    assert moments.count == 3
+    assert ColumnMoments().merge(moments).mean == moments.mean
+    assert moments.merge(ColumnMoments.from_values(np.array([np.nan]))) is moments
+    assert np.isnan(ColumnMoments.from_values(np.array([2.0])).skew)
+
+
+def test_stream_summary_of_chunks_matches_pandas(frame):
+    summary = StreamSummary(sample_size=100, seed=0)
+    for start in range(0, len(frame), 300):
+        summary.update(frame.iloc[start:start + 300])
+    assert summary.rows == len(frame)
+    assert summary.missing == int(frame.isna().sum().sum())
+    expected = frame.describe()
+    got = summary.describe()
+    for col in ("carat", "price", "qty"):
+        for stat in ("count", "mean", "std", "min", "max"):
+            assert got.loc[stat, col] == pytest.approx(expected.loc[stat, col], rel=1e-9)
+    assert len(summary.sample_frame()) == 100
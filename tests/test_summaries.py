@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from vizlab.summaries import WHISKER, group_summary
+
+
+def test_quartiles_whiskers_and_outliers_match_numpy(frame):
+    summary = group_summary(frame, "cut", "price", top_n=0)
+    assert list(summary.labels) == list(frame["cut"].cat.categories)
+    for i, label in enumerate(summary.labels):
+        values = np.sort(frame.loc[frame["cut"] == label, "price"].dropna().to_numpy())
+        q1, median, q3 = np.quantile(values, [0.25, 0.5, 0.75])
+        assert summary.count[i] == len(values)
+        assert summary.mean[i] == pytest.approx(values.mean(), rel=1e-12)
+        assert (summary.q1[i], summary.median[i], summary.q3[i]) == pytest.approx((q1, median, q3), rel=1e-12)
+        assert (summary.min[i], summary.max[i]) == (values[0], values[-1])
+        low, high = q1 - WHISKER * (q3 - q1), q3 + WHISKER * (q3 - q1)
+        inside = values[(values >= low) & (values <= high)]
+        assert (summary.lower[i], summary.upper[i]) == (inside.min(), inside.max())
+        np.testing.assert_array_equal(summary.outliers[i], values[(values < low) | (values > high)])
+
+
+def test_density_integrates_to_one_inside_each_group(frame):
+    summary = group_summary(frame, "color", "carat", top_n=0)
+    step = summary.grid[1] - summary.grid[0]
+    np.testing.assert_allclose(summary.density.sum(axis=1) * step, 1.0)
+    for i in range(len(summary)):
+        outside = (summary.grid < summary.min[i]) | (summary.grid > summary.max[i])
+        assert not summary.density[i][outside].any()
+
+
+def test_top_n_folds_the_rest_into_other(frame):
+    summary = group_summary(frame, "color", "price", top_n=3)
+    assert len(summary) == 4
+    assert summary.labels[-1] == "Other"
+    assert summary.count.sum() == frame["price"].notna().sum()
@@ -0,0 +1 @@
+"""Data handling and rendering helpers used by the VizLab Streamlit app."""
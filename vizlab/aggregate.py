@@ -0,0 +1,95 @@
+"""Server-side aggregation so categorical charts carry one mark per group.
+
+Cached means are derived from a cached sum and count, which (unlike a mean)
+can be extended with appended rows; see :func:`append_rows`.
+"""
+
+import numpy as np
+import pandas as pd
+
+from vizlab.cache import LRUCache
+
+AGGREGATIONS = ["sum", "mean", "count"]
+
+# Grouped results are small, so charts over the same dataset share them.
+AGG_CACHE = LRUCache(max_entries=128)
+
+
+def aggregate(df, by, value, how="sum", dataset_key=None):
+    """Group ``df`` by one or more columns and reduce ``value`` with ``how``.
+
+    Returns a flat frame with the group columns followed by the reduced values
+    in a column named by :func:`aggregate_label`, one row per observed group.
+    Rows whose group key is missing are dropped, matching what Plotly does
+    with them. Results are memoized under ``dataset_key`` when one is given.
+    """
+    if how not in AGGREGATIONS:
+        raise ValueError(f"Unsupported aggregation: {how}")
+    by = [by] if isinstance(by, str) else list(by)
+    if dataset_key is None:
+        return _aggregate(df, by, value, how)
+    key = (dataset_key, tuple(by), value, how)
+    if how == "mean":
+        return AGG_CACHE.get_or_compute(key, lambda: _mean(
+            aggregate(df, by, value, "sum", dataset_key), aggregate(df, by, value, "count", dataset_key), value,
+        ))
+    return AGG_CACHE.get_or_compute(key, lambda: _aggregate(df, by, value, how))
+
+
+def _aggregate(df, by, value, how):
+    grouped = df.groupby(by, observed=True, sort=True)[value]
+    reduced = getattr(grouped, how)()
+    # Build the frame by hand: ``value`` may itself be one of the group keys.
+    out = reduced.index.to_frame(index=False)
+    out[aggregate_label(value, how)] = reduced.to_numpy()
+    return out
+
+
+def _mean(total, count, value):
+    out = total.drop(columns=aggregate_label(value, "sum"))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[aggregate_label(value, "mean")] = (
+            total[aggregate_label(value, "sum")].to_numpy(dtype="float64")
+            / count[aggregate_label(value, "count")].to_numpy(dtype="float64")
+        )
+    return out
+
+
+def aggregate_label(value, how):
+    """Column name (and axis label) of an aggregated value."""
+    return f"{value} ({how})"
+
+
+def append_rows(dataset_key, new_key, rows):
+    """Carry the cached sums, counts and means of ``dataset_key`` over to
+    ``new_key``, the same dataset with ``rows`` appended, by aggregating the
+    new rows only and adding them group by group.
+
+    Returns the number of entries carried over.
+    """
+    carried = 0
+    keys = [k for k in AGG_CACHE.keys() if k[0] == dataset_key]
+    # Sums and counts first: the means are rebuilt from them.
+    for key in sorted(keys, key=lambda k: k[3] == "mean"):
+        _, by, value, how = key
+        old = AGG_CACHE.get(key)
+        if old is None:
+            continue
+        if how == "mean":
+            total = AGG_CACHE.get((new_key, by, value, "sum"))
+            count = AGG_CACHE.get((new_key, by, value, "count"))
+            if total is None or count is None:
+                continue
+            merged = _mean(total, count, value)
+        else:
+            # Group columns take the appended frame's dtypes (e.g. the widened
+            # category list) so the merged groups sort as a fresh groupby would.
+            old = old.astype({c: rows[c].dtype for c in by})
+            both = pd.concat([old, _aggregate(rows, list(by), value, how)], ignore_index=True)
+            label = aggregate_label(value, how)
+            summed = both.groupby(list(by), observed=True, sort=True)[label].sum()
+            merged = summed.index.to_frame(index=False)
+            merged[label] = summed.to_numpy()
+        AGG_CACHE.put((new_key, by, value, how), merged)
+        carried += 1
+    return carried
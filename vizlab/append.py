@@ -0,0 +1,82 @@
+"""Appending new rows to a loaded dataset without re-ingesting it.
+
+Only the uploaded rows are parsed. They are checked against the current
+frame's columns and converted to its dtypes (``ingest.append_frame``), then
+the combined frame is stored under a key derived from the old key and the
+new upload. Derived results cached for the old key are carried over by
+folding in the new rows only:
+
+* the dataset profile (counts, moments, ordering, distinct counts and the
+  ``describe`` table);
+* the Pearson correlation sums;
+* histogram, 2D-histogram and category counts;
+* grouped sums, counts and means.
+
+Anything that cannot be extended exactly, such as a histogram whose edges
+the new rows move, is left to be recomputed on first use.
+"""
+
+from vizlab import aggregate, correlation, profile
+from vizlab.ingest import DATASET_STORE, append_frame, content_hash, file_kind, frame_nbytes, read_frame
+
+
+def appended_key(dataset_key, rows_key):
+    return content_hash(f"{dataset_key}+{rows_key}".encode())
+
+
+def carry_caches(dataset_key, new_key, df, start):
+    """Extend every cache entry of ``dataset_key`` to ``new_key``, whose frame
+    ``df`` is that dataset with rows appended from position ``start``.
+
+    Returns ``{cache: entries carried}``.
+    """
+    rows = df.iloc[start:]
+    carried = {
+        "profile": int(profile.append_rows(dataset_key, new_key, df, start)),
+        "correlation": int(correlation.append_rows(dataset_key, new_key, rows)),
+        "aggregates": aggregate.append_rows(dataset_key, new_key, rows),
+    }
+    # Binning imports Plotly; only a page that drew a histogram has bins cached.
+    from vizlab import binning
+
+    carried["bins"] = binning.append_rows(dataset_key, new_key, rows)
+    return carried
+
+
+def append_dataset(current, uploaded_file, store=DATASET_STORE):
+    """Handle on ``current``'s dataset with the rows of ``uploaded_file`` appended.
+
+    Returns ``current`` itself when that file was already appended to it.
+    The new handle's report records the upload it grew from (``base``), the
+    appended uploads and the cache entries carried over. Raises
+    :class:`~vizlab.ingest.SchemaError` when the rows do not fit the dataset.
+    """
+    data = uploaded_file.getvalue()
+    rows_key = content_hash(data)
+    appended = current.report.get("appended", [])
+    if rows_key in appended:
+        return current
+    rows = read_frame(data, file_kind(getattr(uploaded_file, "name", "")))
+    old = current.df
+    df = append_frame(old, rows)
+    key = appended_key(current.key, rows_key)
+    carried = carry_caches(current.key, key, df, len(old))
+    report = {
+        "before": current.report["before"] + frame_nbytes(rows),
+        "after": frame_nbytes(df),
+        "changes": current.report["changes"],
+        "source": "append",
+        "base": current.report.get("base", current.key),
+        "appended": appended + [rows_key],
+        "rows_appended": len(rows),
+        "carried": carried,
+    }
+    return store.acquire(key, lambda: (df, report))
+
+
+def append_summary(report):
+    """One-line report of the appends behind a dataset, for the UI."""
+    carried = report.get("carried", {})
+    kept = ", ".join(f"{n} {name}" for name, n in carried.items() if n)
+    line = f"{len(report['appended'])} file(s) appended; the last added {report['rows_appended']:,} rows"
+    return line + (f" · carried over: {kept}" if kept else "")
@@ -0,0 +1,131 @@
+"""Render a list of chart specs to disk without the Streamlit UI.
+
+Usage::
+
+    python -m vizlab.batch DATASET SPECS [-o OUTPUT_DIR] [-j WORKERS]
+
+``DATASET`` is a CSV, Parquet or Feather file. ``SPECS`` is a JSON or YAML
+file holding a list of chart specs (see ``vizlab.charts``), or a mapping
+with that list under ``charts``. A spec may set ``output`` to choose its
+file name.
+
+The dataset is parsed once (or read back from its snapshot) and published to
+the render pool's shared memory. Charts are then built in parallel worker
+processes. Each worker keeps its bin, aggregate and correlation caches
+across the charts it renders.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import as_completed
+from pathlib import Path
+
+from vizlab import render_pool
+from vizlab.charts import output_name, render_to_file
+from vizlab.ingest import load_path
+
+
+def read_specs(path):
+    """Chart specs from a ``.json``, ``.yaml`` or ``.yml`` file."""
+    text = Path(path).read_text()
+    if Path(path).suffix.lower() in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError:
+            raise RuntimeError("YAML spec files need PyYAML: pip install pyyaml") from None
+        specs = yaml.safe_load(text)
+    else:
+        specs = json.loads(text)
+    if isinstance(specs, dict):
+        specs = specs.get("charts", [])
+    if not isinstance(specs, list) or not all(isinstance(s, dict) for s in specs):
+        raise ValueError("The spec file must hold a list of chart specs.")
+    return specs
+
+
+def render_batch(df, specs, out_dir, dataset_key=None, on_done=None):
+    """Render every spec into ``out_dir``; returns ``[(spec, path, error)]`` in
+    spec order, with ``error`` set to the exception for charts that failed.
+
+    Work goes to the render pool when it has workers and the dataset has a key,
+    and runs inline otherwise. ``on_done(spec, path, error)`` is called as each
+    chart finishes.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    jobs = []
+    for i, spec in enumerate(specs):
+        path = str(out_dir / spec.get("output", output_name(i, spec)))
+        jobs.append((spec, path))
+
+    results = [None] * len(jobs)
+
+    def finish(i, error):
+        spec, path = jobs[i]
+        results[i] = (spec, path, error)
+        if on_done is not None:
+            on_done(spec, path, error)
+
+    if render_pool.MAX_WORKERS > 0 and dataset_key is not None:
+        futures = {}
+        for i, (spec, path) in enumerate(jobs):
+            try:
+                future = render_pool.submit(
+                    render_to_file, df, dataset_key, (spec, path), {"dataset_key": dataset_key}
+                )
+            except Exception as e:
+                finish(i, e)
+            else:
+                futures[future] = i
+        for future in as_completed(futures):
+            finish(futures[future], future.exception())
+    else:
+        for i, (spec, path) in enumerate(jobs):
+            try:
+                render_to_file(df, spec, path, dataset_key=dataset_key)
+            except Exception as e:
+                finish(i, e)
+            else:
+                finish(i, None)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m vizlab.batch", description=__doc__.split("\n\n")[0])
+    parser.add_argument("dataset", help="CSV, Parquet or Feather file")
+    parser.add_argument("specs", help="JSON or YAML file with a list of chart specs")
+    parser.add_argument("-o", "--output", default="charts", help="output directory (default: charts)")
+    parser.add_argument(
+        "-j", "--workers", type=int, default=None,
+        help=f"worker processes (default: {render_pool.MAX_WORKERS}; 0 renders inline)",
+    )
+    args = parser.parse_args(argv)
+    if args.workers is not None:
+        render_pool.MAX_WORKERS = args.workers
+
+    started = time.monotonic()
+    specs = read_specs(args.specs)
+    handle = load_path(args.dataset)
+    df = handle.df
+    print(f"Loaded {args.dataset}: {len(df):,} rows x {df.shape[1]} columns", file=sys.stderr)
+
+    def report(spec, path, error):
+        status = "ok  " if error is None else "FAIL"
+        detail = os.path.basename(path) if error is None else f"{spec.get('chart')}: {error}"
+        print(f"{status} {detail}", file=sys.stderr)
+
+    results = render_batch(df, specs, args.output, dataset_key=handle.key, on_done=report)
+    failed = sum(error is not None for _, _, error in results)
+    print(
+        f"Rendered {len(results) - failed} of {len(results)} charts to {args.output} "
+        f"in {time.monotonic() - started:.1f} s",
+        file=sys.stderr,
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
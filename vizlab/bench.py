@@ -0,0 +1,296 @@
+"""Headless benchmarks for loading, profiling and every chart the app draws.
+
+Usage::
+
+    python -m vizlab.bench [--sizes 10k,1M,10M] [-o results.json] [--baseline old.json]
+    python -m vizlab.bench --compare results.json --baseline old.json
+
+Datasets shaped like ``Data/diamonds dataset.csv`` are synthesized at each
+size by resampling its rows with a little noise. They are written to CSV
+once and reused. For each size the suite times a cold CSV load, a load from
+the snapshot, profiling, and every chart in ``vizlab.charts.CHART_PARAMS``.
+Plotly charts are timed as build, JSON serialization (with its size) and,
+with kaleido installed, PNG export. Matplotlib and Seaborn charts are timed
+as the render to PNG. Caches are bypassed so every chart pays its full cost.
+
+Peak allocation per stage comes from ``tracemalloc``, which adds overhead to
+pure-Python code. ``--no-memory`` turns it off for cleaner timings; runs are
+only comparable with the same setting.
+"""
+
+import argparse
+import gc
+import importlib.util
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+import pandas as pd
+
+from vizlab import snapshot
+from vizlab.charts import CHART_PARAMS, render
+from vizlab.ingest import content_hash, load_path
+from vizlab.instrument import RerunMetrics
+from vizlab.profile import get_profile
+from vizlab.store import DatasetStore
+
+SOURCE = Path("Data/diamonds dataset.csv")
+BENCH_DIR = snapshot.SNAPSHOT_DIR.parent / "bench"
+DEFAULT_SIZES = "10k,1M,10M"
+# Rows synthesized per chunk, which bounds memory while writing large CSVs.
+CHUNK_ROWS = 1_000_000
+# A slowdown is only reported when it exceeds both the relative threshold
+# and this many seconds, so tiny stages do not flag on noise.
+NOISE_SECONDS = 0.01
+
+# Parameters for each chart over the diamonds columns, by library and chart.
+CHART_ARGS = {
+    "plotly": {
+        "Line": {"x": "carat", "y": "price"},
+        "Area": {"x": "carat", "y": "price"},
+        "Bar": {"x": "cut", "y": "price"},
+        "Scatter": {"x": "carat", "y": "price"},
+        "Bubble": {"x": "carat", "y": "price", "size": "depth"},
+        "Histogram": {"x": "price"},
+        "Box": {"x": "cut", "y": "price"},
+        "Violin": {"x": "cut", "y": "price"},
+        "Strip": {"x": "cut", "y": "price"},
+        "Density Contour": {"x": "carat", "y": "price"},
+        "Density Heatmap": {"x": "carat", "y": "price"},
+        "Heatmap": {},
+        "Scatter Matrix": {"columns": ["carat", "depth", "table", "price"]},
+        "Parallel Coordinates": {"color": "price"},
+        "Pie": {"names": "cut", "values": "price"},
+        "Funnel": {"names": "cut", "values": "price"},
+        "Tree Map": {"path": ["cut", "color"], "values": "price"},
+        "Sunburst": {"path": ["cut", "color"], "values": "price"},
+        "Scatter Map": {"lat": "x", "lon": "y"},
+        "Choropleth Map": {"location": "cut", "value": "price"},
+        "3D Scatter": {"x": "x", "y": "y", "z": "z"},
+        "Facet Scatter": {"x": "carat", "y": "price", "color": "color", "facet": "cut"},
+        "Candlestick": {"x": "carat", "open": "x", "high": "y", "low": "z", "close": "depth"},
+        "Waterfall": {"x": "cut", "y": "price"},
+    },
+    "matplotlib": {
+        "Line": {"x": "carat", "y": "price"},
+        "Bar": {"x": "cut", "y": "price"},
+        "Histogram": {"x": "price"},
+        "Scatter": {"x": "carat", "y": "price"},
+        "Pie": {"x": "cut", "y": "price"},
+    },
+    "seaborn": {
+        "Count Plot": {"x": "cut"},
+        "Box Plot": {"x": "cut", "y": "price"},
+        "Violin Plot": {"x": "cut", "y": "price"},
+        "Pair Plot": {"columns": ["carat", "depth", "table", "price"]},
+        "Correlation Heatmap": {"columns": ["carat", "depth", "table", "price", "x", "y", "z"]},
+    },
+}
+
+
+def parse_rows(text):
+    """``"10k"`` -> 10000, ``"1M"`` -> 1000000."""
+    text = text.strip()
+    scale = {"k": 10 ** 3, "m": 10 ** 6}.get(text[-1:].lower(), 1)
+    return int(float(text[:-1] if scale > 1 else text) * scale)
+
+
+def synthesize(n_rows, path, source=SOURCE, seed=0):
+    """Write ``n_rows`` diamonds-like rows to ``path`` as CSV.
+
+    Rows are drawn with replacement from ``source``. Numeric values get up
+    to 1% multiplicative noise and are rounded back to the source's
+    precision, so values stay realistic without being exact duplicates.
+    """
+    base = pd.read_csv(source)
+    numeric = base.select_dtypes(include="number").columns
+    decimals = {
+        c: int(base[c].astype(str).str.partition(".")[2].str.len().max()) for c in numeric
+    }
+    rng = np.random.default_rng(seed)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w", newline="") as f:
+        for start in range(0, n_rows, CHUNK_ROWS):
+            n = min(CHUNK_ROWS, n_rows - start)
+            chunk = base.iloc[rng.integers(0, len(base), n)].reset_index(drop=True)
+            for c in numeric:
+                noisy = chunk[c].to_numpy(dtype="float64") * rng.uniform(0.99, 1.01, n)
+                chunk[c] = noisy.round(decimals[c]) if decimals[c] else noisy.round().astype("int64")
+            chunk.to_csv(f, index=False, header=start == 0)
+    tmp.replace(path)
+    return path
+
+
+def dataset_path(n_rows, directory=BENCH_DIR):
+    """The synthesized CSV for ``n_rows``, generated on first use."""
+    path = Path(directory) / f"diamonds_{n_rows}.csv"
+    if not path.exists():
+        synthesize(n_rows, path)
+    return path
+
+
+def _stage(metrics, results, n_rows, name, fn):
+    """Run ``fn(stage)`` as stage ``name`` and append its result entry."""
+    gc.collect()
+    entry = {"rows": n_rows, "stage": name}
+    try:
+        with metrics.stage(name) as stage:
+            value = fn(stage)
+    except Exception as e:
+        entry["error"] = f"{type(e).__name__}: {e}"
+        value = None
+    entry.update(seconds=stage.seconds, peak_bytes=stage.peak_bytes, payload_bytes=stage.payload_bytes)
+    results.append(entry)
+    return value
+
+
+def run_size(n_rows, charts=None, memory=True, on_result=None):
+    """Benchmark one dataset size; returns a list of result entries.
+
+    ``charts`` limits the charts to names like ``"plotly/Bar"``.
+    ``on_result(entry)`` is called after each stage.
+    """
+    path = dataset_path(n_rows)
+    results = []
+    metrics = RerunMetrics(detailed=memory)
+
+    def run(name, fn):
+        value = _stage(metrics, results, n_rows, name, fn)
+        if on_result is not None:
+            on_result(results[-1])
+        return value
+
+    snapshot.remove_snapshot(content_hash(path.read_bytes()))
+    handle = run("load csv", lambda stage: load_path(path, store=DatasetStore()))
+    if handle is None:
+        return results
+    handle.release()
+    handle = run("load snapshot", lambda stage: load_path(path, store=DatasetStore()))
+    if handle is None:
+        return results
+    df = handle.df
+    run("profile", lambda stage: get_profile(df))
+
+    kaleido = importlib.util.find_spec("kaleido") is not None
+    for library, chart_args in CHART_ARGS.items():
+        for chart in CHART_PARAMS[library]:
+            name = f"{library}/{chart}"
+            if charts and name not in charts:
+                continue
+            spec = dict(chart_args.get(chart, {}), library=library, chart=chart)
+            if library != "plotly":
+                run(f"render {name}", lambda stage: stage.add_payload(len(render(df, spec))))
+                continue
+            fig = run(f"build {name}", lambda stage: render(df, spec))
+            if fig is None:
+                continue
+            run(f"serialize {name}", lambda stage, fig=fig: stage.add_payload(len(fig.to_json())))
+            if kaleido:
+                run(f"export png {name}", lambda stage, fig=fig: stage.add_payload(len(fig.to_image(format="png"))))
+    handle.release()
+    return results
+
+
+def environment():
+    versions = {}
+    for package in ("pandas", "numpy", "plotly", "matplotlib", "seaborn", "pyarrow"):
+        try:
+            versions[package] = __import__(package).__version__
+        except ImportError:
+            versions[package] = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "packages": versions,
+    }
+
+
+def compare(current, baseline, threshold=0.2):
+    """Rows of ``(rows, stage, base_s, current_s, change, regressed)`` for the
+    stages both runs timed, slowest regressions first."""
+    base = {(e["rows"], e["stage"]): e for e in baseline["results"] if e.get("seconds") is not None}
+    rows = []
+    for entry in current["results"]:
+        old = base.get((entry["rows"], entry["stage"]))
+        if old is None or entry.get("seconds") is None or "error" in entry:
+            continue
+        before, after = old["seconds"], entry["seconds"]
+        change = after / before - 1 if before > 0 else 0.0
+        regressed = change > threshold and after - before > NOISE_SECONDS
+        rows.append((entry["rows"], entry["stage"], before, after, change, regressed))
+    rows.sort(key=lambda r: (not r[5], -r[4]))
+    return rows
+
+
+def print_comparison(rows, current, baseline, out=sys.stdout):
+    if current.get("memory") != baseline.get("memory"):
+        print("warning: only one of the runs tracked memory, so timings are not like for like", file=out)
+    if current.get("environment") != baseline.get("environment"):
+        print("warning: the runs used different environments", file=out)
+    print(f"{'rows':>10}  {'stage':<40} {'baseline':>9} {'current':>9} {'change':>8}", file=out)
+    for n_rows, stage, before, after, change, regressed in rows:
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{n_rows:>10,}  {stage:<40} {before:>8.3f}s {after:>8.3f}s {change:>+7.0%}{flag}", file=out)
+    regressions = sum(r[5] for r in rows)
+    print(f"{regressions} regression(s) in {len(rows)} compared stages", file=out)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m vizlab.bench", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help=f"comma-separated row counts (default: {DEFAULT_SIZES})")
+    parser.add_argument("--charts", help="comma-separated charts to run, e.g. plotly/Bar,seaborn/Pair Plot")
+    parser.add_argument("-o", "--output", default="bench_results.json", help="results file (default: bench_results.json)")
+    parser.add_argument("--baseline", help="results file to compare against")
+    parser.add_argument("--compare", metavar="RESULTS", help="compare an existing results file instead of running")
+    parser.add_argument("--threshold", type=float, default=0.2, help="slowdown reported as a regression (default: 0.2)")
+    parser.add_argument("--no-memory", action="store_true", help="do not track peak allocation")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        if not args.baseline:
+            parser.error("--compare needs --baseline")
+        current = json.loads(Path(args.compare).read_text())
+    else:
+        charts = set(args.charts.split(",")) if args.charts else None
+        current = {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "environment": environment(),
+            "memory": not args.no_memory,
+            "results": [],
+        }
+
+        def report(entry):
+            detail = entry.get("error") or f"{entry['seconds']:.3f} s"
+            if entry.get("peak_bytes") is not None:
+                detail += f", peak {entry['peak_bytes'] / 1024 ** 2:.1f} MB"
+            if entry.get("payload_bytes") is not None:
+                detail += f", {entry['payload_bytes'] / 1024:.0f} KB"
+            print(f"{entry['rows']:>10,}  {entry['stage']:<40} {detail}", file=sys.stderr)
+
+        for size in args.sizes.split(","):
+            n_rows = parse_rows(size)
+            print(f"Preparing {n_rows:,} rows", file=sys.stderr)
+            current["results"].extend(run_size(n_rows, charts, not args.no_memory, report))
+        Path(args.output).write_text(json.dumps(current, indent=1))
+        print(f"Wrote {len(current['results'])} results to {args.output}", file=sys.stderr)
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        return 1 if print_comparison(compare(current, baseline, args.threshold), current, baseline) else 0
+    failed = sum("error" in e for e in current["results"])
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+"""Vectorized server-side binning with a shared cache.
+
+Histogram and 2D-histogram counts are computed once with NumPy per
+(dataset, column(s), bins, range) and reused by every library, so the
+figures carry one value per bin instead of one per row. Counts are additive,
+so appended rows only need binning themselves (see :func:`append_rows`).
+"""
+
+import numpy as np
+import plotly.graph_objects as go
+
+from vizlab.cache import LRUCache
+
+BIN_CACHE = LRUCache(max_entries=256, max_bytes=64 * 1024 ** 2, sizeof=lambda v: sum(a.nbytes for a in v))
+
+
+def values_of(df, col):
+    """Column as a float64 array with missing values as NaN."""
+    return df[col].to_numpy(dtype="float64", na_value=np.nan)
+
+
+def edges_for(values, bins, range=None):
+    """Equal-width bin edges over ``range`` or the finite extent of ``values``."""
+    if range is None:
+        finite = values[np.isfinite(values)]
+        if finite.size == 0:
+            range = (0.0, 1.0)
+        else:
+            range = (float(finite.min()), float(finite.max()))
+    lo, hi = range
+    if lo == hi:
+        lo, hi = lo - 0.5, hi + 0.5
+    return np.linspace(lo, hi, int(bins) + 1)
+
+
+def centers(edges):
+    return (edges[:-1] + edges[1:]) / 2
+
+
+def _cached(key, compute):
+    if key is None:
+        return compute()
+    return BIN_CACHE.get_or_compute(key, compute)
+
+
+def histogram(df, col, bins=20, range=None, dataset_key=None):
+    """``(counts, edges)`` of one numeric column."""
+    def compute():
+        values = values_of(df, col)
+        edges = edges_for(values, bins, range)
+        counts, _ = np.histogram(values[np.isfinite(values)], bins=edges)
+        return counts, edges
+
+    key = None if dataset_key is None else ("hist", dataset_key, col, bins, range)
+    return _cached(key, compute)
+
+
+def histogram2d(df, x, y, bins=50, range=None, dataset_key=None):
+    """``(counts, x_edges, y_edges)``; ``counts`` is indexed ``[y_bin, x_bin]``."""
+    def compute():
+        xs, ys = values_of(df, x), values_of(df, y)
+        x_edges = edges_for(xs, bins, range and range[0])
+        y_edges = edges_for(ys, bins, range and range[1])
+        keep = np.isfinite(xs) & np.isfinite(ys)
+        counts, _, _ = np.histogram2d(xs[keep], ys[keep], bins=[x_edges, y_edges])
+        return counts.T, x_edges, y_edges
+
+    key = None if dataset_key is None else ("hist2d", dataset_key, x, y, bins, range)
+    return _cached(key, compute)
+
+
+def category_counts(df, col, dataset_key=None):
+    """``(labels, counts)`` of a categorical column, in category order for
+    ``category`` columns and first-appearance order otherwise (as Seaborn does)."""
+    def compute():
+        counts = df[col].value_counts(sort=False, dropna=True)
+        return counts.index.to_numpy(dtype=object), counts.to_numpy()
+
+    key = None if dataset_key is None else ("counts", dataset_key, col)
+    return _cached(key, compute)
+
+
+# ------------------ APPENDED ROWS ------------------
+
+def _fits(values, edges, fixed):
+    """True when binning the combined data would give the same ``edges``.
+
+    Edges derived from the data only stay put while new values fall inside
+    them. A width of exactly one may be the padding around a constant
+    column, which any new value would change.
+    """
+    values = values[np.isfinite(values)]
+    if fixed or values.size == 0:
+        return True
+    return edges[-1] - edges[0] != 1.0 and values.min() >= edges[0] and values.max() <= edges[-1]
+
+
+def _extend(key, value, rows):
+    kind = key[0]
+    if kind == "hist":
+        _, _, col, bins, range = key
+        counts, edges = value
+        values = values_of(rows, col)
+        if not _fits(values, edges, range is not None):
+            return None
+        extra, _ = np.histogram(values[np.isfinite(values)], bins=edges)
+        return counts + extra, edges
+    if kind == "hist2d":
+        _, _, x, y, bins, range = key
+        counts, x_edges, y_edges = value
+        xs, ys = values_of(rows, x), values_of(rows, y)
+        keep = np.isfinite(xs) & np.isfinite(ys)
+        if not (_fits(xs, x_edges, range is not None) and _fits(ys, y_edges, range is not None)):
+            return None
+        extra, _, _ = np.histogram2d(xs[keep], ys[keep], bins=[x_edges, y_edges])
+        return counts + extra.T, x_edges, y_edges
+    if kind == "counts":
+        labels, counts = value
+        extra = rows[key[2]].value_counts(sort=False, dropna=True)
+        merged = dict(zip(labels, counts))
+        for label, count in extra.items():
+            merged[label] = merged.get(label, 0) + count
+        return np.array(list(merged), dtype=object), np.array(list(merged.values()))
+    return None
+
+
+def append_rows(dataset_key, new_key, rows):
+    """Carry the cached bins of ``dataset_key`` over to ``new_key``, the same
+    dataset with ``rows`` appended, by binning the new rows only.
+
+    Histograms whose data-derived edges the new rows would move are left to
+    be recomputed. Returns the number of entries carried over.
+    """
+    carried = 0
+    for key in BIN_CACHE.keys():
+        if key[1] != dataset_key:
+            continue
+        value = BIN_CACHE.get(key)
+        if value is None:
+            continue
+        value = _extend(key, value, rows)
+        if value is not None:
+            BIN_CACHE.put((key[0], new_key) + key[2:], value)
+            carried += 1
+    return carried
+
+
+# ------------------ PLOTLY TRACES ------------------
+
+def histogram_figure(counts, edges, x):
+    fig = go.Figure(go.Bar(x=centers(edges), y=counts, width=np.diff(edges), marker_line_width=0))
+    fig.update_layout(xaxis_title=x, yaxis_title="count", bargap=0)
+    return fig
+
+
+def heatmap_figure(counts, x_edges, y_edges, x, y, mask_empty=False):
+    if mask_empty:
+        # Empty cells stay transparent instead of drawing the lowest colour.
+        counts = np.where(counts == 0, np.nan, counts)
+    fig = go.Figure(go.Heatmap(
+        x=centers(x_edges), y=centers(y_edges), z=counts,
+        colorscale="Viridis", colorbar=dict(title="count"),
+    ))
+    fig.update_layout(xaxis_title=x, yaxis_title=y)
+    return fig
+
+
+def contour_figure(counts, x_edges, y_edges, x, y):
+    fig = go.Figure(go.Contour(
+        x=centers(x_edges), y=centers(y_edges), z=counts,
+        contours_coloring="lines", colorscale="Viridis", showscale=False,
+    ))
+    fig.update_layout(xaxis_title=x, yaxis_title=y)
+    return fig
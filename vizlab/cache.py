@@ -0,0 +1,118 @@
+"""Small thread-safe LRU cache shared by every Streamlit session in the process."""
+
+import sys
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """Bounded least-recently-used cache with hit/miss/byte accounting.
+
+    Entries are evicted oldest-first once either ``max_entries`` or
+    ``max_bytes`` is exceeded. ``sizeof`` is called once per insert to
+    measure a value; it defaults to ``sys.getsizeof``. ``on_evict`` is called
+    with each value pushed out by the limits. Values for which ``pinned``
+    returns true are skipped by eviction, so the cache can stay over its
+    limits until they are unpinned and :meth:`trim` is called.
+    """
+
+    def __init__(self, max_entries=16, max_bytes=None, sizeof=None, on_evict=None, pinned=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof or sys.getsizeof
+        self._on_evict = on_evict
+        self._pinned = pinned
+        self._data = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.nbytes = 0
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._data
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
+
+    def keys(self):
+        """Snapshot of the cached keys, oldest first."""
+        with self._lock:
+            return list(self._data)
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key][0]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        size = self._sizeof(value)
+        with self._lock:
+            if key in self._data:
+                self.nbytes -= self._data.pop(key)[1]
+            self._data[key] = (value, size)
+            self.nbytes += size
+            self._evict()
+
+    def get_or_compute(self, key, compute):
+        """Return the cached value for ``key``, calling ``compute()`` on a miss."""
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key][0]
+            self.misses += 1
+        # Compute outside the lock so a slow parse does not block other sessions.
+        value = compute()
+        self.put(key, value)
+        return value
+
+    def pop(self, key, default=None):
+        with self._lock:
+            if key not in self._data:
+                return default
+            value, size = self._data.pop(key)
+            self.nbytes -= size
+            return value
+
+    def trim(self):
+        """Evict down to the limits, e.g. after values were unpinned."""
+        with self._lock:
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.nbytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._data),
+                "bytes": self.nbytes,
+            }
+
+    def _evict(self):
+        while self._data and (
+            len(self._data) > self.max_entries
+            or (self.max_bytes is not None and self.nbytes > self.max_bytes and len(self._data) > 1)
+        ):
+            key = next(
+                (k for k, (v, _) in self._data.items() if self._pinned is None or not self._pinned(v)), None
+            )
+            if key is None:
+                return
+            value, size = self._data.pop(key)
+            self.nbytes -= size
+            self.evictions += 1
+            if self._on_evict is not None:
+                self._on_evict(value)
@@ -0,0 +1,102 @@
+"""Top-N category collapsing for charts that draw one group per category.
+
+A categorical column is factorized once. Its row counts (or value sums) come
+from a single ``np.bincount`` over the codes, the ``n`` largest categories
+are kept and every other row is relabelled ``"Other"``. The result is a
+``category`` column with at most ``n + 1`` values, so box, violin, strip,
+count, bar and pie charts stay bounded whatever the cardinality.
+"""
+
+import numpy as np
+import pandas as pd
+
+from vizlab.cache import LRUCache
+
+OTHER = "Other"
+DEFAULT_TOP_N = 20
+RANKINGS = ["count", "value"]
+
+# Collapsed columns are one small integer code per row.
+CATEGORY_CACHE = LRUCache(
+    max_entries=32, max_bytes=256 * 1024 ** 2, sizeof=lambda c: 0 if c is None else c.codes.nbytes
+)
+
+
+def category_codes(col):
+    """``(codes, categories)`` with -1 for missing values."""
+    if isinstance(col.dtype, pd.CategoricalDtype):
+        return col.cat.codes.to_numpy(), col.cat.categories
+    return pd.factorize(col, use_na_sentinel=True)
+
+
+def other_label(kept):
+    """``"Other"``, padded with trailing spaces until it matches none of ``kept``.
+
+    Labels are compared as strings, as the charts display them.
+    """
+    taken = {str(label) for label in kept}
+    label = OTHER
+    while label in taken:
+        label += " "
+    return label
+
+
+def _top(col, n, by, values):
+    codes, categories = category_codes(col)
+    present = codes >= 0
+    totals = np.bincount(codes[present], minlength=len(categories))
+    if np.count_nonzero(totals) <= n:
+        return None
+    if by == "value":
+        weights = pd.to_numeric(values, errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+        totals = np.bincount(codes[present], weights=np.nan_to_num(weights[present]), minlength=len(categories))
+    order = np.argsort(-totals, kind="stable")[:n]
+    if isinstance(col.dtype, pd.CategoricalDtype):
+        # Keep the column's own category order (e.g. ordinal grades).
+        order = np.sort(order)
+    kept = categories[order]
+    label = other_label(kept)
+    lookup = np.full(len(categories), len(order), dtype="int64")
+    lookup[order] = np.arange(len(order))
+    new_codes = np.where(present, lookup[np.where(present, codes, 0)], -1)
+    return pd.Categorical.from_codes(new_codes, categories=list(kept) + [label])
+
+
+def collapse(df, col, n=DEFAULT_TOP_N, by="count", value=None, dataset_key=None):
+    """``df`` with all but the top ``n`` categories of ``col`` folded into "Other".
+
+    Categories are ranked by row count, or with ``by="value"`` by the sum of
+    column ``value``. ``n`` of 0 (or a column with at most ``n`` categories)
+    returns ``df`` unchanged. Collapsed columns are memoized under
+    ``dataset_key`` when one is given.
+    """
+    if by not in RANKINGS:
+        raise ValueError(f"Unknown category ranking: {by}")
+    if not n:
+        return df
+    values = df[value] if by == "value" else None
+
+    def compute():
+        return _top(df[col], n, by, values)
+
+    if dataset_key is None:
+        collapsed = compute()
+    else:
+        key = (dataset_key, col, n, by, value if by == "value" else None)
+        collapsed = CATEGORY_CACHE.get_or_compute(key, compute)
+    if collapsed is None:
+        return df
+    return df.assign(**{col: pd.Series(collapsed, index=df.index, name=col)})
+
+
+def collapse_counts(labels, counts, n=DEFAULT_TOP_N):
+    """Already-counted ``(labels, counts)`` cut to the top ``n`` plus "Other"."""
+    if not n or len(labels) <= n:
+        return labels, counts
+    order = np.sort(np.argsort(-np.asarray(counts), kind="stable")[:n])
+    rest = np.ones(len(labels), dtype=bool)
+    rest[order] = False
+    kept = np.asarray(labels, dtype=object)[order]
+    labels = np.append(kept, other_label(kept))
+    counts = np.append(np.asarray(counts)[order], np.asarray(counts)[rest].sum())
+    return labels, counts
@@ -0,0 +1,149 @@
+"""Chart-spec API: build any VizLab chart from a plain dict.
+
+A spec names the ``library`` (``"plotly"``, ``"matplotlib"`` or
+``"seaborn"``; Plotly by default), the ``chart`` type, and that chart's
+parameters by name. For example::
+
+    {"chart": "Bar", "x": "cut", "y": "price", "agg": "mean"}
+    {"library": "seaborn", "chart": "Violin Plot", "x": "cut", "y": "price"}
+
+``CHART_PARAMS`` lists each chart's parameters in the order the app pages
+collect them. Parameters with a default may be left out. Matplotlib and
+Seaborn specs also take ``width`` and ``height`` in inches.
+"""
+
+import os
+
+from vizlab.categories import DEFAULT_TOP_N
+from vizlab.downsample import DEFAULT_WIDTH, candle_count
+from vizlab.largedata import DENSITY_THRESHOLD, SCATTER_CHARTS, WEBGL_THRESHOLD, chart_mode
+from vizlab.pairgrid import DEFAULT_PANEL_ROWS
+from vizlab.plotly_charts import build_plotly
+from vizlab.static_charts import render_static
+
+LIBRARIES = ["plotly", "matplotlib", "seaborn"]
+REQUIRED = object()
+
+CHART_PARAMS = {
+    "plotly": {
+        "Line": [("x", REQUIRED), ("y", REQUIRED), ("method", "Min/Max"), ("chart_width", DEFAULT_WIDTH)],
+        "Area": [("x", REQUIRED), ("y", REQUIRED), ("method", "Min/Max"), ("chart_width", DEFAULT_WIDTH)],
+        "Bar": [("x", REQUIRED), ("y", REQUIRED), ("agg", "sum")],
+        "Scatter": [("x", REQUIRED), ("y", REQUIRED)],
+        "Bubble": [("x", REQUIRED), ("y", REQUIRED), ("size", REQUIRED)],
+        "Histogram": [("x", REQUIRED), ("bins", 30)],
+        "Box": [("x", REQUIRED), ("y", REQUIRED), ("top_n", DEFAULT_TOP_N)],
+        "Violin": [("x", REQUIRED), ("y", REQUIRED), ("top_n", DEFAULT_TOP_N)],
+        "Strip": [("x", REQUIRED), ("y", REQUIRED), ("top_n", DEFAULT_TOP_N)],
+        "Density Contour": [("x", REQUIRED), ("y", REQUIRED), ("bins", 50)],
+        "Density Heatmap": [("x", REQUIRED), ("y", REQUIRED), ("bins", 50)],
+        "Heatmap": [("x", None), ("y", None), ("method", "pearson")],
+        "Scatter Matrix": [("columns", REQUIRED), ("panel_rows", DEFAULT_PANEL_ROWS)],
+        "Parallel Coordinates": [("color", REQUIRED)],
+        "Pie": [("names", REQUIRED), ("values", REQUIRED), ("agg", "sum")],
+        "Funnel": [("names", REQUIRED), ("values", REQUIRED), ("agg", "sum")],
+        "Tree Map": [("path", REQUIRED), ("values", REQUIRED), ("agg", "sum")],
+        "Sunburst": [("path", REQUIRED), ("values", REQUIRED), ("agg", "sum")],
+        "Scatter Map": [("lat", REQUIRED), ("lon", REQUIRED), ("color", "None")],
+        "Choropleth Map": [("location", REQUIRED), ("value", REQUIRED)],
+        "3D Scatter": [("x", REQUIRED), ("y", REQUIRED), ("z", REQUIRED)],
+        "Facet Scatter": [("x", REQUIRED), ("y", REQUIRED), ("color", REQUIRED), ("facet", REQUIRED)],
+        "Candlestick": [
+            ("x", REQUIRED), ("open", REQUIRED), ("high", REQUIRED), ("low", REQUIRED),
+            ("close", REQUIRED), ("chart_width", DEFAULT_WIDTH),
+        ],
+        "Waterfall": [("x", REQUIRED), ("y", REQUIRED)],
+    },
+    "matplotlib": {
+        "Line": [("x", REQUIRED), ("y", REQUIRED)],
+        "Bar": [("x", REQUIRED), ("y", REQUIRED), ("top_n", DEFAULT_TOP_N)],
+        "Histogram": [("x", REQUIRED)],
+        "Scatter": [("x", REQUIRED), ("y", REQUIRED)],
+        "Pie": [("x", REQUIRED), ("y", REQUIRED), ("top_n", DEFAULT_TOP_N)],
+    },
+    "seaborn": {
+        "Count Plot": [("x", REQUIRED), ("top_n", DEFAULT_TOP_N)],
+        "Box Plot": [("x", REQUIRED), ("y", REQUIRED), ("top_n", DEFAULT_TOP_N)],
+        "Violin Plot": [("x", REQUIRED), ("y", REQUIRED), ("top_n", DEFAULT_TOP_N)],
+        "Pair Plot": [("columns", REQUIRED), ("panel_rows", DEFAULT_PANEL_ROWS)],
+        "Correlation Heatmap": [("columns", REQUIRED), ("method", "pearson")],
+    },
+}
+
+# Matches the default of the size sliders on the Matplotlib and Seaborn pages.
+STATIC_SIZE = (2, 3)
+
+
+def library_of(spec):
+    library = spec.get("library", "plotly").lower()
+    if library not in CHART_PARAMS:
+        raise ValueError(f"Unknown library {library!r}; expected one of {', '.join(LIBRARIES)}")
+    return library
+
+
+def spec_params(spec, df):
+    """The positional ``params`` tuple the builders expect for ``spec``."""
+    library = library_of(spec)
+    chart = spec.get("chart")
+    if chart not in CHART_PARAMS[library]:
+        raise ValueError(f"Unknown {library} chart {chart!r}")
+    params = []
+    for name, default in CHART_PARAMS[library][chart]:
+        value = spec.get(name, default)
+        if value is REQUIRED:
+            raise ValueError(f"{library} {chart} needs {name!r}")
+        params.append(tuple(value) if isinstance(value, list) else value)
+
+    if library == "plotly" and chart in SCATTER_CHARTS:
+        x = spec["x"]
+        mode = chart_mode(
+            chart, len(df), x in df.select_dtypes(include="number").columns,
+            spec.get("webgl_threshold", WEBGL_THRESHOLD),
+            spec.get("density_threshold", DENSITY_THRESHOLD),
+        )
+        params.extend(mode)
+    elif library == "plotly" and chart == "Candlestick":
+        params[-1] = candle_count(params[-1])
+    return tuple(params)
+
+
+def render(df, spec, dataset_key=None):
+    """Build ``spec`` over ``df``: a Plotly figure, or PNG bytes for Matplotlib/Seaborn."""
+    library = library_of(spec)
+    params = spec_params(spec, df)
+    if library == "plotly":
+        return build_plotly(df, spec["chart"], params, dataset_key)
+    width, height = spec.get("width", STATIC_SIZE[0]), spec.get("height", STATIC_SIZE[1])
+    return render_static(df, library, spec["chart"], params, width, height, dataset_key=dataset_key)
+
+
+def output_name(index, spec):
+    """Default file name of the ``index``-th chart of a batch."""
+    library = str(spec.get("library", "plotly")).lower()
+    ext = "html" if library == "plotly" else "png"
+    slug = str(spec.get("chart", "chart")).lower().replace(" ", "_")
+    return f"{index:03d}_{library}_{slug}.{ext}"
+
+
+def write_chart(result, path):
+    """Write a rendered chart. Plotly figures go to ``.html`` (sharing one
+    ``plotly.min.js`` per directory), ``.json`` or, with kaleido installed,
+    image formats; static charts are PNG bytes."""
+    ext = os.path.splitext(path)[1].lower()
+    if isinstance(result, bytes):
+        if ext != ".png":
+            raise ValueError(f"Matplotlib and Seaborn charts are written as .png, not {ext}")
+        with open(path, "wb") as f:
+            f.write(result)
+    elif ext == ".html":
+        result.write_html(path, include_plotlyjs="directory")
+    elif ext == ".json":
+        result.write_json(path)
+    else:
+        result.write_image(path)
+    return path
+
+
+def render_to_file(df, spec, path, dataset_key=None):
+    """:func:`render` followed by :func:`write_chart`; returns ``path``."""
+    return write_chart(render(df, spec, dataset_key), path)
@@ -0,0 +1,154 @@
+"""Correlation matrices computed once per dataset and sliced per chart.
+
+Pearson correlation is built from additive sums that a few matrix products
+(BLAS) gather in one pass over the data. Appending rows therefore only needs
+a pass over the new rows. Missing values are handled pairwise, as in
+``DataFrame.corr``. Spearman is Pearson over column ranks. Kendall runs on a
+uniform row sample, since its cost grows much faster than the row count.
+"""
+
+import numpy as np
+import pandas as pd
+
+from vizlab.cache import LRUCache
+
+METHODS = ["pearson", "spearman", "kendall"]
+KENDALL_SAMPLE = 20_000
+# Rows per matrix-product block, which bounds the temporary float64 copies.
+BLOCK_ROWS = 250_000
+
+CORR_CACHE = LRUCache(max_entries=32)
+
+
+class PearsonState:
+    """Pairwise-complete sums behind a Pearson matrix, able to absorb new rows.
+
+    For columns ``i`` and ``j``, ``n[i, j]`` counts the rows where both are
+    present. ``sx[i, j]`` and ``sxx[i, j]`` are the sum and sum of squares of
+    ``i`` over those rows, and ``sxy[i, j]`` is the sum of products. Values
+    are offset by a per-column ``shift`` (the first block's means) to keep
+    the sums well conditioned.
+    """
+
+    def __init__(self, columns, shift=None):
+        self.columns = list(columns)
+        p = len(self.columns)
+        self.shift = None if shift is None else np.asarray(shift, dtype="float64")
+        self.n = np.zeros((p, p))
+        self.sx = np.zeros((p, p))
+        self.sxx = np.zeros((p, p))
+        self.sxy = np.zeros((p, p))
+        self._matrix = None
+
+    def update(self, df):
+        """Fold the rows of ``df`` into the sums."""
+        for start in range(0, len(df), BLOCK_ROWS):
+            block = df.iloc[start:start + BLOCK_ROWS]
+            x = np.column_stack([
+                block[c].to_numpy(dtype="float64", na_value=np.nan) for c in self.columns
+            ]) if self.columns else np.empty((len(block), 0))
+            present = np.isfinite(x)
+            if self.shift is None:
+                counts = present.sum(axis=0)
+                sums = np.where(present, x, 0.0).sum(axis=0)
+                self.shift = np.divide(sums, counts, out=np.zeros_like(sums), where=counts > 0)
+            xc = np.where(present, x - self.shift, 0.0)
+            m = present.astype("float64")
+            self.n += m.T @ m
+            self.sx += xc.T @ m
+            self.sxx += (xc * xc).T @ m
+            self.sxy += xc.T @ xc
+        self._matrix = None
+        return self
+
+    def _shifted(self, shift):
+        """The same sums expressed relative to another ``shift``."""
+        d = self.shift - shift
+        out = PearsonState(self.columns, shift)
+        di, dj = d[:, None], d[None, :]
+        out.n = self.n.copy()
+        out.sx = self.sx + di * self.n
+        out.sxx = self.sxx + 2 * di * self.sx + di * di * self.n
+        out.sxy = self.sxy + dj * self.sx + di * self.sx.T + di * dj * self.n
+        return out
+
+    def merge(self, other):
+        """Sums over the rows of both states (which must cover disjoint rows)."""
+        if other.columns != self.columns:
+            raise ValueError("Cannot merge correlation states with different columns.")
+        if other.shift is None:
+            return self.copy()
+        if self.shift is None:
+            return other.copy()
+        other = other._shifted(self.shift)
+        out = PearsonState(self.columns, self.shift)
+        out.n = self.n + other.n
+        out.sx = self.sx + other.sx
+        out.sxx = self.sxx + other.sxx
+        out.sxy = self.sxy + other.sxy
+        return out
+
+    def copy(self):
+        out = PearsonState(self.columns, self.shift)
+        out.n, out.sx, out.sxx, out.sxy = self.n.copy(), self.sx.copy(), self.sxx.copy(), self.sxy.copy()
+        return out
+
+    def matrix(self):
+        """The Pearson correlation matrix as a DataFrame."""
+        if self._matrix is None:
+            n = self.n
+            with np.errstate(divide="ignore", invalid="ignore"):
+                cov = self.sxy - self.sx * self.sx.T / n
+                var = self.sxx - self.sx ** 2 / n
+                r = cov / np.sqrt(var * var.T)
+            r[(n < 2) | ~np.isfinite(r)] = np.nan
+            r = np.clip(r, -1.0, 1.0)
+            diagonal = np.diag_indices_from(r)
+            r[diagonal] = np.where(np.isnan(r[diagonal]), np.nan, 1.0)
+            self._matrix = pd.DataFrame(r, index=self.columns, columns=self.columns)
+        return self._matrix
+
+
+def _compute(df, cols, method):
+    if method == "pearson":
+        return PearsonState(cols).update(df)
+    if method == "spearman":
+        # Each column is ranked once over all its values, so with missing data
+        # this can differ slightly from DataFrame.corr's pairwise re-ranking.
+        return PearsonState(cols).update(df[cols].rank()).matrix()
+    if method == "kendall":
+        data = df[cols]
+        if len(data) > KENDALL_SAMPLE:
+            data = data.sample(n=KENDALL_SAMPLE, random_state=0)
+        return data.corr(method="kendall")
+    raise ValueError(f"Unknown correlation method: {method}")
+
+
+def correlation(df, cols=None, method="pearson", dataset_key=None):
+    """Correlation matrix of ``cols`` (default: every numeric column).
+
+    The full matrix over all numeric columns is computed once per dataset and
+    method; any subset is a slice of it.
+    """
+    numeric = df.select_dtypes(include="number").columns.tolist()
+    if dataset_key is None:
+        full = _compute(df, numeric, method)
+    else:
+        full = CORR_CACHE.get_or_compute((dataset_key, method), lambda: _compute(df, numeric, method))
+    if isinstance(full, PearsonState):
+        full = full.matrix()
+    cols = numeric if cols is None else list(cols)
+    return full.loc[cols, cols]
+
+
+def append_rows(dataset_key, new_key, rows):
+    """Carry the cached Pearson sums of ``dataset_key`` over to ``new_key``,
+    the same dataset with ``rows`` appended, by passing over the new rows only.
+
+    Returns False when there is nothing cached to extend.
+    """
+    state = CORR_CACHE.get((dataset_key, "pearson"))
+    if state is None:
+        return False
+    CORR_CACHE.put((new_key, "pearson"), state.copy().update(rows))
+    return True
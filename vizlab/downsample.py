@@ -0,0 +1,120 @@
+"""Shape-preserving downsampling for line-like charts.
+
+A chart only has so many horizontal pixels, so sending more points than a
+couple per pixel adds payload without adding detail. Both methods here keep
+the first and last point and every global extreme of the series.
+"""
+
+import numpy as np
+import pandas as pd
+
+METHODS = ["Min/Max", "LTTB", "None"]
+DEFAULT_WIDTH = 1200
+
+
+def target_points(width_px, per_pixel=2):
+    return max(int(width_px) * per_pixel, 10)
+
+
+def candle_count(width_px):
+    # Roughly five pixels per candle keeps bodies and wicks readable.
+    return max(int(width_px) // 5, 10)
+
+
+def _positions(col):
+    """Numeric x positions for a column: values, epoch nanoseconds or row order."""
+    if pd.api.types.is_numeric_dtype(col) and not pd.api.types.is_bool_dtype(col):
+        return col.to_numpy(dtype="float64", na_value=np.nan)
+    if pd.api.types.is_datetime64_any_dtype(col):
+        values = col.to_numpy(dtype="datetime64[ns]").astype("int64").astype("float64")
+        values[col.isna().to_numpy()] = np.nan
+        return values
+    return np.arange(len(col), dtype="float64")
+
+
+def _buckets(n, n_buckets):
+    return np.arange(n) * n_buckets // n
+
+
+def minmax_indices(y, n_out):
+    """Row positions of the min and max of ``y`` in each of ``n_out // 2`` buckets."""
+    valid = np.flatnonzero(~np.isnan(y))
+    if valid.size <= n_out:
+        return valid
+    series = pd.Series(y[valid])
+    groups = series.groupby(_buckets(valid.size, max(n_out // 2, 1)))
+    picked = np.union1d(groups.idxmin().to_numpy(), groups.idxmax().to_numpy())
+    picked = np.union1d(picked, [0, valid.size - 1])
+    return valid[picked]
+
+
+def lttb_indices(x, y, n_out):
+    """Largest-Triangle-Three-Buckets selection, plus the global min and max."""
+    valid = np.flatnonzero(~np.isnan(y) & ~np.isnan(x))
+    n = valid.size
+    if n <= n_out or n_out < 3:
+        return valid
+    xs, ys = x[valid], y[valid]
+    # Interior points are split into n_out - 2 buckets; first and last are fixed.
+    edges = (np.arange(n_out - 1) * (n - 2) // (n_out - 2)) + 1
+    edges = np.append(edges, n - 1)
+    out = np.empty(n_out, dtype=np.int64)
+    out[0], out[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nxt_lo, nxt_hi = edges[i + 1], edges[i + 2]
+        if nxt_hi <= nxt_lo:
+            # The last interior bucket looks ahead to the fixed final point.
+            nxt_lo, nxt_hi = n - 1, n
+        avg_x, avg_y = xs[nxt_lo:nxt_hi].mean(), ys[nxt_lo:nxt_hi].mean()
+        area = np.abs(
+            (xs[a] - avg_x) * (ys[lo:hi] - ys[a]) - (xs[a] - xs[lo:hi]) * (avg_y - ys[a])
+        )
+        a = lo + int(area.argmax())
+        out[i + 1] = a
+    out = np.union1d(out, [int(np.argmin(ys)), int(np.argmax(ys))])
+    return valid[out]
+
+
+def downsample(df, x, y, n_out, method="Min/Max"):
+    """Subset of ``df`` rows that keeps the visual shape of ``y`` against ``x``."""
+    if method == "None" or len(df) <= n_out:
+        return df
+    ys = df[y].to_numpy(dtype="float64", na_value=np.nan)
+    if method == "LTTB":
+        rows = lttb_indices(_positions(df[x]), ys, n_out)
+    else:
+        rows = minmax_indices(ys, n_out)
+    return df.iloc[rows]
+
+
+def resample_ohlc(df, x, open_, high, low, close, n_buckets):
+    """Collapse rows into at most ``n_buckets`` OHLC candles.
+
+    Datetime and numeric ``x`` are cut into equal-width intervals; any other
+    ``x`` is cut into equal row counts. Each candle keeps the first open, the
+    highest high, the lowest low and the last close of its rows. Returns a
+    frame with columns ``x``, ``open``, ``high``, ``low`` and ``close``.
+    """
+    data = pd.DataFrame({
+        "x": df[x].to_numpy(), "open": df[open_].to_numpy(), "high": df[high].to_numpy(),
+        "low": df[low].to_numpy(), "close": df[close].to_numpy(),
+    })
+    if len(data) <= n_buckets:
+        return data
+    col = df[x]
+    if pd.api.types.is_datetime64_any_dtype(col) or (
+        pd.api.types.is_numeric_dtype(col) and not pd.api.types.is_bool_dtype(col)
+    ):
+        data = data.sort_values("x", kind="stable", ignore_index=True)
+        pos = _positions(data["x"])
+        lo, hi = np.nanmin(pos), np.nanmax(pos)
+        pos = np.nan_to_num(pos, nan=lo)
+        bucket = np.minimum(((pos - lo) / ((hi - lo) or 1.0) * n_buckets).astype(np.int64), n_buckets - 1)
+    else:
+        bucket = _buckets(len(data), n_buckets)
+    return data.groupby(bucket, sort=True).agg(
+        x=("x", "first"), open=("open", "first"), high=("high", "max"),
+        low=("low", "min"), close=("close", "last"),
+    ).reset_index(drop=True)
@@ -0,0 +1,157 @@
+"""On-demand chart export with cached encodings.
+
+Every chart a session generates is remembered as a small record: its spec
+plus the result that was displayed. An export format is only encoded when a
+download is requested. The bytes are cached under the chart's spec and
+format, so repeat downloads, and other sessions exporting the same chart,
+reuse them. Static charts are re-rendered from their spec for SVG and PDF,
+and Plotly figures are serialised to standalone HTML or JSON.
+"""
+
+import io
+import zipfile
+
+from vizlab.cache import LRUCache
+from vizlab.figcache import figure_key
+from vizlab.filters import apply_filters
+
+STATIC_FORMATS = {"PNG": ("png", "image/png"), "SVG": ("svg", "image/svg+xml"), "PDF": ("pdf", "application/pdf")}
+PLOTLY_FORMATS = {"HTML": ("html", "text/html"), "JSON": ("json", "application/json")}
+# Charts a session remembers for the ZIP bundle; older ones drop off.
+SESSION_CHART_LIMIT = 50
+
+EXPORT_CACHE = LRUCache(max_entries=256, max_bytes=256 * 1024 ** 2, sizeof=len)
+
+
+def chart_record(library, chart_type, params, result, dataset_key=None, width=None, height=None, filters=()):
+    """What the export page needs to know about one generated chart.
+
+    A chart of a filtered view carries the view's ``dataset_key`` and the
+    ``vizlab.filters`` conditions that produced it from the loaded dataset.
+    """
+    return {
+        "library": library,
+        "chart_type": chart_type,
+        "params": params,
+        "width": width,
+        "height": height,
+        "dataset_key": dataset_key,
+        "filters": tuple(filters),
+        "result": result,
+    }
+
+
+def add_record(records, record, limit=SESSION_CHART_LIMIT):
+    """Append ``record`` to a session's list, replacing an earlier copy of the same chart."""
+    ident = _ident(record)
+    records[:] = [r for r in records if _ident(r) != ident]
+    records.append(record)
+    del records[:-limit]
+    return records
+
+
+def _ident(record):
+    return (
+        record["library"], record["chart_type"], repr(record["params"]),
+        record["width"], record["height"], record["dataset_key"],
+    )
+
+
+def export_formats(library):
+    return PLOTLY_FORMATS if library == "plotly" else STATIC_FORMATS
+
+
+def file_name(record, fmt, stem=None):
+    ext, _ = export_formats(record["library"])[fmt]
+    if stem is None:
+        stem = f"{record['library']}_{record['chart_type'].lower().replace(' ', '_')}"
+    return f"{stem}.{ext}"
+
+
+def record_frame(record, df, dataset_key=None):
+    """The frame ``record`` was drawn from, given the loaded ``df`` and its key.
+
+    That is ``df`` itself or, for a chart drawn under filters, the filtered
+    view, rebuilt (from cache when possible) if it is a view of ``df``. None
+    when the chart belongs to another dataset.
+    """
+    if df is None:
+        return None
+    filters = record.get("filters")
+    if filters:
+        view, key = apply_filters(df, filters, dataset_key)
+        return view if key == record["dataset_key"] else None
+    return df if record["dataset_key"] == dataset_key else None
+
+
+def _encode(record, fmt, df, plotlyjs):
+    result = record["result"]
+    if record["library"] == "plotly":
+        if fmt == "JSON":
+            return result.to_json().encode()
+        return result.to_html(include_plotlyjs=plotlyjs, full_html=True).encode()
+    if fmt == "PNG":
+        return result
+    if df is None:
+        raise ValueError(f"The dataset behind this {record['chart_type']} is no longer loaded.")
+    from vizlab.static_charts import render_static
+
+    ext, _ = STATIC_FORMATS[fmt]
+    return render_static(
+        df, record["library"], record["chart_type"], record["params"],
+        record["width"], record["height"], dataset_key=record["dataset_key"], fmt=ext,
+    )
+
+
+def export_bytes(record, fmt, df=None, dataset_key=None, plotlyjs=True):
+    """``record`` encoded as ``fmt`` (a key of :func:`export_formats`).
+
+    ``df`` is the session's current (unfiltered) frame and ``dataset_key`` its
+    key. Static charts need their frame to re-render as SVG/PDF, so only
+    charts of the currently loaded dataset, or of filtered views of it, can
+    be exported in those formats. ``plotlyjs`` is passed to ``Figure.to_html``.
+    """
+    if fmt not in export_formats(record["library"]):
+        raise ValueError(f"{record['library']} charts cannot be exported as {fmt}")
+    if fmt in STATIC_FORMATS and fmt != "PNG":
+        df = record_frame(record, df, dataset_key)
+    size = (record["width"], record["height"])
+    key = figure_key(record["dataset_key"], record["library"], record["chart_type"], record["params"], size)
+    if key is None:
+        return _encode(record, fmt, df, plotlyjs)
+    return EXPORT_CACHE.get_or_compute(key + (fmt, plotlyjs), lambda: _encode(record, fmt, df, plotlyjs))
+
+
+def export_zip(records, static_fmt="PNG", plotly_fmt="HTML", df=None, dataset_key=None):
+    """ZIP archive of every chart in ``records``; returns a file object at offset 0.
+
+    Plotly HTML pages in the archive share one ``plotly.min.js``. Charts that
+    cannot be exported in the chosen format fall back to their PNG (static)
+    or are listed in ``errors.txt``.
+    """
+    buf = io.BytesIO()
+    errors = []
+    with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        plotly_html = False
+        for i, record in enumerate(records, start=1):
+            is_plotly = record["library"] == "plotly"
+            fmt = plotly_fmt if is_plotly else static_fmt
+            stem = f"{i:02d}_{record['library']}_{record['chart_type'].lower().replace(' ', '_')}"
+            try:
+                data = export_bytes(record, fmt, df, dataset_key, plotlyjs="directory")
+            except ValueError as e:
+                if is_plotly:
+                    errors.append(f"{stem}: {e}")
+                    continue
+                fmt, data = "PNG", record["result"]
+                errors.append(f"{stem}: {e} Exported as PNG instead.")
+            archive.writestr(file_name(record, fmt, stem), data)
+            plotly_html = plotly_html or (is_plotly and fmt == "HTML")
+        if plotly_html:
+            from plotly.offline import get_plotlyjs
+
+            archive.writestr("plotly.min.js", get_plotlyjs())
+        if errors:
+            archive.writestr("errors.txt", "\n".join(errors) + "\n")
+    buf.seek(0)
+    return buf
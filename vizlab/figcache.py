@@ -0,0 +1,48 @@
+"""Rendered-figure cache keyed by dataset fingerprint and chart spec."""
+
+import numpy as np
+
+from vizlab.cache import LRUCache
+
+
+def figure_key(dataset_key, library, chart_type, params, size=None):
+    """Cache key for one chart, or None when the dataset has no fingerprint."""
+    if dataset_key is None:
+        return None
+    return (dataset_key, library, chart_type, _freeze(params), size)
+
+
+def _freeze(value):
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _plotly_nbytes(fig):
+    total = 0
+    for trace in fig.data:
+        for value in trace.to_plotly_json().values():
+            if isinstance(value, np.ndarray):
+                total += value.nbytes
+            elif isinstance(value, (list, tuple)):
+                total += 8 * len(value)
+    return total + 1024
+
+
+def figure_nbytes(fig):
+    """Approximate memory held by a Plotly figure or encoded static image."""
+    if isinstance(fig, bytes):
+        return len(fig)
+    return _plotly_nbytes(fig)
+
+
+# Plotly figures are cached as objects; Matplotlib/Seaborn charts as PNG bytes.
+FIGURE_CACHE = LRUCache(max_entries=64, max_bytes=256 * 1024 ** 2, sizeof=figure_nbytes)
+
+
+def figure_cache_summary(cache=FIGURE_CACHE):
+    s = cache.stats()
+    return (
+        f"Figure cache: {s['hits']} hits · {s['misses']} misses · "
+        f"{s['entries']} figures · {s['bytes'] / 1024 ** 2:.1f} MB"
+    )
@@ -0,0 +1,56 @@
+"""Matplotlib figure lifecycle without pyplot's global figure registry.
+
+Figures are created with the object-oriented ``Figure`` API, so pyplot never
+tracks them. They are encoded once (PNG for display, SVG or PDF for export)
+and closed straight away; only the bytes are kept.
+"""
+
+import io
+
+from matplotlib.figure import Figure
+
+# Same options st.pyplot uses, so one encoding serves both display and export.
+PNG_OPTIONS = {"format": "png", "bbox_inches": "tight", "dpi": 200}
+FORMATS = ["png", "svg", "pdf"]
+
+
+def new_figure(width, height, dpi=80, **subplots):
+    """A standalone ``(fig, ax)`` pair that pyplot does not track.
+
+    ``subplots`` is passed to ``Figure.subplots`` (e.g. ``nrows``/``ncols``),
+    in which case ``ax`` is the array of axes.
+    """
+    fig = Figure(figsize=(width, height), dpi=dpi)
+    return fig, fig.subplots(**subplots)
+
+
+def close_figure(fig):
+    """Release a figure.
+
+    A standalone ``Figure`` is freed once it is no longer referenced. Only
+    figures created through pyplot (such as those of Seaborn's figure-level
+    ``pairplot`` or ``FacetGrid``) have a manager registered with it, and only
+    those are closed through pyplot.
+    """
+    if getattr(fig.canvas, "manager", None) is not None:
+        import matplotlib.pyplot as plt
+
+        plt.close(fig)
+    fig.clear()
+
+
+def encode(fig, fmt="png"):
+    """Encode ``fig`` as PNG, SVG or PDF bytes and close it."""
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported image format: {fmt}")
+    buf = io.BytesIO()
+    try:
+        fig.savefig(buf, **dict(PNG_OPTIONS, format=fmt))
+    finally:
+        close_figure(fig)
+    return buf.getvalue()
+
+
+def to_png(fig):
+    """Encode ``fig`` as PNG bytes and close it."""
+    return encode(fig, "png")
@@ -0,0 +1,196 @@
+"""Row filters over the loaded dataset, answered from per-column indexes.
+
+Each filtered column gets an index the first time a filter touches it:
+
+* numeric and date/time columns keep their row order sorted by value, so a
+  range is two ``np.searchsorted`` calls and a slice of row ids;
+* other columns keep their category codes, plus a packed bitmap (one bit per
+  row) for each category that has been selected.
+
+Every condition becomes a packed bitmap. Bitmaps are cached per condition,
+so moving one slider only recomputes that condition. A filter is the bitwise
+AND of its conditions' bitmaps. The filtered frame is cached too, under its
+own dataset key, and every cache keyed by dataset (profiles, bins,
+aggregates, figures, shared render frames) treats it as a dataset of its own.
+"""
+
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from vizlab.cache import LRUCache
+from vizlab.categories import category_codes
+from vizlab.ingest import DATASET_STORE
+from vizlab.store import DEFAULT_BUDGET
+
+# Above this many selected categories, one lookup over the codes is cheaper
+# than OR-ing per-category bitmaps.
+MAX_BITMAP_VALUES = 16
+
+INDEX_CACHE = LRUCache(max_entries=64, max_bytes=1024 ** 3, sizeof=lambda i: i.nbytes)
+BITMAP_CACHE = LRUCache(max_entries=256, max_bytes=256 * 1024 ** 2, sizeof=lambda b: b.nbytes)
+# Views are copies of their rows, so they stay well inside the dataset budget.
+VIEW_CACHE = LRUCache(
+    max_entries=8, max_bytes=min(1024 ** 3, DEFAULT_BUDGET // 2),
+    sizeof=lambda v: int(v[0].memory_usage(index=True).sum()),
+)
+
+
+class RangeIndex:
+    """Row ids of a numeric or date/time column, sorted by value."""
+
+    kind = "range"
+
+    def __init__(self, col):
+        if pd.api.types.is_datetime64_any_dtype(col):
+            valid = col.notna().to_numpy()
+            values = col.to_numpy(dtype="datetime64[ns]").view("int64").astype("float64")
+            values[~valid] = np.nan
+        else:
+            values = col.to_numpy(dtype="float64", na_value=np.nan)
+        self.rows = len(values)
+        order = np.argsort(values, kind="stable")
+        # NaNs sort last and never match a range.
+        self.valid = int(np.count_nonzero(~np.isnan(values)))
+        self.order = order[:self.valid]
+        self.sorted = values[self.order]
+        self.nbytes = self.order.nbytes + self.sorted.nbytes
+
+    @property
+    def bounds(self):
+        if not self.valid:
+            return None
+        return self.sorted[0], self.sorted[-1]
+
+    def rows_between(self, lo, hi):
+        """Row ids with ``lo <= value <= hi``, in value order."""
+        start = np.searchsorted(self.sorted, lo, side="left")
+        stop = np.searchsorted(self.sorted, hi, side="right")
+        return self.order[start:stop]
+
+
+class CategoryIndex:
+    """Category codes of a column, with packed bitmaps built per category on demand."""
+
+    kind = "values"
+
+    def __init__(self, col):
+        self.codes, self.categories = category_codes(col)
+        self.rows = len(self.codes)
+        self._bitmaps = {}
+        self.nbytes = self.codes.nbytes
+
+    def bitmap(self, code):
+        if code not in self._bitmaps:
+            self._bitmaps[code] = np.packbits(self.codes == code)
+            self.nbytes += self._bitmaps[code].nbytes
+        return self._bitmaps[code]
+
+    def rows_in(self, values):
+        """Packed bitmap of the rows whose value is in ``values``."""
+        codes = self.categories.get_indexer(pd.Index(list(values), dtype=self.categories.dtype))
+        codes = codes[codes >= 0]
+        if len(codes) == 0:
+            return np.zeros((self.rows + 7) // 8, dtype="uint8")
+        if len(codes) <= MAX_BITMAP_VALUES:
+            return np.bitwise_or.reduce([self.bitmap(int(c)) for c in codes])
+        lookup = np.zeros(len(self.categories) + 1, dtype=bool)
+        lookup[codes] = True
+        # Missing values have code -1, which lands on the trailing False.
+        return np.packbits(lookup[self.codes])
+
+
+def drop_dataset(dataset_key):
+    """Forget the indexes, bitmaps and views of ``dataset_key``."""
+    for cache in (INDEX_CACHE, BITMAP_CACHE, VIEW_CACHE):
+        for key in cache.keys():
+            if key[0] == dataset_key:
+                cache.pop(key)
+
+
+DATASET_STORE.on_release(drop_dataset)
+
+
+def column_index(df, col, dataset_key=None):
+    """:class:`RangeIndex` or :class:`CategoryIndex` for ``col``, memoized per dataset."""
+    def compute():
+        series = df[col]
+        if pd.api.types.is_bool_dtype(series) or not (
+            pd.api.types.is_numeric_dtype(series) or pd.api.types.is_datetime64_any_dtype(series)
+        ):
+            return CategoryIndex(series)
+        return RangeIndex(series)
+
+    if dataset_key is None:
+        return compute()
+    return INDEX_CACHE.get_or_compute((dataset_key, col), compute)
+
+
+def range_filter(col, lo, hi):
+    return ("range", col, lo, hi)
+
+
+def values_filter(col, values):
+    return ("values", col, tuple(sorted(values, key=str)))
+
+
+def _scalar(value):
+    """Range bound as the float the index compares against."""
+    if isinstance(value, (pd.Timestamp, np.datetime64)) or hasattr(value, "isoformat"):
+        return float(pd.Timestamp(value).as_unit("ns").value)
+    return float(value)
+
+
+def _bitmap(df, condition, dataset_key):
+    kind, col = condition[0], condition[1]
+    index = column_index(df, col, dataset_key)
+    if kind == "range":
+        mask = np.zeros(index.rows, dtype=bool)
+        mask[index.rows_between(_scalar(condition[2]), _scalar(condition[3]))] = True
+        return np.packbits(mask)
+    if kind == "values":
+        return index.rows_in(condition[2])
+    raise ValueError(f"Unknown filter kind: {kind}")
+
+
+def condition_bitmap(df, condition, dataset_key=None):
+    """Packed bitmap (``np.packbits``) of the rows matching one condition."""
+    if dataset_key is None:
+        return _bitmap(df, condition, dataset_key)
+    return BITMAP_CACHE.get_or_compute((dataset_key, condition), lambda: _bitmap(df, condition, dataset_key))
+
+
+def row_mask(df, filters, dataset_key=None):
+    """Boolean mask of the rows matching every condition in ``filters``."""
+    bitmaps = [condition_bitmap(df, c, dataset_key) for c in filters]
+    return np.unpackbits(np.bitwise_and.reduce(bitmaps), count=len(df)).view(bool)
+
+
+def view_key(dataset_key, filters):
+    """Dataset key of the filtered view, or None when the dataset has none."""
+    if dataset_key is None:
+        return None
+    digest = hashlib.sha1(repr(sorted(filters, key=repr)).encode()).hexdigest()[:16]
+    return f"{dataset_key}:{digest}"
+
+
+def apply_filters(df, filters, dataset_key=None):
+    """``(frame, key)`` for the rows of ``df`` that match ``filters``.
+
+    ``filters`` is a sequence of :func:`range_filter` and :func:`values_filter`
+    conditions, all of which must hold. With no conditions ``df`` and
+    ``dataset_key`` come back unchanged. The filtered frame is memoized under
+    ``(dataset_key, filters)`` and its key is derived from both.
+    """
+    if not filters:
+        return df, dataset_key
+    filters = tuple(sorted(filters, key=repr))
+
+    def compute():
+        mask = row_mask(df, filters, dataset_key)
+        return df[mask], view_key(dataset_key, filters)
+
+    if dataset_key is None:
+        return compute()
+    return VIEW_CACHE.get_or_compute((dataset_key, filters), compute)
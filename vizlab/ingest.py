@@ -0,0 +1,253 @@
+"""Dataset ingestion: content-hashed parsing into a process-wide dataset store."""
+
+import hashlib
+import io
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from vizlab import snapshot
+from vizlab.store import DatasetStore
+
+# Extensions accepted by the Overview uploader.
+UPLOAD_TYPES = ["csv", "parquet", "feather", "arrow"]
+
+
+def frame_nbytes(df):
+    """Deep memory footprint of a DataFrame in bytes."""
+    return int(df.memory_usage(deep=True).sum())
+
+
+# Parsed frames are shared across sessions through read-only handles.
+DATASET_STORE = DatasetStore()
+
+
+def content_hash(data):
+    """Stable fingerprint of the raw uploaded bytes."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def file_hash(fileobj, chunk_size=1024 ** 2):
+    """:func:`content_hash` of a file-like object, read ``chunk_size`` bytes at a time."""
+    digest = hashlib.blake2b(digest_size=16)
+    fileobj.seek(0)
+    for block in iter(lambda: fileobj.read(chunk_size), b""):
+        digest.update(block)
+    fileobj.seek(0)
+    return digest.hexdigest()
+
+
+# ------------------ DTYPE COMPACTION ------------------
+
+_INT_TYPES = [np.int8, np.int16, np.int32, np.int64]
+
+
+def _narrow_int(col):
+    # Sized from the column's range, as pd.to_numeric(downcast="integer") does;
+    # pandas already sums small integer columns as int64.
+    if not len(col):
+        return col
+    lo, hi = int(col.min()), int(col.max())
+    for dtype in _INT_TYPES:
+        info = np.iinfo(dtype)
+        if info.min <= lo and hi <= info.max:
+            return col.astype(dtype)
+    return col
+
+
+def _float32_safe(col):
+    # float32 holds 6 significant decimal digits (FLT_DIG), so a value written
+    # with at most 6 comes back from float32 as the same number once rounded to
+    # 6 digits. Statistics computed from the float32 column can still differ
+    # from the float64 ones beyond the 6th digit.
+    values = col.to_numpy(dtype="float64", na_value=np.nan)
+    values = values[np.isfinite(values) & (values != 0)]
+    if values.size == 0:
+        return True
+    magnitude = np.abs(values)
+    if magnitude.max() > np.finfo(np.float32).max or magnitude.min() < np.finfo(np.float32).tiny:
+        return False
+    scale = 10.0 ** (5 - np.floor(np.log10(magnitude)))
+    return bool(np.all(np.round(values * scale) / scale == values))
+
+
+def compact_dtypes(df, max_category_ratio=0.5):
+    """Shrink a freshly parsed frame: low-cardinality strings become ``category``,
+    integers and floats are narrowed to the smallest dtype that keeps every value.
+
+    Returns ``(compacted_df, report)``; ``report`` holds the before/after byte
+    counts and the per-column dtype changes.
+    """
+    before = frame_nbytes(df)
+    out = {}
+    changes = {}
+    n_rows = len(df)
+    for name, col in df.items():
+        new = col
+        numpy_backed = isinstance(col.dtype, np.dtype)
+        if pd.api.types.is_bool_dtype(col) or isinstance(col.dtype, pd.CategoricalDtype):
+            pass
+        elif numpy_backed and pd.api.types.is_integer_dtype(col):
+            new = _narrow_int(col)
+        elif numpy_backed and pd.api.types.is_float_dtype(col):
+            if col.dtype != np.float32 and _float32_safe(col):
+                new = col.astype(np.float32)
+        elif pd.api.types.is_object_dtype(col) or pd.api.types.is_string_dtype(col):
+            if n_rows and col.nunique(dropna=True) <= max_category_ratio * n_rows:
+                new = col.astype("category")
+        if new.dtype != col.dtype:
+            changes[name] = (str(col.dtype), str(new.dtype))
+        out[name] = new
+    compacted = pd.DataFrame(out, index=df.index)
+    report = {"before": before, "after": frame_nbytes(compacted), "changes": changes}
+    return compacted, report
+
+
+# ------------------ APPENDING ------------------
+
+class SchemaError(ValueError):
+    """Appended rows do not fit the columns of the loaded dataset."""
+
+
+def _align(name, col, new):
+    """``(col, new)`` converted to one dtype both can be concatenated as."""
+    if pd.api.types.is_bool_dtype(col):
+        if not pd.api.types.is_bool_dtype(new):
+            raise SchemaError(f"Column {name!r} holds true/false values but the new rows have {new.dtype}.")
+        return col, new
+    if isinstance(col.dtype, pd.CategoricalDtype):
+        categories = col.cat.categories
+        if pd.api.types.is_numeric_dtype(new) and not pd.api.types.is_numeric_dtype(categories):
+            raise SchemaError(f"Column {name!r} holds text but the new rows have {new.dtype}.")
+        seen = pd.Index(new.dropna().unique())
+        extra = seen[~seen.isin(categories)]
+        if len(extra):
+            # Adding categories keeps the existing codes, so old rows are not re-encoded.
+            col = col.cat.add_categories(list(extra))
+        return col, new.astype(col.dtype)
+    if pd.api.types.is_datetime64_any_dtype(col):
+        try:
+            return col, pd.to_datetime(new).astype(col.dtype)
+        except (ValueError, TypeError) as e:
+            raise SchemaError(f"Column {name!r} holds dates but the new rows do not parse as dates: {e}") from e
+    if pd.api.types.is_numeric_dtype(col):
+        if not pd.api.types.is_numeric_dtype(new) or pd.api.types.is_bool_dtype(new):
+            raise SchemaError(f"Column {name!r} holds numbers but the new rows have {new.dtype}.")
+        if col.dtype == np.float32 and pd.api.types.is_float_dtype(new) and _float32_safe(new):
+            new = new.astype(np.float32)
+        return col, new
+    return col, new.astype(col.dtype)
+
+
+def append_frame(df, rows):
+    """``df`` with the freshly parsed ``rows`` appended below it.
+
+    ``rows`` must have the same columns (in any order). Each is converted to
+    the dtype of the existing column: new category values extend the
+    category list and integer columns are widened only as far as the
+    combined range needs. Raises :class:`SchemaError` when columns are
+    missing, unexpected or hold values of another kind.
+    """
+    missing = [c for c in df.columns if c not in rows.columns]
+    extra = [c for c in rows.columns if c not in df.columns]
+    if missing or extra:
+        parts = []
+        if missing:
+            parts.append(f"missing {', '.join(map(str, missing))}")
+        if extra:
+            parts.append(f"unexpected {', '.join(map(str, extra))}")
+        raise SchemaError(f"The new rows do not have the dataset's columns: {'; '.join(parts)}.")
+    old, new = {}, {}
+    for name in df.columns:
+        old[name], new[name] = _align(name, df[name], rows[name])
+    combined = pd.concat(
+        [pd.DataFrame(old, index=df.index), pd.DataFrame(new, index=rows.index)], ignore_index=True
+    )
+    for name in df.columns:
+        col = combined[name]
+        if isinstance(col.dtype, np.dtype) and col.dtype.kind in "iu":
+            combined[name] = _narrow_int(col)
+    return combined
+
+
+# ------------------ LOADING ------------------
+
+def file_kind(name):
+    """Map an upload's file name to ``"csv"``, ``"parquet"`` or ``"feather"``."""
+    ext = Path(name or "").suffix.lower().lstrip(".")
+    if ext in ("feather", "arrow"):
+        return "feather"
+    return "parquet" if ext == "parquet" else "csv"
+
+
+def read_frame(data, kind):
+    """Parse raw file bytes of the given ``file_kind`` into a DataFrame."""
+    if kind == "csv":
+        return pd.read_csv(io.BytesIO(data))
+    return snapshot.read_columnar(data, kind)
+
+
+def _parse(data, kind, key):
+    cached = snapshot.read_snapshot(key)
+    if cached is not None:
+        df, report = cached
+        if report is None:
+            nbytes = frame_nbytes(df)
+            report = {"before": nbytes, "after": nbytes, "changes": {}}
+        return df, dict(report, source="snapshot")
+
+    df, report = compact_dtypes(read_frame(data, kind))
+    if kind != "feather":
+        snapshot.write_snapshot(key, df, report)
+    return df, dict(report, source=kind)
+
+
+def load_dataset(uploaded_file, current=None, store=DATASET_STORE):
+    """Load an uploaded CSV/Parquet/Feather file, reusing earlier work where possible.
+
+    Lookup order is the session's ``current`` handle, then the shared store,
+    then an on-disk snapshot, then a full parse (which writes a snapshot for
+    next time). Returns a :class:`~vizlab.store.DatasetHandle` whose ``key`` is
+    the content hash of the upload and whose ``report`` is the dtype
+    compaction report from :func:`compact_dtypes` plus the ``source`` it came
+    from. Raises :class:`~vizlab.store.StoreFullError` when the dataset does
+    not fit in the store's budget.
+    """
+    data = uploaded_file.getvalue()
+    key = content_hash(data)
+    # A dataset extended by vizlab.append keeps the key of the upload it grew from.
+    if current is not None and current.report.get("base", current.key) == key and not current.released:
+        return current
+    kind = file_kind(getattr(uploaded_file, "name", ""))
+    return store.acquire(key, lambda: _parse(data, kind, key))
+
+
+def load_path(path, store=DATASET_STORE):
+    """Load a dataset file from disk the same way as an upload; returns a handle."""
+    data = Path(path).read_bytes()
+    key = content_hash(data)
+    return store.acquire(key, lambda: _parse(data, file_kind(str(path)), key))
+
+
+def cache_summary(store=DATASET_STORE):
+    """One-line human readable store report for the UI."""
+    s = store.stats()
+    return (
+        f"Dataset store: {s['entries']} datasets · {s['handles']} session handles · "
+        f"{s['bytes'] / 1024 ** 2:.1f} of {s['budget'] / 1024 ** 2:.0f} MB budget · "
+        f"{s['hits']} hits · {s['misses']} misses"
+    )
+
+
+def compaction_summary(report):
+    """Before/after memory line for the compaction report."""
+    before, after = report["before"], report["after"]
+    saved = 100 * (1 - after / before) if before else 0
+    line = (
+        f"Memory: {before / 1024 ** 2:.1f} MB → {after / 1024 ** 2:.1f} MB "
+        f"({saved:.0f}% smaller)"
+    )
+    if report.get("source") == "snapshot":
+        line += " · loaded from memory-mapped snapshot"
+    return line
@@ -0,0 +1,228 @@
+"""Per-stage timing, memory and payload metrics for one script run.
+
+Each rerun of the app builds a ``RerunMetrics`` and wraps its stages (load,
+profile, chart build, transfer to the browser) in ``metrics.stage(name)``.
+Wall time is always recorded. Peak Python allocation comes from
+``tracemalloc``, which slows everything down and is process-wide. It runs
+while at least one session's rerun asks for it. Sessions never wait for each
+other's stages, so a stage's peak also counts what other sessions allocated
+while it ran, and is approximate when several are busy. Finished runs can be
+appended to a JSON-lines log (``VIZLAB_METRICS_LOG``) for tracking
+regressions.
+
+``Profiler`` captures a trace of a whole rerun with cProfile, or with
+pyinstrument when it is installed.
+"""
+
+import cProfile
+import importlib.util
+import io
+import json
+import marshal
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+import weakref
+from contextlib import contextmanager
+
+import pandas as pd
+
+METRICS_LOG = os.environ.get("VIZLAB_METRICS_LOG")
+# Finished reruns a session keeps for the panel and its download.
+HISTORY_LIMIT = 100
+
+PROFILERS = ["cProfile"] + (["pyinstrument"] if importlib.util.find_spec("pyinstrument") else [])
+
+# tracemalloc is shared by every session: it runs while any detailed rerun is
+# open. Its peak is reset whenever a stage starts, after being folded into
+# every open stage (of any session), so no stage loses the peak it saw.
+_tracing_lock = threading.Lock()
+_detailed_runs = 0
+_peak_lock = threading.Lock()
+# [allocation at stage start, highest allocation seen] per open stage, by id(stage).
+_windows = {}
+
+
+def _start_tracing():
+    global _detailed_runs
+    with _tracing_lock:
+        _detailed_runs += 1
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+
+def _stop_tracing():
+    global _detailed_runs
+    with _tracing_lock:
+        _detailed_runs -= 1
+        if _detailed_runs == 0 and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+
+def _fold_peak():
+    """Fold the peak since the last reset into every open stage; needs ``_peak_lock``."""
+    current, peak = tracemalloc.get_traced_memory()
+    for window in _windows.values():
+        window[1] = max(window[1], peak)
+    return current
+
+
+def _open_window(stage):
+    with _peak_lock:
+        current = _fold_peak()
+        tracemalloc.reset_peak()
+        _windows[id(stage)] = [current, current]
+
+
+def _close_window(stage):
+    """Peak allocation above the start of ``stage``, which is closed."""
+    with _peak_lock:
+        _fold_peak()
+        start, seen = _windows.pop(id(stage))
+    return seen - start
+
+
+class Stage:
+    __slots__ = ("name", "seconds", "peak_bytes", "payload_bytes")
+
+    def __init__(self, name):
+        self.name = name
+        self.seconds = None
+        self.peak_bytes = None
+        self.payload_bytes = None
+
+    def add_payload(self, nbytes):
+        """Count ``nbytes`` sent to the browser (or encoded) by this stage."""
+        self.payload_bytes = (self.payload_bytes or 0) + int(nbytes)
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class RerunMetrics:
+    """Stages recorded during one run of the script.
+
+    With ``detailed`` set, stages also record their peak allocation and
+    callers are expected to measure payloads that cost extra work to size
+    (such as a Plotly figure's JSON). Tracing is released by ``finish``, or
+    when the metrics are garbage collected after a rerun that stopped early.
+    Allocations by other sessions running at the same time count towards a
+    stage's peak.
+    """
+
+    def __init__(self, detailed=False):
+        self.page = None
+        self.detailed = detailed
+        self.started = time.time()
+        self.seconds = None
+        self.stages = []
+        self._t0 = time.perf_counter()
+        self._tracing = None
+        if detailed:
+            _start_tracing()
+            self._tracing = weakref.finalize(self, _stop_tracing)
+
+    @contextmanager
+    def stage(self, name):
+        """Time the ``with`` block as stage ``name``; yields its :class:`Stage`.
+
+        Stages may nest. A parent's peak includes its children's.
+        """
+        stage = Stage(name)
+        self.stages.append(stage)
+        tracing = self._tracing is not None and self._tracing.alive
+        if tracing:
+            _open_window(stage)
+        t0 = time.perf_counter()
+        try:
+            yield stage
+        finally:
+            stage.seconds = time.perf_counter() - t0
+            if tracing:
+                stage.peak_bytes = _close_window(stage)
+
+    def finish(self, page=None):
+        if page is not None:
+            self.page = page
+        self.seconds = time.perf_counter() - self._t0
+        if self._tracing is not None:
+            self._tracing()
+        return self
+
+    def as_dict(self):
+        return {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started)),
+            "page": self.page,
+            "seconds": self.seconds,
+            "detailed": self.detailed,
+            "stages": [s.as_dict() for s in self.stages],
+        }
+
+    def table(self):
+        """The stages as a display-ready DataFrame."""
+        rows = [
+            (
+                s.name,
+                None if s.seconds is None else s.seconds * 1000,
+                None if s.peak_bytes is None else s.peak_bytes / 1024 ** 2,
+                None if s.payload_bytes is None else s.payload_bytes / 1024,
+            )
+            for s in self.stages
+        ]
+        return pd.DataFrame(rows, columns=["Stage", "Time (ms)", "Peak alloc (MB)", "Payload (KB)"]).round(2)
+
+
+def record(history, metrics, log_path=METRICS_LOG, limit=HISTORY_LIMIT):
+    """Add finished ``metrics`` to a session's ``history`` and the log file, if any."""
+    entry = metrics.as_dict()
+    history.append(entry)
+    del history[:-limit]
+    if log_path:
+        with open(log_path, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+    return entry
+
+
+def to_jsonl(history):
+    return "".join(json.dumps(entry) + "\n" for entry in history).encode()
+
+
+class Profiler:
+    """A trace of everything the calling thread runs between start and stop."""
+
+    def __init__(self, kind="cProfile"):
+        if kind not in PROFILERS:
+            raise ValueError(f"Profiler {kind!r} is not available; expected one of {', '.join(PROFILERS)}")
+        self.kind = kind
+        if kind == "pyinstrument":
+            import pyinstrument
+
+            self._profiler = pyinstrument.Profiler()
+        else:
+            self._profiler = cProfile.Profile()
+
+    def start(self):
+        if self.kind == "pyinstrument":
+            self._profiler.start()
+        else:
+            self._profiler.enable()
+        return self
+
+    def stop(self):
+        """Stop profiling; returns ``(file_name, data, mime, summary)``.
+
+        cProfile traces are in ``pstats`` format (open with ``snakeviz`` or
+        ``python -m pstats``); pyinstrument traces are an HTML page.
+        ``summary`` is a short text report of the heaviest calls.
+        """
+        if self.kind == "pyinstrument":
+            self._profiler.stop()
+            return ("rerun.html", self._profiler.output_html().encode(), "text/html",
+                    self._profiler.output_text(unicode=False, color=False))
+        self._profiler.disable()
+        self._profiler.create_stats()
+        text = io.StringIO()
+        pstats.Stats(self._profiler, stream=text).sort_stats("cumulative").print_stats(25)
+        return "rerun.prof", marshal.dumps(self._profiler.stats), "application/octet-stream", text.getvalue()
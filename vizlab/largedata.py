@@ -0,0 +1,84 @@
+"""Large-data render modes for scatter-type Plotly charts.
+
+Small frames render as regular SVG traces. Above ``webgl_threshold`` rows the
+traces switch to WebGL. Above ``density_threshold`` rows the points are binned
+on the server into a 2D count grid and sent as a single heatmap.
+"""
+
+import numpy as np
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from vizlab.binning import centers, edges_for, heatmap_figure, histogram2d, values_of
+
+# Plotly Express's own ``render_mode="auto"`` switches to WebGL at 1000 points.
+WEBGL_THRESHOLD = 1_000
+DENSITY_THRESHOLD = 500_000
+DENSITY_BINS = 100
+
+# Chart types whose render mode follows the row count.
+SCATTER_CHARTS = ["Scatter", "Bubble", "3D Scatter", "Facet Scatter"]
+
+MODE_LABELS = {
+    "svg": "SVG (all points)",
+    "webgl": "WebGL (all points)",
+    "density": "Binned density image",
+    "sample": "WebGL (uniform sample)",
+}
+
+
+def render_mode(n_rows, webgl_threshold=WEBGL_THRESHOLD, density_threshold=DENSITY_THRESHOLD):
+    if n_rows > density_threshold:
+        return "density"
+    if n_rows > webgl_threshold:
+        return "webgl"
+    return "svg"
+
+
+def chart_mode(chart_type, n_rows, x_numeric=True,
+               webgl_threshold=WEBGL_THRESHOLD, density_threshold=DENSITY_THRESHOLD):
+    """``(mode, sample_size)`` for one of ``SCATTER_CHARTS``; ``sample_size`` is
+    only set for the ``"sample"`` mode."""
+    mode = render_mode(n_rows, webgl_threshold, density_threshold)
+    if chart_type == "3D Scatter":
+        # 3D traces are always WebGL and have no 2D density equivalent.
+        mode = "sample" if mode == "density" else "webgl"
+    elif mode == "density" and not x_numeric:
+        mode = "webgl"
+    return mode, density_threshold if mode == "sample" else None
+
+
+def density_figure(df, x, y, bins=DENSITY_BINS, dataset_key=None):
+    """2D-binned count heatmap of ``x`` against ``y``."""
+    counts, x_edges, y_edges = histogram2d(df, x, y, bins, dataset_key=dataset_key)
+    return heatmap_figure(counts, x_edges, y_edges, x, y, mask_empty=True)
+
+
+def facet_density_figure(df, x, y, facet, bins=DENSITY_BINS):
+    """One density heatmap per value of ``facet``, sharing bin edges and axes."""
+    xs, ys = values_of(df, x), values_of(df, y)
+    x_edges, y_edges = edges_for(xs, bins), edges_for(ys, bins)
+    groups = df.groupby(facet, observed=True, sort=True).indices
+    fig = make_subplots(
+        rows=1, cols=max(len(groups), 1), shared_yaxes=True,
+        subplot_titles=[f"{facet}={name}" for name in groups],
+    )
+    for i, rows in enumerate(groups.values(), start=1):
+        keep = np.isfinite(xs[rows]) & np.isfinite(ys[rows])
+        counts, _, _ = np.histogram2d(xs[rows][keep], ys[rows][keep], bins=[x_edges, y_edges])
+        counts = counts.T
+        counts[counts == 0] = np.nan
+        fig.add_trace(go.Heatmap(
+            x=centers(x_edges), y=centers(y_edges), z=counts, coloraxis="coloraxis",
+        ), row=1, col=i)
+    fig.update_layout(coloraxis=dict(colorscale="Viridis", colorbar=dict(title="count")))
+    fig.update_xaxes(title_text=x)
+    fig.update_yaxes(title_text=y, col=1)
+    return fig
+
+
+def sample_rows(df, n, seed=0):
+    """Uniform row sample of at most ``n`` rows, in original order."""
+    if len(df) <= n:
+        return df
+    return df.sample(n=n, random_state=seed).sort_index()
@@ -0,0 +1,34 @@
+"""The app's pages, one module each.
+
+A page module is imported the first time its page is shown, so Plotly,
+Matplotlib and Seaborn only load once a page that draws with them is
+opened. Each module has a ``show(metrics)`` function that renders the page
+and records its stages in ``metrics`` (a ``vizlab.instrument.RerunMetrics``).
+"""
+
+import importlib
+import sys
+
+PAGES = {
+    "Home": "home",
+    "Dataset Overview": "dataset_overview",
+    "Chart Recommendation Engine": "recommendation",
+    "Interactive Visuals (Plotly)": "plotly_visuals",
+    "Matplotlib (Foundations)": "matplotlib_foundations",
+    "Seaborn (Statistical Insights)": "seaborn_insights",
+    "Library Comparison": "library_comparison",
+    "Export & Summary": "export_summary",
+}
+
+
+def load(page, metrics):
+    """The module behind ``page``, timing its import as a stage on first use."""
+    name = f"{__name__}.{PAGES[page]}"
+    if name in sys.modules:
+        return sys.modules[name]
+    with metrics.stage(f"import {PAGES[page]}"):
+        return importlib.import_module(name)
+
+
+def show(page, metrics):
+    load(page, metrics).show(metrics)
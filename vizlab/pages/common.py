@@ -0,0 +1,22 @@
+"""Helpers shared by several pages."""
+
+import streamlit as st
+
+from vizlab.export import add_record
+
+# Newer Streamlit versions take a callable and only build the file when the
+# button is clicked; older ones need the data up front.
+DEFERRED_DOWNLOADS = "callable" in (st.download_button.__doc__ or "")
+
+
+def on_click(fn, *args):
+    """Download data built by ``fn(*args)``, deferred to the click when supported."""
+    if DEFERRED_DOWNLOADS:
+        return lambda: fn(*args)
+    return fn(*args)
+
+
+def remember_chart(record):
+    """Keep ``record`` for the export page, with the sidebar filters it was drawn under."""
+    record["filters"] = st.session_state.get("filters", ())
+    add_record(st.session_state.setdefault("charts", []), record)
@@ -0,0 +1,155 @@
+"""Dataset Overview page: upload, load and summarize a dataset."""
+
+import pandas as pd
+import streamlit as st
+
+from vizlab.append import append_dataset, append_summary
+from vizlab.ingest import UPLOAD_TYPES, SchemaError, load_dataset, cache_summary, compaction_summary, file_hash, file_kind
+from vizlab.profile import get_profile
+from vizlab.store import StoreFullError
+from vizlab.streaming import load_streaming, server_csvs, server_path
+
+
+def show(metrics):
+    st.markdown("<div class='page-title'>Dataset Overview</div>", unsafe_allow_html=True)
+    st.markdown("<div class='subtitle'>Upload and understand your dataset</div>", unsafe_allow_html=True)
+
+    stream_mode = st.checkbox(
+        "Streaming mode (CSV files larger than memory)",
+        help="Reads the CSV in chunks. Summary statistics cover every row; "
+             "previews and charts use a uniform row sample."
+    )
+    local_path = ""
+    if stream_mode:
+        col1, col2 = st.columns(2)
+        chunksize = col1.number_input("Chunk size (rows)", 10_000, 5_000_000, 100_000, step=10_000)
+        sample_size = col2.number_input("Chart sample size (rows)", 1_000, 1_000_000, 50_000, step=1_000)
+        server_files = server_csvs()
+        if server_files:
+            name = st.selectbox("CSV file on the server (instead of uploading)", [""] + server_files)
+            if name:
+                local_path = server_path(name)
+                if local_path is None:
+                    st.error(f"File not found: {name}")
+                    local_path = ""
+
+    uploaded_file = st.file_uploader("Upload dataset (CSV, Parquet or Feather)", type=UPLOAD_TYPES)
+
+    if stream_mode and not local_path and uploaded_file and file_kind(uploaded_file.name) != "csv":
+        st.info("Streaming mode applies to CSV files; columnar files are loaded directly.")
+        stream_mode = False
+
+    append_file = None
+    if uploaded_file and not stream_mode:
+        with st.expander("Append rows"):
+            # Keyed by the main upload, so replacing it starts without pending rows.
+            append_file = st.file_uploader(
+                "New rows with the same columns", type=UPLOAD_TYPES,
+                key=f"append_file:{getattr(uploaded_file, 'file_id', uploaded_file.name)}",
+                help="Only the new rows are read; cached statistics are extended instead of recomputed."
+            )
+
+    if uploaded_file or local_path:
+        with metrics.stage("load"):
+            handle = st.session_state.get("dataset")
+            if stream_mode:
+                if local_path:
+                    dataset_key, summary = load_streaming(local_path, chunksize=int(chunksize), sample_size=int(sample_size))
+                else:
+                    dataset_key, summary = load_streaming(
+                        uploaded_file, key=file_hash(uploaded_file),
+                        chunksize=int(chunksize), sample_size=int(sample_size)
+                    )
+                df = summary.sample_frame()
+                compaction = None
+                if handle is not None:
+                    st.session_state.pop("dataset").release()
+                st.session_state["stream_summary"] = summary
+                n_rows, n_cols, n_numeric = summary.rows, len(summary.columns), len(summary.numeric_columns)
+                st.caption(f"Streamed {summary.rows:,} rows; previews and charts use a sample of {len(df):,} rows.")
+            else:
+                try:
+                    new_handle = load_dataset(uploaded_file, current=handle)
+                except StoreFullError as e:
+                    st.error(f"{e} Try streaming mode for this file.")
+                    st.stop()
+                if new_handle is not handle:
+                    if handle is not None:
+                        handle.release()
+                    st.session_state["dataset"] = new_handle
+                    st.session_state["df"] = new_handle.df
+                if append_file is not None:
+                    with metrics.stage("append"):
+                        try:
+                            grown = append_dataset(new_handle, append_file)
+                        except (SchemaError, StoreFullError) as e:
+                            st.error(str(e))
+                            grown = new_handle
+                    if grown is not new_handle:
+                        st.session_state.pop("dataset").release()
+                        st.session_state["dataset"] = new_handle = grown
+                        st.session_state["df"] = grown.df
+                dataset_key, df, compaction = new_handle.key, st.session_state["df"], new_handle.report
+                st.session_state.pop("stream_summary", None)
+                st.caption(cache_summary())
+                if new_handle.report.get("source") == "append":
+                    st.caption(append_summary(new_handle.report))
+
+        st.session_state["df"] = df
+        st.session_state["dataset_key"] = dataset_key
+
+        with metrics.stage("profile"):
+            profile = get_profile(df, dataset_key)
+        numeric_cols = profile.numeric_cols
+        if not stream_mode:
+            n_rows, n_cols, n_numeric = df.shape[0], df.shape[1], len(numeric_cols)
+
+        st.markdown("""
+        <div class="card">
+            <h4>Dataset Summary</h4>
+        """, unsafe_allow_html=True)
+
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Rows", n_rows)
+        col2.metric("Columns", n_cols)
+        col3.metric("Numeric Columns", n_numeric)
+
+        st.markdown("</div>", unsafe_allow_html=True)
+
+        st.markdown("<br>", unsafe_allow_html=True)
+
+        col1, col2 = st.columns(2)
+
+        with metrics.stage("preview head"), col1:
+            st.markdown("<div class='card'><h4>Data Preview (Head)</h4>", unsafe_allow_html=True)
+            st.dataframe(df.head())
+            st.markdown("</div>", unsafe_allow_html=True)
+
+        with metrics.stage("preview tail"), col2:
+            st.markdown("<div class='card'><h4>Data Preview (Tail)</h4>", unsafe_allow_html=True)
+            st.dataframe(df.tail())
+            st.markdown("</div>", unsafe_allow_html=True)
+
+        st.markdown("<br>", unsafe_allow_html=True)
+
+        if compaction is not None:
+            with st.expander("Memory Footprint"):
+                st.write(compaction_summary(compaction))
+                if compaction["changes"]:
+                    st.dataframe(pd.DataFrame(
+                        [(col, old, new) for col, (old, new) in compaction["changes"].items()],
+                        columns=["Column", "Parsed dtype", "Stored dtype"]
+                    ), hide_index=True)
+
+        st.markdown("""
+        <div class="card">
+            <h4>Column Types</h4>
+            <p class="small-text">
+            Numeric columns are best for trends, correlation, and distributions.
+            Categorical columns are useful for comparison and grouping.
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    else:
+        st.info("Please upload a CSV, Parquet or Feather file to continue.")
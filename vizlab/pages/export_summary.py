@@ -0,0 +1,120 @@
+"""Export & Summary page: dataset summary, chart downloads and notes."""
+
+import streamlit as st
+
+from vizlab.export import PLOTLY_FORMATS, STATIC_FORMATS, export_bytes, export_formats, export_zip, file_name
+from vizlab.pages.common import on_click
+from vizlab.profile import get_profile
+
+
+def show(metrics):
+    st.markdown("<div class='page-title'>Export & Summary</div>", unsafe_allow_html=True)
+    st.markdown("<div class='subtitle'>Finalize insights and export results</div>", unsafe_allow_html=True)
+
+    if "df" not in st.session_state:
+        st.warning("Please upload a dataset first.")
+    else:
+        df = st.session_state["df"]
+        dataset_key = st.session_state.get("dataset_key")
+        with metrics.stage("profile"):
+            profile = get_profile(df, dataset_key)
+
+        # ------------------ DATASET SUMMARY ------------------
+        st.markdown("<h4>Dataset Overview</h4>", unsafe_allow_html=True)
+
+        summary = st.session_state.get("stream_summary")
+
+        col1, col2, col3 = st.columns(3)
+        if summary is not None:
+            col1.metric("Rows", summary.rows)
+            col2.metric("Columns", len(summary.columns))
+            col3.metric("Missing Values", summary.missing)
+        else:
+            col1.metric("Rows", profile.rows)
+            col2.metric("Columns", profile.n_columns)
+            col3.metric("Missing Values", profile.missing)
+
+        st.markdown("</div>", unsafe_allow_html=True)
+        st.markdown("<br>", unsafe_allow_html=True)
+
+        # ------------------ NUMERIC SUMMARY ------------------
+        st.markdown("<h4>Numeric Summary</h4>", unsafe_allow_html=True)
+        with metrics.stage("describe"):
+            if summary is not None:
+                st.dataframe(summary.describe(), use_container_width=True)
+                st.caption("Streaming mode: quartiles are estimated from the row sample; other statistics are exact.")
+            else:
+                st.dataframe(profile.describe, use_container_width=True)
+        st.markdown("</div>", unsafe_allow_html=True)
+
+        st.markdown("<br>", unsafe_allow_html=True)
+
+        # ------------------ EXPORT SECTION -----------------
+        st.markdown("<h4>Export Charts</h4>", unsafe_allow_html=True)
+
+        st.info("Exports are encoded when you click download and cached for repeat downloads.")
+
+        charts = st.session_state.get("charts", [])
+        if charts:
+            last = charts[-1]
+            formats = export_formats(last["library"])
+            export_type = st.selectbox(
+                "Select Export Format",
+                list(formats)
+            )
+            st.download_button(
+                label=f"Download Chart ({export_type})",
+                data=on_click(export_bytes, last, export_type, df, dataset_key),
+                file_name=file_name(last, export_type, "chart"),
+                mime=formats[export_type][1]
+            )
+
+            st.markdown(f"<h4>All Charts from This Session ({len(charts)})</h4>", unsafe_allow_html=True)
+            col1, col2 = st.columns(2)
+            static_fmt = col1.selectbox("Matplotlib / Seaborn format", list(STATIC_FORMATS))
+            plotly_fmt = col2.selectbox("Plotly format", list(PLOTLY_FORMATS))
+            st.download_button(
+                label="Download All Charts (ZIP)",
+                data=on_click(export_zip, list(charts), static_fmt, plotly_fmt, df, dataset_key),
+                file_name="vizlab_charts.zip",
+                mime="application/zip"
+            )
+
+        else:
+            st.warning("No chart available to export.")
+
+
+        st.markdown("</div>", unsafe_allow_html=True)
+
+        st.markdown("<br>", unsafe_allow_html=True)
+
+        # ------------------ INSIGHTS ------------------
+        st.markdown("<h4>Analyst Notes</h4>", unsafe_allow_html=True)
+
+        notes = st.text_area(
+            "Write your insights or conclusions here:",
+            height=150
+        )
+
+        if st.button("Save Notes"):
+            st.session_state["notes"] = notes
+            st.success("Insights saved.")
+
+        if "notes" in st.session_state:
+            st.markdown("### Saved Insights")
+            st.write(st.session_state["notes"])
+
+        st.markdown("</div>", unsafe_allow_html=True)
+
+        st.markdown("<br>", unsafe_allow_html=True)
+
+        # ------------------ FINAL SUMMARY ------------------
+        st.markdown("""
+        <h4>Project Completion</h4>
+        <p>
+        This visualization studio demonstrates end-to-end data analysis:
+        understanding data, choosing appropriate charts, generating visuals,
+        and summarizing insights.
+        </p>
+        """, unsafe_allow_html=True)
+        st.markdown("</div>", unsafe_allow_html=True)
@@ -0,0 +1,96 @@
+"""Sidebar filter builder shared by the chart pages.
+
+The sidebar turns the chosen ranges and value sets into ``vizlab.filters``
+conditions and keeps them in ``st.session_state["filters"]``. Chart pages
+read their data through :func:`filtered_dataset`.
+"""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from vizlab.filters import apply_filters, column_index, range_filter, values_filter
+
+# Value pickers list at most this many of a column's most frequent values.
+MAX_OPTIONS = 1000
+SLIDER_STEPS = 1000
+
+
+def _range_widget(df, col, index, key):
+    lo, hi = index.bounds
+    if lo == hi:
+        st.caption(f"{col} has a single value.")
+        return None
+    if pd.api.types.is_datetime64_any_dtype(df[col]):
+        lo, hi = (pd.Timestamp(int(v)).to_pydatetime() for v in (lo, hi))
+        step = None
+    elif pd.api.types.is_integer_dtype(df[col]):
+        lo, hi, step = int(lo), int(hi), 1
+    else:
+        lo, hi = float(lo), float(hi)
+        step = (hi - lo) / SLIDER_STEPS
+    chosen = st.slider(col, lo, hi, (lo, hi), step=step, key=key)
+    if chosen == (lo, hi):
+        return None
+    return range_filter(col, *chosen)
+
+
+def _values_widget(col, index, key):
+    categories = index.categories
+    if len(categories) > MAX_OPTIONS:
+        counts = np.bincount(index.codes[index.codes >= 0], minlength=len(categories))
+        categories = categories[np.sort(np.argsort(-counts, kind="stable")[:MAX_OPTIONS])]
+        st.caption(f"Listing the {MAX_OPTIONS:,} most frequent of {len(index.categories):,} values.")
+    chosen = st.multiselect(col, list(categories), key=key)
+    if not chosen:
+        return None
+    return values_filter(col, chosen)
+
+
+def filter_sidebar(metrics):
+    """Draw the Filters expander and store the resulting conditions."""
+    if "df" not in st.session_state:
+        st.session_state.pop("filters", None)
+        return
+    df = st.session_state["df"]
+    dataset_key = st.session_state.get("dataset_key")
+    if "filter_cols" in st.session_state:
+        # Columns of a previously loaded dataset.
+        st.session_state["filter_cols"] = [c for c in st.session_state["filter_cols"] if c in df.columns]
+
+    filters = []
+    with st.sidebar.expander("Filters", expanded=bool(st.session_state.get("filter_cols"))):
+        cols = st.multiselect("Filter by", df.columns.tolist(), key="filter_cols")
+        for col in cols:
+            with metrics.stage("filter index"):
+                index = column_index(df, col, dataset_key)
+            key = f"filter:{dataset_key}:{col}"
+            if index.kind == "range":
+                if index.bounds is None:
+                    st.caption(f"{col} has no values.")
+                    continue
+                condition = _range_widget(df, col, index, key)
+            else:
+                condition = _values_widget(col, index, key)
+            if condition is not None:
+                filters.append(condition)
+        if filters:
+            with metrics.stage("filter"):
+                view, _ = apply_filters(df, filters, dataset_key)
+            st.caption(f"{len(view):,} of {len(df):,} rows match.")
+    st.session_state["filters"] = tuple(filters)
+
+
+def filtered_dataset(metrics):
+    """``(df, dataset_key)`` of the loaded dataset with the sidebar filters applied."""
+    df = st.session_state["df"]
+    dataset_key = st.session_state.get("dataset_key")
+    filters = st.session_state.get("filters")
+    if not filters:
+        return df, dataset_key
+    with metrics.stage("filter"):
+        df, dataset_key = apply_filters(df, filters, dataset_key)
+    if df.empty:
+        st.warning("No rows match the sidebar filters.")
+        st.stop()
+    return df, dataset_key
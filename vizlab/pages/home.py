@@ -0,0 +1,24 @@
+"""Home page: what the studio offers."""
+
+import streamlit as st
+
+
+def show(metrics):
+    st.markdown("<div class='page-title'>Data Visualization Studio</div>", unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="card">
+        <h4>Project Overview</h4>
+        <p class="small-text">
+        A guided platform for learning and applying data visualization using
+        Plotly, Matplotlib, and Seaborn.
+        </p>
+        <ul class="small-text">
+            <li>Understand data before visualizing</li>
+            <li>Get smart chart recommendations</li>
+            <li>Explore interactive and static charts</li>
+            <li>Compare visualization libraries</li>
+            <li>Export report-ready visuals</li>
+        </ul>
+    </div>
+    """, unsafe_allow_html=True)
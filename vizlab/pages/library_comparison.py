@@ -0,0 +1,74 @@
+"""Library Comparison page: when to use Plotly, Matplotlib or Seaborn."""
+
+import streamlit as st
+
+
+def show(metrics):
+    st.markdown("<div class='page-title'>Visualization Library Comparison</div>", unsafe_allow_html=True)
+    st.markdown("<div class='subtitle'>Choosing the right tool for the job</div>", unsafe_allow_html=True)
+
+    st.markdown("""
+    <h4>Quick Comparison</h4>
+
+    | Feature | Plotly | Matplotlib | Seaborn |
+    |------|--------|------------|---------|
+    | Interactivity | High | None | Low |
+    | Learning Curve | Medium | Steep | Easy |
+    | Customization | High | Very High | Medium |
+    | Performance | Medium | High | Medium |
+    | Statistical Support | Medium | Low | High |
+    | Best Use Case | Dashboards | Publications | Analysis |
+    """, unsafe_allow_html=True)
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.markdown("""
+        <h4>Plotly</h4>
+        <ul>
+            <li>Interactive dashboards</li>
+            <li>Hover, zoom, animations</li>
+            <li>Best for web apps</li>
+        </ul>
+        <b>Avoid when:</b> Static academic papers
+        """, unsafe_allow_html=True)
+        st.markdown("</div>", unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("""
+        <h4>Matplotlib</h4>
+        <ul>
+            <li>Complete control over visuals</li>
+            <li>Publication-ready plots</li>
+            <li>Industry standard</li>
+        </ul>
+        <b>Avoid when:</b> Interactivity is required
+        """, unsafe_allow_html=True)
+        st.markdown("</div>", unsafe_allow_html=True)
+
+    with col3:
+        st.markdown("""
+        <h4>Seaborn</h4>
+        <ul>
+            <li>Statistical visualization</li>
+            <li>Quick insights</li>
+            <li>Beautiful defaults</li>
+        </ul>
+        <b>Avoid when:</b> Heavy customization needed
+        """, unsafe_allow_html=True)
+        st.markdown("</div>", unsafe_allow_html=True)
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    st.markdown("""
+    <h4>Final Recommendation</h4>
+    <ul>
+        <li><b>Exploration:</b> Seaborn</li>
+        <li><b>Reporting:</b> Matplotlib</li>
+        <li><b>Dashboards:</b> Plotly</li>
+    </ul>
+    """, unsafe_allow_html=True)
+    st.markdown("</div>", unsafe_allow_html=True)
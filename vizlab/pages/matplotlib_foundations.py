@@ -0,0 +1,90 @@
+"""Matplotlib Foundations page: basic static charts."""
+
+import streamlit as st
+
+from vizlab.categories import DEFAULT_TOP_N
+from vizlab.export import chart_record
+from vizlab.figcache import FIGURE_CACHE, figure_key, figure_cache_summary
+from vizlab.pages.common import remember_chart
+from vizlab.pages.filtering import filtered_dataset
+from vizlab.pages.rendering import collect_render, render_chart
+from vizlab.profile import get_profile
+
+
+def show(metrics):
+    st.markdown("<div class='page-title'>Matplotlib Foundations</div>", unsafe_allow_html=True)
+    st.markdown("<div class='subtitle'>Learn basic plotting concepts using Matplotlib</div>", unsafe_allow_html=True)
+
+    if "df" not in st.session_state:
+        st.warning("Please upload a dataset first.")
+    else:
+        df, dataset_key = filtered_dataset(metrics)
+        with metrics.stage("profile"):
+            profile = get_profile(df, dataset_key)
+        numeric_cols = profile.numeric_cols
+        categorical_cols = profile.categorical_cols
+
+        st.info("Matplotlib is best for static, publication-ready charts.")
+
+        chart_type = st.selectbox(
+            "Select Chart Type",
+            ["Line", "Bar", "Histogram", "Scatter", "Pie"]
+        )
+
+        if chart_type == "Line":
+            x = st.selectbox("X-axis", numeric_cols)
+            y = st.selectbox("Y-axis", numeric_cols)
+            params = (x, y)
+
+        elif chart_type == "Bar":
+            x = st.selectbox("Category", categorical_cols)
+            y = st.selectbox("Values", numeric_cols)
+            top_n = st.number_input("Top categories (the rest are grouped as Other; 0 = all)", 0, value=DEFAULT_TOP_N)
+            params = (x, y, top_n)
+
+        elif chart_type == "Histogram":
+            x = st.selectbox("Column", numeric_cols)
+            params = (x,)
+
+        elif chart_type == "Scatter":
+            x = st.selectbox("X-axis", numeric_cols)
+            y = st.selectbox("Y-axis", numeric_cols)
+            params = (x, y)
+
+        elif chart_type == "Pie":
+            x = st.selectbox("Category", categorical_cols)
+            y = st.selectbox("Values", numeric_cols)
+            top_n = st.number_input("Top categories (the rest are grouped as Other; 0 = all)", 0, value=DEFAULT_TOP_N)
+            params = (x, y, top_n)
+
+        with st.expander("Chart Size Settings"):
+            width = st.slider("Width", 1, 10, 2)
+            height = st.slider("Height", 1, 10, 3)
+
+
+        st.markdown("</div>", unsafe_allow_html=True)
+
+        png = None
+
+        if st.button("Generate Matplotlib Chart", type="primary"):
+            key = figure_key(dataset_key, "matplotlib", chart_type, params, (width, height))
+            png = FIGURE_CACHE.get(key) if key else None
+
+            if png is None:
+                spec = dict(library="matplotlib", chart_type=chart_type, params=params, width=width, height=height)
+                with metrics.stage("render"):
+                    png = render_chart(df, dataset_key, key, spec)
+
+        if png is None:
+            with metrics.stage("render"):
+                png = collect_render("matplotlib")
+
+        if png is not None:
+            st.session_state["last_plot"] = png
+            st.session_state["plot_lib"] = "matplotlib"
+            remember_chart(chart_record("matplotlib", chart_type, params, png, dataset_key, width, height))
+
+            with metrics.stage("transfer") as stage:
+                stage.add_payload(len(png))
+                st.image(png)
+            st.caption(figure_cache_summary())
@@ -0,0 +1,205 @@
+"""Interactive Visuals page: Plotly charts."""
+
+import streamlit as st
+
+from vizlab.aggregate import AGGREGATIONS
+from vizlab.categories import DEFAULT_TOP_N
+from vizlab.correlation import METHODS as CORR_METHODS
+from vizlab.downsample import METHODS, DEFAULT_WIDTH, candle_count
+from vizlab.export import chart_record
+from vizlab.figcache import FIGURE_CACHE, figure_key, figure_cache_summary
+from vizlab.largedata import DENSITY_THRESHOLD, MODE_LABELS, SCATTER_CHARTS, WEBGL_THRESHOLD, chart_mode
+from vizlab.pages.common import remember_chart
+from vizlab.pages.filtering import filtered_dataset
+from vizlab.pairgrid import DEFAULT_PANEL_ROWS
+from vizlab.plotly_charts import build_plotly
+from vizlab.profile import get_profile
+
+
+def show(metrics):
+    st.markdown("<div class='page-title'>Interactive Visuals (Plotly)</div>", unsafe_allow_html=True)
+    st.markdown("<div class='subtitle'>Explore data using interactive charts</div>", unsafe_allow_html=True)
+
+    if "df" not in st.session_state:
+        st.warning("Please upload a dataset first.")
+    else:
+        df, dataset_key = filtered_dataset(metrics)
+        with metrics.stage("profile"):
+            profile = get_profile(df, dataset_key)
+
+        numeric_cols = profile.numeric_cols
+        categorical_cols = profile.categorical_cols
+        all_cols = profile.all_cols
+
+        chart_category = st.selectbox(
+            "Chart Category",
+            ["Basic", "Statistical", "Hierarchical", "Advanced", "Financial"]
+        )
+
+        chart_map = {
+    "Basic": ["Line", "Bar", "Scatter", "Bubble", "Area"],
+    "Statistical": [
+        "Histogram", "Box", "Violin", "Strip",
+        "Density Contour", "Density Heatmap",
+        "Scatter Matrix", "Parallel Coordinates"
+    ],
+    "Hierarchical": ["Pie", "Tree Map", "Sunburst", "Funnel"],
+    "Maps": ["Scatter Map", "Choropleth Map"],
+    "Advanced": ["3D Scatter", "Facet Scatter", "Heatmap"],
+    "Financial": ["Candlestick", "Waterfall"]
+}
+
+
+        chart_type = st.selectbox("Chart Type", chart_map[chart_category])
+
+        st.markdown("</div>", unsafe_allow_html=True)
+        st.markdown("<br>", unsafe_allow_html=True)
+
+
+        # -------- COLUMN SELECTION --------
+        if chart_type in ["Line", "Scatter", "Area"]:
+            x = st.selectbox("X-axis", all_cols)
+            y = st.selectbox("Y-axis", numeric_cols)
+            params = (x, y)
+
+        elif chart_type == "Bar":
+            x = st.selectbox("X-axis", all_cols)
+            y = st.selectbox("Y-axis", numeric_cols)
+            agg = st.selectbox("Aggregation", AGGREGATIONS)
+            params = (x, y, agg)
+
+        elif chart_type == "Bubble":
+            x = st.selectbox("X-axis", all_cols)
+            y = st.selectbox("Y-axis", numeric_cols)
+            size = st.selectbox("Bubble Size", numeric_cols)
+            params = (x, y, size)
+
+        elif chart_type == "Histogram":
+            x = st.selectbox("Column", numeric_cols)
+            bins = st.slider("Bins", 5, 200, 30)
+            params = (x, bins)
+
+        elif chart_type in ["Box", "Violin", "Strip"]:
+            x = st.selectbox("Category", categorical_cols)
+            y = st.selectbox("Value", numeric_cols)
+            top_n = st.number_input("Top categories (the rest are grouped as Other; 0 = all)", 0, value=DEFAULT_TOP_N)
+            params = (x, y, top_n)
+
+        elif chart_type in ["Density Contour", "Density Heatmap"]:
+            x = st.selectbox("X-axis", numeric_cols)
+            y = st.selectbox("Y-axis", numeric_cols)
+            bins = st.slider("Bins per axis", 5, 200, 50)
+            params = (x, y, bins)
+
+        elif chart_type == "Heatmap":
+            x = st.selectbox("X-axis", numeric_cols)
+            y = st.selectbox("Y-axis", numeric_cols)
+            method = st.selectbox("Correlation Method", CORR_METHODS)
+            params = (x, y, method)
+
+        elif chart_type == "Scatter Matrix":
+            dims = st.multiselect("Dimensions", numeric_cols, default=numeric_cols[:4])
+            panel_rows = st.number_input("Rows per panel (0 = all rows)", 0, value=DEFAULT_PANEL_ROWS, step=1000)
+            params = (dims, panel_rows)
+
+        elif chart_type == "Parallel Coordinates":
+            color = st.selectbox("Color", numeric_cols)
+            params = (color,)
+
+        elif chart_type in ["Pie", "Funnel"]:
+            names = st.selectbox("Category", categorical_cols)
+            values = st.selectbox("Values", numeric_cols)
+            agg = st.selectbox("Aggregation", AGGREGATIONS)
+            params = (names, values, agg)
+
+        elif chart_type == "Scatter Map":
+            lat = st.selectbox("Latitude", numeric_cols)
+            lon = st.selectbox("Longitude", numeric_cols)
+            color = st.selectbox("Color (optional)", ["None"] + numeric_cols)
+            params = (lat, lon, color)
+
+        elif chart_type == "Choropleth Map":
+            location = st.selectbox("Location Column (Country/State)", categorical_cols)
+            value = st.selectbox("Value Column", numeric_cols)
+            params = (location, value)
+
+        elif chart_type in ["Tree Map", "Sunburst"]:
+            path = st.multiselect("Hierarchy", categorical_cols, default=categorical_cols[:2])
+            values = st.selectbox("Values", numeric_cols)
+            agg = st.selectbox("Aggregation", AGGREGATIONS)
+            params = (path, values, agg)
+
+        elif chart_type == "3D Scatter":
+            x = st.selectbox("X-axis", numeric_cols)
+            y = st.selectbox("Y-axis", numeric_cols)
+            z = st.selectbox("Z-axis", numeric_cols)
+            params = (x, y, z)
+
+        elif chart_type in ["Facet Scatter", "Facet Animated Scatter"]:
+            x = st.selectbox("X-axis", numeric_cols)
+            y = st.selectbox("Y-axis", numeric_cols)
+            color = st.selectbox("Color", categorical_cols)
+            facet = st.selectbox("Facet Column", categorical_cols)
+            params = (x, y, color, facet)
+
+        elif chart_type == "Candlestick":
+            x = st.selectbox("Time", all_cols)
+            open_ = st.selectbox("Open", numeric_cols)
+            high = st.selectbox("High", numeric_cols)
+            low = st.selectbox("Low", numeric_cols)
+            close = st.selectbox("Close", numeric_cols)
+            params = (x, open_, high, low, close)
+
+        elif chart_type == "Waterfall":
+            x = st.selectbox("Category", all_cols)
+            y = st.selectbox("Values", numeric_cols)
+            params = (x, y)
+
+        # -------- LARGE DATA MODE --------
+        mode = None
+        if chart_type in SCATTER_CHARTS:
+            with st.expander("Large Data Settings"):
+                webgl_threshold = st.number_input("Use WebGL above (rows)", 0, 100_000_000, WEBGL_THRESHOLD, step=1_000)
+                density_threshold = st.number_input("Use density image above (rows)", 0, 1_000_000_000, DENSITY_THRESHOLD, step=10_000)
+
+            mode, sample_n = chart_mode(chart_type, len(df), x in numeric_cols, webgl_threshold, density_threshold)
+            params = params + (mode, sample_n)
+
+        # -------- DOWNSAMPLING --------
+        if chart_type in ["Line", "Area", "Candlestick"]:
+            with st.expander("Downsampling"):
+                chart_width = st.number_input("Chart width (px)", 200, 8000, DEFAULT_WIDTH, step=100)
+                if chart_type == "Candlestick":
+                    n_candles = candle_count(chart_width)
+                    st.caption(f"Up to {n_candles:,} candles")
+                    params = params + (n_candles,)
+                else:
+                    method = st.selectbox("Method", METHODS)
+                    params = params + (method, chart_width)
+
+        st.markdown("</div>", unsafe_allow_html=True)
+        st.markdown("<br>", unsafe_allow_html=True)
+
+        generate = st.button("Generate Chart", type="primary")
+        if generate:
+            key = figure_key(dataset_key, "plotly", chart_type, params)
+            fig = FIGURE_CACHE.get(key) if key else None
+
+            if fig is None:
+                with metrics.stage("build"):
+                    fig = build_plotly(df, chart_type, params, dataset_key)
+                if key:
+                    FIGURE_CACHE.put(key, fig)
+
+            st.session_state["last_plot"] = fig
+            st.session_state["plot_lib"] = "plotly"
+            remember_chart(chart_record("plotly", chart_type, params, fig, dataset_key))
+            with metrics.stage("transfer") as stage:
+                if metrics.detailed:
+                    stage.add_payload(len(fig.to_json()))
+                st.plotly_chart(fig, use_container_width=True)
+            if mode is not None:
+                st.caption(f"Render mode: {MODE_LABELS[mode]} for {len(df):,} rows")
+            if chart_type in ["Line", "Area", "Candlestick"]:
+                st.caption(f"Drawing {len(fig.data[0].x):,} of {len(df):,} rows")
+            st.caption(figure_cache_summary())
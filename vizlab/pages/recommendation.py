@@ -0,0 +1,83 @@
+"""Chart Recommendation Engine page."""
+
+import pandas as pd
+import streamlit as st
+
+from vizlab.pages.filtering import filtered_dataset
+from vizlab.profile import get_profile
+from vizlab.recommend import column_stats, format_bytes, recommend
+
+
+def show(metrics):
+    st.markdown("<div class='page-title'>Chart Recommendation Engine</div>", unsafe_allow_html=True)
+    st.markdown("<div class='subtitle'>Choose the right chart based on your data</div>", unsafe_allow_html=True)
+
+    if "df" not in st.session_state:
+        st.warning("Please upload a dataset first from the Dataset Overview page.")
+    else:
+        df, dataset_key = filtered_dataset(metrics)
+        with metrics.stage("profile"):
+            profile = get_profile(df, dataset_key)
+
+        all_cols = profile.all_cols
+
+
+
+        col1, col2 = st.columns(2)
+        with col1:
+            x_col = st.selectbox("Select X-axis column", all_cols)
+        with col2:
+            y_col = st.selectbox("Select Y-axis column (optional)", ["None"] + all_cols)
+
+        st.markdown("</div>", unsafe_allow_html=True)
+        st.markdown("<br>", unsafe_allow_html=True)
+
+        # ------------------ RECOMMENDATION LOGIC ------------------
+        summary = st.session_state.get("stream_summary")
+        if dataset_key != st.session_state.get("dataset_key"):
+            # A filtered sample no longer stands for the whole stream.
+            summary = None
+        n_rows = summary.rows if summary is not None else profile.rows
+        y = None if y_col == "None" else y_col
+        with metrics.stage("recommend"):
+            recommendations = recommend(profile, x_col, y, n_rows)
+
+        st.markdown("<h4>Column Statistics</h4>", unsafe_allow_html=True)
+        st.dataframe(pd.DataFrame(
+            [column_stats(profile, col, n_rows) for col in dict.fromkeys(c for c in (x_col, y) if c)]
+        ), hide_index=True)
+
+        # ------------------ DISPLAY RECOMMENDATIONS ------------------
+
+        st.markdown("<h4>Recommended Charts</h4>", unsafe_allow_html=True)
+
+        for rec in recommendations:
+            cost = rec["cost"]
+            lines = [
+                f"Why: {rec['reason']}",
+                f"When not to use: {rec['caution']}",
+                f"Render cost: {cost['marks']:,} marks, about {format_bytes(cost['payload'])} sent to the browser",
+            ]
+            variant = rec["variant"]
+            if variant is not None:
+                lines.append(
+                    f"Large-data variant: <b>{variant['name']}</b> "
+                    f"({variant['marks']:,} marks, about {format_bytes(variant['payload'])}). {variant['note']}"
+                )
+            lines.extend(rec["notes"])
+            where = f" · {rec['page']}" if rec["page"] else ""
+            st.markdown(f"""
+            <b>{rec['chart']}</b> <span class="small-text">(score {rec['score']}{where})</span><br>
+            <span class="small-text">
+            {"<br>".join(lines)}
+            </span>
+            <hr>
+            """, unsafe_allow_html=True)
+
+        st.markdown("</div>", unsafe_allow_html=True)
+
+
+    st.info(
+    "Select a chart category, choose one chart type, then provide required columns. "
+    "Only one chart is generated at a time to keep analysis clear."
+)
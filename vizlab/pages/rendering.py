@@ -0,0 +1,73 @@
+"""Matplotlib and Seaborn rendering for the static chart pages.
+
+Charts of large datasets go to the render pool. The page shows the pending
+job's status and returns; a fragment checks the job again every
+``POLL_INTERVAL`` seconds and reruns the page once it has finished.
+"""
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import streamlit as st
+
+from vizlab.figcache import FIGURE_CACHE
+from vizlab.render_pool import submit_render, use_pool
+from vizlab.static_charts import render_static
+
+POLL_INTERVAL = 0.5
+
+
+def render_chart(df, dataset_key, key, spec):
+    """PNG bytes for a static chart, or None while it renders in the worker pool."""
+    if not use_pool(df, dataset_key):
+        png = render_static(df, dataset_key=dataset_key, **spec)
+        if key:
+            FIGURE_CACHE.put(key, png)
+        return png
+    if "render_job" in st.session_state:
+        st.session_state.pop("render_job").cancel()
+    st.session_state["render_job"] = submit_render(df, dataset_key, spec, key)
+    return None
+
+
+@st.fragment(run_every=POLL_INTERVAL)
+def _render_status():
+    job = st.session_state.get("render_job")
+    if job is None:
+        return
+    if job.done:
+        st.rerun()
+    st.caption(f"{job.chart_type}: {job.status} in a background worker ({job.elapsed:.1f} s)")
+
+
+def collect_render(library):
+    """PNG bytes of this page's pending render once it has finished.
+
+    While the job is pending, shows its status and a cancel button and
+    returns None without waiting for it.
+    """
+    job = st.session_state.get("render_job")
+    if job is None or job.library != library:
+        return None
+    if not job.done:
+        if st.button("Cancel rendering"):
+            del st.session_state["render_job"]
+            if job.cancel():
+                st.info("Rendering cancelled.")
+            else:
+                st.info("The chart was already rendering. Its worker finishes it in the "
+                        "background and the result is discarded.")
+            return None
+        _render_status()
+        return None
+
+    del st.session_state["render_job"]
+    try:
+        png = job.result()
+    except Exception as e:
+        st.error(f"Rendering failed: {e}")
+        return None
+    if job.cache_key:
+        FIGURE_CACHE.put(job.cache_key, png)
+    return png
@@ -0,0 +1,93 @@
+"""Seaborn Statistical Insights page."""
+
+import streamlit as st
+
+from vizlab.categories import DEFAULT_TOP_N
+from vizlab.correlation import METHODS as CORR_METHODS, correlation
+from vizlab.export import chart_record
+from vizlab.figcache import FIGURE_CACHE, figure_key, figure_cache_summary
+from vizlab.pages.common import remember_chart
+from vizlab.pages.filtering import filtered_dataset
+from vizlab.pages.rendering import collect_render, render_chart
+from vizlab.pairgrid import DEFAULT_PANEL_ROWS
+from vizlab.profile import get_profile
+
+
+def show(metrics):
+    st.markdown("<div class='page-title'>Seaborn Statistical Insights</div>", unsafe_allow_html=True)
+    st.markdown("<div class='subtitle'>Explore distributions and relationships</div>", unsafe_allow_html=True)
+
+    if "df" not in st.session_state:
+        st.warning("Please upload a dataset first.")
+    else:
+        df, dataset_key = filtered_dataset(metrics)
+        with metrics.stage("profile"):
+            profile = get_profile(df, dataset_key)
+        numeric_cols = profile.numeric_cols
+        categorical_cols = profile.categorical_cols
+
+        st.info("Seaborn is ideal for statistical exploration and pattern detection.")
+
+        chart_type = st.selectbox(
+            "Select Chart Type",
+            ["Count Plot", "Box Plot", "Violin Plot", "Pair Plot", "Correlation Heatmap"]
+        )
+
+        if chart_type == "Count Plot":
+            x = st.selectbox("Category", categorical_cols)
+            top_n = st.number_input("Top categories (the rest are grouped as Other; 0 = all)", 0, value=DEFAULT_TOP_N)
+            params = (x, top_n)
+
+        elif chart_type in ["Box Plot", "Violin Plot"]:
+            x = st.selectbox("Category", categorical_cols)
+            y = st.selectbox("Numeric Value", numeric_cols)
+            top_n = st.number_input("Top categories (the rest are grouped as Other; 0 = all)", 0, value=DEFAULT_TOP_N)
+            params = (x, y, top_n)
+
+        elif chart_type == "Pair Plot":
+            cols = st.multiselect("Select Numeric Columns", numeric_cols, default=numeric_cols[:4])
+            panel_rows = st.number_input("Rows per panel (0 = all rows)", 0, value=DEFAULT_PANEL_ROWS, step=1000)
+            params = (cols, panel_rows)
+
+        elif chart_type == "Correlation Heatmap":
+            cols = st.multiselect("Select Numeric Columns", numeric_cols, default=numeric_cols)
+            method = st.selectbox("Correlation Method", CORR_METHODS)
+            params = (cols, method)
+
+        with st.expander("Chart Size Settings"):
+            width = st.slider("Width", 1, 10, 2)
+            height = st.slider("Height", 1, 10, 3)
+
+        # ---------------------------------
+        # SAFE DEFAULT
+        png = None
+
+        # ---------------------------------
+        if st.button("Generate Seaborn Chart", type="primary"):
+            # Pair plots size themselves, so the size sliders are not part of their key.
+            size = None if chart_type == "Pair Plot" else (width, height)
+            key = figure_key(dataset_key, "seaborn", chart_type, params, size)
+            png = FIGURE_CACHE.get(key) if key else None
+
+            if png is None:
+                spec = dict(library="seaborn", chart_type=chart_type, params=params, width=width, height=height)
+                if chart_type == "Correlation Heatmap":
+                    with metrics.stage("correlation"):
+                        spec["corr"] = correlation(df, cols, method, dataset_key=dataset_key)
+                with metrics.stage("render"):
+                    png = render_chart(df, dataset_key, key, spec)
+
+        if png is None:
+            with metrics.stage("render"):
+                png = collect_render("seaborn")
+
+        # ---------------------------------
+        # DISPLAY + SAVE
+        if png is not None:
+            st.session_state["last_plot"] = png
+            st.session_state["plot_lib"] = "seaborn"
+            remember_chart(chart_record("seaborn", chart_type, params, png, dataset_key, width, height))
+            with metrics.stage("transfer") as stage:
+                stage.add_payload(len(png))
+                st.image(png, use_container_width=chart_type == "Pair Plot")
+            st.caption(figure_cache_summary())
@@ -0,0 +1,148 @@
+"""Pair-grid engine for the Seaborn Pair Plot and the Plotly Scatter Matrix.
+
+Every panel of a pair grid is independent of the others. The diagonal
+histograms and the off-diagonal point sets are therefore computed
+concurrently on a thread pool (NumPy releases the GIL for the array work) and
+cached one panel at a time. Each off-diagonal panel draws its own uniform
+sample of rows, so drawing cost is bounded by the sample size rather than the
+row count. The grid is then assembled from the finished panels.
+"""
+
+import os
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from vizlab.binning import centers, histogram, values_of
+from vizlab.cache import LRUCache
+
+DEFAULT_PANEL_ROWS = 5_000
+DIAG_BINS = 30
+# Inches per panel, as in sns.pairplot.
+PANEL_SIZE = 2.5
+MAX_THREADS = min(8, os.cpu_count() or 1)
+
+PANEL_CACHE = LRUCache(max_entries=256, max_bytes=128 * 1024 ** 2, sizeof=lambda v: sum(a.nbytes for a in v))
+
+
+def panel_points(df, x, y, panel_rows=DEFAULT_PANEL_ROWS, seed=0):
+    """``(xs, ys)`` of the rows where both columns are finite, uniformly
+    sampled down to ``panel_rows`` (0 or None keeps every row)."""
+    xs, ys = values_of(df, x), values_of(df, y)
+    rows = np.flatnonzero(np.isfinite(xs) & np.isfinite(ys))
+    if panel_rows and rows.size > panel_rows:
+        # Seeded per pair, so a panel looks the same whatever else is selected.
+        rng = np.random.default_rng([seed, zlib.crc32(f"{x}\0{y}".encode())])
+        rows = np.sort(rng.choice(rows, size=panel_rows, replace=False))
+    return xs[rows], ys[rows]
+
+
+def pair_panels(df, cols, panel_rows=DEFAULT_PANEL_ROWS, seed=0, dataset_key=None):
+    """Compute every panel of the pair grid over ``cols`` in parallel.
+
+    Returns ``(diagonal, offdiag)``. ``diagonal[col]`` is ``(counts, edges)``.
+    ``offdiag[(i, j)]``, for ``i > j``, is ``(xs, ys)`` with ``cols[j]`` on x
+    and ``cols[i]`` on y. The upper triangle mirrors the lower one.
+    """
+    cols = list(cols)
+
+    def off(x, y):
+        if dataset_key is None:
+            return panel_points(df, x, y, panel_rows, seed)
+        key = ("pair", dataset_key, x, y, panel_rows, seed)
+        return PANEL_CACHE.get_or_compute(key, lambda: panel_points(df, x, y, panel_rows, seed))
+
+    with ThreadPoolExecutor(max_workers=MAX_THREADS) as pool:
+        diag_jobs = {c: pool.submit(histogram, df, c, DIAG_BINS, dataset_key=dataset_key) for c in cols}
+        off_jobs = {
+            (i, j): pool.submit(off, cols[j], cols[i])
+            for i in range(len(cols)) for j in range(i)
+        }
+        diagonal = {c: job.result() for c, job in diag_jobs.items()}
+        offdiag = {ij: job.result() for ij, job in off_jobs.items()}
+    return diagonal, offdiag
+
+
+def _points(offdiag, i, j):
+    if i > j:
+        return offdiag[(i, j)]
+    ys, xs = offdiag[(j, i)]
+    return xs, ys
+
+
+def _limits(edges, pad=0.05):
+    span = edges[-1] - edges[0]
+    return edges[0] - pad * span, edges[-1] + pad * span
+
+
+def pairplot_figure(cols, diagonal, offdiag, panel_size=PANEL_SIZE):
+    """Matplotlib pair grid laid out like ``sns.pairplot``."""
+    # Imported here so the Plotly scatter matrix does not load Matplotlib.
+    from vizlab.figures import new_figure
+
+    cols = list(cols)
+    n = len(cols)
+    if n == 0:
+        raise ValueError("Select at least one column for the pair plot.")
+    fig, axes = new_figure(panel_size * n, panel_size * n, nrows=n, ncols=n, squeeze=False)
+    limits = [_limits(diagonal[c][1]) for c in cols]
+
+    for i in range(n):
+        for j in range(n):
+            ax = axes[i, j]
+            if i == j:
+                counts, edges = diagonal[cols[i]]
+                ax.hist(edges[:-1], bins=edges, weights=counts, color="C0", edgecolor="white", linewidth=0.5)
+                ax.tick_params(labelleft=False)
+            else:
+                xs, ys = _points(offdiag, i, j)
+                ax.scatter(xs, ys, s=8, color="C0", linewidth=0)
+                ax.set_ylim(limits[i])
+            ax.set_xlim(limits[j])
+            ax.spines[["top", "right"]].set_visible(False)
+            if i == n - 1:
+                ax.set_xlabel(cols[j])
+            else:
+                ax.tick_params(labelbottom=False)
+            if j == 0:
+                ax.set_ylabel(cols[i])
+            elif i != j:
+                ax.tick_params(labelleft=False)
+    fig.tight_layout()
+    return fig
+
+
+def scatter_matrix_figure(cols, diagonal, offdiag):
+    """Plotly pair grid: WebGL scatter panels with histograms on the diagonal."""
+    cols = list(cols)
+    n = len(cols)
+    if n == 0:
+        return go.Figure()
+    fig = make_subplots(rows=n, cols=n, horizontal_spacing=0.02, vertical_spacing=0.02)
+    limits = [_limits(diagonal[c][1]) for c in cols]
+
+    for i in range(n):
+        for j in range(n):
+            if i == j:
+                counts, edges = diagonal[cols[i]]
+                trace = go.Bar(
+                    x=centers(edges), y=counts, width=np.diff(edges),
+                    marker_color="#636efa", marker_line_width=0, name=cols[i],
+                )
+            else:
+                xs, ys = _points(offdiag, i, j)
+                trace = go.Scattergl(
+                    x=xs, y=ys, mode="markers", marker=dict(size=3, color="#636efa", opacity=0.6),
+                    name=f"{cols[j]} vs {cols[i]}",
+                )
+                fig.update_yaxes(range=limits[i], row=i + 1, col=j + 1)
+            fig.add_trace(trace, row=i + 1, col=j + 1)
+            fig.update_xaxes(range=limits[j], showticklabels=i == n - 1, row=i + 1, col=j + 1)
+            fig.update_yaxes(showticklabels=j == 0 and i != j, row=i + 1, col=j + 1)
+        fig.update_xaxes(title_text=cols[i], row=n, col=i + 1)
+        fig.update_yaxes(title_text=cols[i], row=i + 1, col=1)
+    fig.update_layout(showlegend=False, bargap=0, height=max(450, 150 * n))
+    return fig
@@ -0,0 +1,166 @@
+"""Plotly chart builders.
+
+Each chart is described by its chart type and the ``params`` tuple the Plotly
+page collects for it, and comes back as a ``go.Figure``. The page,
+``vizlab.charts`` and the batch CLI all build charts through here.
+"""
+
+import plotly.express as px
+import plotly.graph_objects as go
+
+from vizlab.aggregate import aggregate, aggregate_label
+from vizlab.binning import contour_figure, heatmap_figure, histogram, histogram2d, histogram_figure
+from vizlab.categories import collapse
+from vizlab.correlation import correlation
+from vizlab.downsample import downsample, resample_ohlc, target_points
+from vizlab.largedata import density_figure, facet_density_figure, sample_rows
+from vizlab.pairgrid import pair_panels, scatter_matrix_figure
+from vizlab.summaries import box_figure, group_summary, use_summary, violin_figure
+
+
+def build_plotly(df, chart_type, params, dataset_key=None):
+    """Build one Plotly chart; ``dataset_key`` lets it reuse cached bins and aggregates."""
+    if chart_type == "Line":
+        x, y, method, chart_width = params
+        fig = px.line(downsample(df, x, y, target_points(chart_width), method), x=x, y=y)
+
+    elif chart_type == "Bar":
+        x, y, agg = params
+        grouped = aggregate(df, x, y, agg, dataset_key=dataset_key)
+        fig = px.bar(grouped, x=x, y=aggregate_label(y, agg))
+
+    elif chart_type == "Scatter":
+        x, y, mode, sample_n = params
+        if mode == "density":
+            fig = density_figure(df, x, y, dataset_key=dataset_key)
+        else:
+            fig = px.scatter(df, x=x, y=y, render_mode=mode)
+
+    elif chart_type == "Bubble":
+        x, y, size, mode, sample_n = params
+        if mode == "density":
+            fig = density_figure(df, x, y, dataset_key=dataset_key)
+        else:
+            fig = px.scatter(df, x=x, y=y, size=size, render_mode=mode)
+
+    elif chart_type == "Area":
+        x, y, method, chart_width = params
+        fig = px.area(downsample(df, x, y, target_points(chart_width), method), x=x, y=y)
+
+    elif chart_type == "Histogram":
+        x, bins = params
+        counts, edges = histogram(df, x, bins, dataset_key=dataset_key)
+        fig = histogram_figure(counts, edges, x)
+
+    elif chart_type == "Box":
+        x, y, top_n = params
+        if use_summary(df):
+            fig = box_figure(group_summary(df, x, y, top_n, dataset_key=dataset_key), x, y)
+        else:
+            fig = px.box(collapse(df, x, top_n, dataset_key=dataset_key), x=x, y=y)
+
+    elif chart_type == "Violin":
+        x, y, top_n = params
+        if use_summary(df):
+            fig = violin_figure(group_summary(df, x, y, top_n, dataset_key=dataset_key), x, y)
+        else:
+            fig = px.violin(collapse(df, x, top_n, dataset_key=dataset_key), x=x, y=y)
+
+    elif chart_type == "Strip":
+        x, y, top_n = params
+        fig = px.strip(collapse(df, x, top_n, dataset_key=dataset_key), x=x, y=y)
+
+    elif chart_type == "Density Contour":
+        x, y, bins = params
+        counts, x_edges, y_edges = histogram2d(df, x, y, bins, dataset_key=dataset_key)
+        fig = contour_figure(counts, x_edges, y_edges, x, y)
+
+    elif chart_type == "Density Heatmap":
+        x, y, bins = params
+        counts, x_edges, y_edges = histogram2d(df, x, y, bins, dataset_key=dataset_key)
+        fig = heatmap_figure(counts, x_edges, y_edges, x, y)
+
+    elif chart_type == "Scatter Matrix":
+        dims, panel_rows = params
+        diagonal, offdiag = pair_panels(df, dims, panel_rows, dataset_key=dataset_key)
+        fig = scatter_matrix_figure(dims, diagonal, offdiag)
+
+    elif chart_type == "Parallel Coordinates":
+        (color,) = params
+        fig = px.parallel_coordinates(df, color=color)
+
+    elif chart_type == "Pie":
+        names, values, agg = params
+        grouped = aggregate(df, names, values, agg, dataset_key=dataset_key)
+        fig = px.pie(grouped, names=names, values=aggregate_label(values, agg))
+
+    elif chart_type == "Funnel":
+        names, values, agg = params
+        grouped = aggregate(df, names, values, agg, dataset_key=dataset_key)
+        fig = px.funnel(grouped, x=aggregate_label(values, agg), y=names)
+
+    elif chart_type == "Tree Map":
+        path, values, agg = params
+        grouped = aggregate(df, path, values, agg, dataset_key=dataset_key)
+        fig = px.treemap(grouped, path=list(path), values=aggregate_label(values, agg))
+
+    elif chart_type == "Sunburst":
+        path, values, agg = params
+        grouped = aggregate(df, path, values, agg, dataset_key=dataset_key)
+        fig = px.sunburst(grouped, path=list(path), values=aggregate_label(values, agg))
+
+    elif chart_type == "3D Scatter":
+        x, y, z, mode, sample_n = params
+        data = sample_rows(df, sample_n) if mode == "sample" else df
+        fig = px.scatter_3d(data, x=x, y=y, z=z)
+
+    elif chart_type == "Facet Scatter":
+        x, y, color, facet, mode, sample_n = params
+        if mode == "density":
+            fig = facet_density_figure(df, x, y, facet)
+        else:
+            fig = px.scatter(df, x=x, y=y, color=color, facet_col=facet, render_mode=mode)
+
+    elif chart_type == "Heatmap":
+        x, y, method = params
+        fig = px.imshow(correlation(df, method=method, dataset_key=dataset_key))
+
+    elif chart_type == "Candlestick":
+        x, open_, high, low, close, n_candles = params
+        ohlc = resample_ohlc(df, x, open_, high, low, close, n_candles)
+        fig = go.Figure(data=[go.Candlestick(
+            x=ohlc["x"],
+            open=ohlc["open"],
+            high=ohlc["high"],
+            low=ohlc["low"],
+            close=ohlc["close"]
+        )])
+
+    elif chart_type == "Scatter Map":
+        lat, lon, color = params
+        fig = px.scatter_mapbox(
+            df,
+            lat=lat,
+            lon=lon,
+            color=None if color == "None" else color,
+            zoom=1,
+            height=550
+        )
+        fig.update_layout(mapbox_style="open-street-map")
+
+    elif chart_type == "Choropleth Map":
+        location, value = params
+        fig = px.choropleth(
+            df,
+            locations=location,
+            locationmode="country names",
+            color=value
+        )
+
+    elif chart_type == "Waterfall":
+        x, y = params
+        fig = go.Figure(go.Waterfall(x=df[x], y=df[y]))
+
+    else:
+        raise ValueError(f"Unknown Plotly chart type: {chart_type}")
+    return fig
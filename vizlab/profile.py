@@ -0,0 +1,151 @@
+"""Per-dataset profile computed once and shared by every page."""
+
+import copy
+
+import numpy as np
+import pandas as pd
+
+from vizlab.cache import LRUCache
+from vizlab.streaming import ColumnMoments
+
+
+class DatasetProfile:
+    """Column kinds and summary statistics of one dataset version.
+
+    Holds no reference to the frame itself, so cached profiles stay small.
+    """
+
+    def __init__(self, df):
+        self.rows, self.n_columns = df.shape
+        self.all_cols = df.columns.tolist()
+        self.numeric_cols = df.select_dtypes(include="number").columns.tolist()
+        self.categorical_cols = df.select_dtypes(include=["object", "category"]).columns.tolist()
+        self.datetime_cols = df.select_dtypes(include=["datetime", "datetimetz"]).columns.tolist()
+        self.nulls = df.isnull().sum()
+        self.missing = int(self.nulls.sum())
+        self.null_ratio = (self.nulls / max(self.rows, 1)).to_dict()
+        self.cardinality = df.nunique(dropna=True).to_dict()
+        # Mergeable state, so appended rows extend the profile (see ``appended``).
+        self.moments = {c: _moments(df[c]) for c in self.numeric_cols}
+        self.skew = {c: m.skew for c, m in self.moments.items()}
+        self._order = {c: _order(df[c]) for c in self.numeric_cols + self.datetime_cols}
+        self._set_monotonic()
+        self.describe = df.describe()
+
+    def _set_monotonic(self):
+        self.monotonic = {
+            c: _monotonic(order) if self.cardinality[c] > 1 else None
+            for c, order in self._order.items()
+        }
+
+    def appended(self, df, start):
+        """Profile of ``df``, whose first ``start`` rows this profile describes.
+
+        Counts, moments and ordering are merged with those of the new rows.
+        Distinct counts take one membership scan of the old rows against the
+        new rows' distinct values. Quartiles cannot be merged, so the
+        ``describe`` table recomputes only those.
+        """
+        old, rows = df.iloc[:start], df.iloc[start:]
+        out = copy.copy(self)
+        out.rows, out.n_columns = df.shape
+        out.numeric_cols = df.select_dtypes(include="number").columns.tolist()
+        out.categorical_cols = df.select_dtypes(include=["object", "category"]).columns.tolist()
+        out.datetime_cols = df.select_dtypes(include=["datetime", "datetimetz"]).columns.tolist()
+        out.nulls = self.nulls + rows.isnull().sum()
+        out.missing = int(out.nulls.sum())
+        out.null_ratio = (out.nulls / max(out.rows, 1)).to_dict()
+        out.cardinality = {c: self.cardinality[c] + _new_distinct(old[c], rows[c]) for c in out.all_cols}
+        out.moments = {c: self.moments[c].merge(_moments(rows[c])) for c in out.numeric_cols}
+        out.skew = {c: m.skew for c, m in out.moments.items()}
+        out._order = {
+            c: _merge_order(self._order[c], _order(rows[c]))
+            for c in out.numeric_cols + out.datetime_cols
+        }
+        out._set_monotonic()
+        if out.numeric_cols:
+            quartiles = df[out.numeric_cols].quantile([0.25, 0.5, 0.75])
+            out.describe = pd.DataFrame({
+                c: [m.count, m.mean if m.count else np.nan, m.std,
+                    m.min if m.count else np.nan, *quartiles[c], m.max if m.count else np.nan]
+                for c, m in out.moments.items()
+            }, index=["count", "mean", "std", "min", "25%", "50%", "75%", "max"])
+        else:
+            out.describe = df.describe()
+        return out
+
+    @property
+    def minmax(self):
+        return self.describe.loc[["min", "max"]] if len(self.describe.columns) else self.describe
+
+    @property
+    def quantiles(self):
+        return self.describe.loc[["25%", "50%", "75%"]] if len(self.describe.columns) else self.describe
+
+    def kind(self, col):
+        return "numeric" if col in self.numeric_cols else "categorical"
+
+
+def _moments(col):
+    return ColumnMoments.from_values(col.to_numpy(dtype="float64", na_value=np.nan))
+
+
+def _order(col):
+    """``(increasing, decreasing, first, last)`` of the non-missing values, or None."""
+    col = col.dropna()
+    if len(col) == 0:
+        return None
+    return col.is_monotonic_increasing, col.is_monotonic_decreasing, col.iloc[0], col.iloc[-1]
+
+
+def _merge_order(a, b):
+    """Order of the values of ``a`` followed by those of ``b``."""
+    if a is None or b is None:
+        return b if a is None else a
+    return (
+        a[0] and b[0] and a[3] <= b[2],
+        a[1] and b[1] and a[3] >= b[2],
+        a[2], b[3],
+    )
+
+
+def _monotonic(order):
+    """``"increasing"``, ``"decreasing"`` or None, ignoring missing values."""
+    if order is None:
+        return None
+    if order[0]:
+        return "increasing"
+    if order[1]:
+        return "decreasing"
+    return None
+
+
+def _new_distinct(old, rows):
+    """Distinct non-missing values of ``rows`` that ``old`` does not contain."""
+    values = rows.dropna().unique()
+    if len(values) == 0:
+        return 0
+    return len(values) - old[old.isin(values)].nunique()
+
+
+PROFILE_CACHE = LRUCache(max_entries=16)
+
+
+def get_profile(df, key=None):
+    """Profile of ``df``, memoized under its dataset ``key`` (content hash)."""
+    if key is None:
+        return DatasetProfile(df)
+    return PROFILE_CACHE.get_or_compute(key, lambda: DatasetProfile(df))
+
+
+def append_rows(dataset_key, new_key, df, start):
+    """Carry the cached profile of ``dataset_key`` over to ``new_key``, whose
+    frame ``df`` is that dataset with rows appended from position ``start``.
+
+    Returns False when there is nothing cached to extend.
+    """
+    profile = PROFILE_CACHE.get(dataset_key)
+    if profile is None:
+        return False
+    PROFILE_CACHE.put(new_key, profile.appended(df, start))
+    return True
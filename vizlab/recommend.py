@@ -0,0 +1,259 @@
+"""Chart recommendations ranked by column statistics and render cost.
+
+Candidates depend on the kinds of the chosen columns. They are then scored
+from the cached dataset profile: cardinality, null ratio, monotonicity,
+skew and the row count. Each recommendation carries an estimate of what the
+plain chart sends to the browser (marks and JSON payload). When that is too
+heavy, it also names the large-data variant the app can draw instead, such
+as a density heatmap in place of a scatter or the top categories plus
+"Other" in place of a pie.
+"""
+
+from vizlab.categories import DEFAULT_TOP_N as TOP_N
+from vizlab.downsample import DEFAULT_WIDTH, target_points
+from vizlab.largedata import DENSITY_BINS, DENSITY_THRESHOLD, chart_mode
+from vizlab.summaries import KDE_POINTS, MAX_OUTLIERS, SUMMARY_MIN_ROWS
+
+# Roughly one number and its separator in a Plotly figure's JSON.
+BYTES_PER_VALUE = 8
+# Payload above which a chart is considered heavy for the browser.
+PAYLOAD_BUDGET = 2 * 1024 ** 2
+MAX_BAR_CATEGORIES = 50
+MAX_PIE_SLICES = 8
+SKEW_LIMIT = 2.0
+NULL_LIMIT = 0.2
+# A sorted column only reads as a sequence (an index, a time axis) when most
+# of its values are distinct; a sorted measurement with many repeats does not.
+SEQUENCE_DISTINCT = 0.5
+HISTOGRAM_BINS = 30
+CONTOUR_BINS = 50
+
+
+def column_kind(profile, col):
+    if col in profile.numeric_cols:
+        return "numeric"
+    if col in profile.datetime_cols:
+        return "datetime"
+    return "categorical"
+
+
+def cost(marks, values_per_mark=1):
+    """``{"marks", "payload"}`` for a chart drawing ``marks`` marks."""
+    return {"marks": int(marks), "payload": int(marks * values_per_mark * BYTES_PER_VALUE)}
+
+
+def format_bytes(n):
+    for unit in ("B", "KB", "MB", "GB"):
+        if n < 1024 or unit == "GB":
+            return f"{n:,.0f} {unit}" if unit == "B" else f"{n:,.1f} {unit}"
+        n /= 1024
+
+
+def _variant(name, note, marks=None, values_per_mark=1, payload=None):
+    out = {"name": name, "note": note}
+    if marks is not None:
+        out.update(cost(marks, values_per_mark))
+    if payload is not None:
+        out["payload"] = payload
+    return out
+
+
+def _rec(chart, page, reason, caution, fit, raw, variant=None, notes=()):
+    return {
+        "chart": chart,
+        "page": page,
+        "reason": reason,
+        "caution": caution,
+        "fit": fit,
+        "cost": raw,
+        "variant": variant,
+        "notes": list(notes),
+    }
+
+
+def _points(chart, n_rows, x_numeric, values_per_mark):
+    """Scatter-type chart: raw cost and the variant the render mode picks."""
+    raw = cost(n_rows, values_per_mark)
+    mode, _ = chart_mode(chart, n_rows, x_numeric)
+    variant = None
+    if mode == "density":
+        variant = _variant(
+            "Density heatmap", f"Drawn automatically above {DENSITY_THRESHOLD:,} rows; "
+            f"{DENSITY_BINS}x{DENSITY_BINS} bins instead of one point per row.",
+            DENSITY_BINS ** 2,
+        )
+    elif raw["payload"] > PAYLOAD_BUDGET:
+        variant = _variant(
+            "WebGL scatter", "Every point is still sent, but drawn on the GPU.",
+            n_rows, values_per_mark,
+        )
+    return raw, variant
+
+
+def _categories(profile, col, limit, top, chart_label):
+    """Raw cost and top-N variant for a chart with one mark per category."""
+    k = profile.cardinality.get(col, 0)
+    raw = cost(k, 2)
+    variant = None
+    if k > limit:
+        variant = _variant(
+            f"Top {top} + Other", f"{k:,} categories are too many for a {chart_label}; "
+            f"keep the {top} largest and group the rest as 'Other'.", top + 1, 2,
+        )
+    return raw, variant
+
+
+def _candidates(profile, x, y, n_rows):
+    xk = column_kind(profile, x)
+    yk = None if y is None else column_kind(profile, y)
+
+    if yk == "categorical" and xk != "categorical":
+        x, y, xk, yk = y, x, yk, xk
+
+    if xk in ("numeric", "datetime") and yk == "numeric":
+        ordered = xk == "datetime" or (
+            profile.monotonic.get(x) is not None
+            and profile.cardinality.get(x, 0) >= SEQUENCE_DISTINCT * profile.rows
+        )
+        recs = []
+        raw, variant = _points("Scatter", n_rows, xk == "numeric", 2)
+        recs.append(_rec(
+            "Scatter Plot", "Interactive Visuals (Plotly)",
+            "Shows relationship between two numeric variables.",
+            "Avoid when data has strong time order.", 60 if ordered else 80, raw, variant,
+        ))
+        line_points = target_points(DEFAULT_WIDTH)
+        line_variant = None
+        if n_rows > line_points:
+            line_variant = _variant(
+                "Downsampled line", f"Min/Max downsampling keeps {line_points:,} points "
+                "with every peak and dip.", line_points, 2,
+            )
+        notes = []
+        if ordered:
+            notes.append(f"{x} is {'a date/time column' if xk == 'datetime' else 'sorted'}, "
+                         "so it reads as a sequence.")
+        recs.append(_rec(
+            "Line Chart", "Interactive Visuals (Plotly)",
+            "Useful if one variable represents time or sequence.",
+            "Not ideal for unordered numeric data.", 90 if ordered else 35,
+            cost(n_rows, 2), line_variant, notes,
+        ))
+        if xk == "numeric":
+            recs.append(_rec(
+                "Density Heatmap", "Interactive Visuals (Plotly)",
+                "Helps understand data concentration.",
+                "Avoid for small datasets.", 50 if n_rows < 1_000 else 75,
+                cost(CONTOUR_BINS ** 2),
+            ))
+        p = len(profile.numeric_cols)
+        recs.append(_rec(
+            "Correlation Heatmap", "Seaborn (Statistical Insights)",
+            "Shows strength of relationship.",
+            "Not meaningful with very few observations.", 55 if n_rows >= 30 else 20,
+            cost(p * p),
+        ))
+        return recs
+
+    if xk == "categorical" and yk == "numeric":
+        raw, variant = _categories(profile, x, MAX_BAR_CATEGORIES, TOP_N, "bar chart")
+        recs = [_rec(
+            "Bar Chart", "Interactive Visuals (Plotly)",
+            "Compares numeric values across categories.",
+            "Avoid when too many categories.", 85, raw, variant,
+        )]
+        k = profile.cardinality.get(x, 0)
+        groups = min(k, TOP_N + 1)
+        # Plotly's box and violin traces carry every row's value; above
+        # SUMMARY_MIN_ROWS the app draws them from per-group summaries.
+        for chart, reason, caution, per_group in [
+            ("Box Plot", "Shows distribution and outliers.", "Not ideal for small samples.", 6 + MAX_OUTLIERS),
+            ("Violin Plot", "Shows distribution shape.", "May confuse non-technical users.", 5 + 2 * KDE_POINTS),
+        ]:
+            raw = cost(n_rows, 2)
+            variant = None
+            if n_rows >= SUMMARY_MIN_ROWS:
+                variant = _variant(
+                    "Precomputed summary", f"Quartiles, whiskers, up to {MAX_OUTLIERS} outliers and a "
+                    "density curve per group, computed once instead of sending every row.",
+                    groups, per_group,
+                )
+            fit = (70 if n_rows >= 50 else 40) - (15 if k > MAX_BAR_CATEGORIES else 0)
+            notes = []
+            if k > TOP_N:
+                notes.append(f"Only the {TOP_N} most frequent of {k:,} categories get their own group; "
+                             "the rest are drawn as 'Other'.")
+            recs.append(_rec(chart, "Interactive Visuals (Plotly)", reason, caution, fit, raw, variant, notes))
+        return recs
+
+    if xk in ("numeric", "datetime") and yk is None:
+        notes = []
+        skew = profile.skew.get(x)
+        if skew is not None and abs(skew) > SKEW_LIMIT:
+            notes.append(f"{x} is strongly skewed (skew {skew:.1f}); a log scale may show more.")
+        return [
+            _rec("Histogram", "Interactive Visuals (Plotly)", "Shows distribution of values.",
+                 "Bin size can mislead interpretation.", 85, cost(HISTOGRAM_BINS, 2), notes=notes),
+            _rec("Density Plot", None, "Smooth distribution estimation.",
+                 "Avoid for very small datasets.", 65 if n_rows >= 100 else 30, cost(200, 2), notes=notes),
+        ]
+
+    if xk == "categorical" and yk is None:
+        bar_raw, bar_variant = _categories(profile, x, MAX_BAR_CATEGORIES, TOP_N, "bar chart")
+        pie_raw, pie_variant = _categories(profile, x, MAX_PIE_SLICES, MAX_PIE_SLICES - 1, "pie chart")
+        k = profile.cardinality.get(x, 0)
+        return [
+            _rec("Bar Chart", "Seaborn (Statistical Insights)", "Shows frequency of categories.",
+                 "Avoid when categories are too many.", 85, bar_raw, bar_variant),
+            _rec("Pie Chart", "Interactive Visuals (Plotly)", "Shows proportion of categories.",
+                 "Not good for precise comparisons.", 60 if k <= MAX_PIE_SLICES else 25, pie_raw, pie_variant),
+        ]
+
+    return [_rec("Table View", "Dataset Overview", "Best for mixed or unclear data.",
+                 "Visualization may not add value here.", 50, cost(0))]
+
+
+def _score(rec, columns, profile):
+    score = rec["fit"]
+    effective = rec["variant"] or rec["cost"]
+    if effective.get("payload", 0) > PAYLOAD_BUDGET:
+        score -= 30
+    elif rec["variant"] is not None:
+        score -= 5
+    for col in columns:
+        ratio = profile.null_ratio.get(col, 0.0)
+        if ratio > NULL_LIMIT:
+            score -= 20 * ratio
+            note = f"{col} is {ratio:.0%} missing; those rows are left out."
+            if note not in rec["notes"]:
+                rec["notes"].append(note)
+    return score
+
+
+def recommend(profile, x, y=None, n_rows=None):
+    """Ranked recommendations for plotting ``x`` (and ``y``); best first.
+
+    ``n_rows`` overrides the profile's row count, for streamed datasets whose
+    profile covers only a sample.
+    """
+    n_rows = profile.rows if n_rows is None else n_rows
+    columns = [c for c in (x, y) if c is not None]
+    recs = _candidates(profile, x, y, n_rows)
+    for rec in recs:
+        rec["score"] = round(_score(rec, columns, profile))
+    return sorted(recs, key=lambda r: -r["score"])
+
+
+def column_stats(profile, col, n_rows=None):
+    """The statistics the ranking used for ``col``, for display."""
+    monotonic = profile.monotonic.get(col)
+    skew = profile.skew.get(col)
+    return {
+        "Column": col,
+        "Kind": column_kind(profile, col),
+        "Rows": profile.rows if n_rows is None else n_rows,
+        "Distinct": profile.cardinality.get(col, 0),
+        "Missing": f"{profile.null_ratio.get(col, 0.0):.1%}",
+        "Order": monotonic or "unsorted",
+        "Skew": None if skew is None else round(skew, 2),
+    }
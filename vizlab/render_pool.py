@@ -0,0 +1,322 @@
+"""Process pool that renders Matplotlib and Seaborn charts off the script thread.
+
+Each dataset is copied once into a ``multiprocessing.shared_memory`` block,
+with one contiguous array per column. Jobs only send a small handle that
+describes that block plus the chart spec. Workers map the columns without
+copying them, build the chart with ``vizlab.static_charts`` and return PNG
+bytes. Several sessions can then render heavy statistical plots at once
+without blocking each other's script threads.
+"""
+
+import atexit
+import multiprocessing as mp
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from vizlab.cache import LRUCache
+from vizlab.ingest import DATASET_STORE
+from vizlab.static_charts import render_static
+from vizlab.store import DEFAULT_BUDGET
+
+MAX_WORKERS = int(os.environ.get("VIZLAB_RENDER_WORKERS", min(4, os.cpu_count() or 1)))
+# Below this many rows, shipping the job costs more than rendering it inline.
+POOL_MIN_ROWS = 20_000
+
+_ALIGN = 64
+
+
+# ------------------ SHARED FRAMES ------------------
+
+def _column_array(col):
+    """``(array, categories)`` for one column in a shared-memory friendly form."""
+    if isinstance(col.dtype, pd.CategoricalDtype):
+        return col.cat.codes.to_numpy(), list(col.cat.categories)
+    if isinstance(col.dtype, np.dtype) and col.dtype.kind in "biufmM":
+        return col.to_numpy(), None
+    if pd.api.types.is_numeric_dtype(col) and not pd.api.types.is_bool_dtype(col):
+        # Nullable integer and float extension columns.
+        return col.to_numpy(dtype="float64", na_value=np.nan), None
+    # Strings, objects and nullable booleans travel as category codes.
+    cat = pd.Categorical(col)
+    return cat.codes, list(cat.categories)
+
+
+def share_frame(df):
+    """Copy ``df`` into a new shared-memory block; returns ``(shm, handle)``.
+
+    The handle is a small picklable dict a worker passes to ``attach_frame``.
+    The caller owns ``shm`` and must ``close()`` and ``unlink()`` it.
+    """
+    arrays, columns, offset = [], [], 0
+    for name in df.columns:
+        values, categories = _column_array(df[name])
+        values = np.ascontiguousarray(values)
+        offset = -(-offset // _ALIGN) * _ALIGN
+        columns.append((name, values.dtype.str, offset, categories))
+        arrays.append((offset, values))
+        offset += values.nbytes
+    shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+    for start, values in arrays:
+        np.ndarray(values.shape, values.dtype, buffer=shm.buf, offset=start)[:] = values
+    return shm, {"name": shm.name, "rows": len(df), "columns": columns}
+
+
+def attach_frame(handle):
+    """Map a shared frame without copying; returns ``(shm, df)``.
+
+    Keep ``shm`` open for as long as ``df`` is in use.
+    """
+    shm = shared_memory.SharedMemory(name=handle["name"])
+    data = {}
+    for name, dtype, offset, categories in handle["columns"]:
+        values = np.ndarray(handle["rows"], np.dtype(dtype), buffer=shm.buf, offset=offset)
+        values.flags.writeable = False
+        if categories is not None:
+            values = pd.Categorical.from_codes(values, categories=categories)
+        data[name] = values
+    return shm, pd.DataFrame(data, copy=False)
+
+
+class SharedBlock:
+    """A shared frame plus the number of submitted jobs that still read it."""
+
+    __slots__ = ("shm", "handle", "pins", "dropped")
+
+    def __init__(self, shm, handle):
+        self.shm = shm
+        self.handle = handle
+        self.pins = 0
+        self.dropped = False
+
+    def unlink(self):
+        self.shm.close()
+        try:
+            self.shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _evicted(block):
+    # Only unpinned blocks are evicted, so no queued job still needs this one.
+    block.unlink()
+
+
+# Handles stay valid while their block is cached. A block is pinned while
+# submitted jobs that read it are pending, and only unpinned blocks are
+# evicted or unlinked; workers that already mapped one keep reading it until
+# they let go. The blocks are copies of stored datasets, so they get the
+# store's budget again and go with the dataset (and its filtered views) when
+# the store drops it.
+SHARED_FRAMES = LRUCache(
+    max_entries=4, max_bytes=DEFAULT_BUDGET, sizeof=lambda b: b.shm.size,
+    on_evict=_evicted, pinned=lambda b: b.pins > 0,
+)
+# Reentrant: a handle's finalizer can call drop_shared while this thread is
+# inside _pin.
+_share_lock = threading.RLock()
+
+
+def _pin(df, dataset_key):
+    """The shared block of ``df``, published on first use and pinned once more."""
+    with _share_lock:
+        block = SHARED_FRAMES.get(dataset_key)
+        if block is None:
+            block = SharedBlock(*share_frame(df))
+            # Pinned before it is cached, so inserting it cannot evict it.
+            block.pins = 1
+            SHARED_FRAMES.put(dataset_key, block)
+        else:
+            block.pins += 1
+        return block
+
+
+def _unpin(block):
+    with _share_lock:
+        block.pins -= 1
+        if block.pins == 0:
+            if block.dropped:
+                block.unlink()
+            else:
+                SHARED_FRAMES.trim()
+
+
+def drop_shared(dataset_key):
+    """Unlink the blocks of ``dataset_key`` and of views derived from it.
+
+    Blocks that pending jobs still read are unlinked when the last one finishes.
+    """
+    with _share_lock:
+        for key in SHARED_FRAMES.keys():
+            if key == dataset_key or str(key).startswith(f"{dataset_key}:"):
+                block = SHARED_FRAMES.pop(key)
+                if block is None:
+                    continue
+                if block.pins:
+                    block.dropped = True
+                else:
+                    block.unlink()
+
+
+DATASET_STORE.on_release(drop_shared)
+
+
+def shared_handle(df, dataset_key):
+    """Handle for ``df`` in shared memory, publishing it on first use.
+
+    The handle is only guaranteed to stay valid while the block is cached;
+    :func:`submit` pins it for the lifetime of its job.
+    """
+    block = _pin(df, dataset_key)
+    _unpin(block)
+    return block.handle
+
+
+@atexit.register
+def _release_shared_frames():
+    with _share_lock:
+        for key in SHARED_FRAMES.keys():
+            block = SHARED_FRAMES.pop(key)
+            if block is not None:
+                block.unlink()
+
+
+# ------------------ WORKERS ------------------
+
+_attached = {}
+
+
+def _init_worker():
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+
+def _worker_frame(handle):
+    name = handle["name"]
+    if name not in _attached:
+        # One dataset at a time per worker is enough and keeps mappings short-lived.
+        stale = [shm for shm, _ in _attached.values()]
+        _attached.clear()
+        for shm in stale:
+            try:
+                shm.close()
+            except BufferError:
+                # A view is still referenced somewhere; the mapping goes with it.
+                pass
+        _attached[name] = attach_frame(handle)
+    return _attached[name][1]
+
+
+def _run(handle, fn, args, kwargs):
+    return fn(_worker_frame(handle), *args, **kwargs)
+
+
+# ------------------ POOL ------------------
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """The process-wide render pool, started on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # Spawned workers do not inherit the server's threads or locks.
+            _pool = ProcessPoolExecutor(
+                max_workers=MAX_WORKERS, mp_context=mp.get_context("spawn"), initializer=_init_worker,
+            )
+        return _pool
+
+
+def _reset_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+atexit.register(_reset_pool)
+
+
+class RenderJob:
+    """A submitted chart render: a future plus what is needed to report on it."""
+
+    def __init__(self, future, cache_key, library, chart_type):
+        self.future = future
+        self.cache_key = cache_key
+        self.library = library
+        self.chart_type = chart_type
+        self.started = time.monotonic()
+
+    @property
+    def elapsed(self):
+        return time.monotonic() - self.started
+
+    @property
+    def status(self):
+        if self.future.cancelled():
+            return "cancelled"
+        if self.future.running():
+            return "running"
+        return "done" if self.future.done() else "queued"
+
+    @property
+    def done(self):
+        return self.future.done()
+
+    def cancel(self):
+        """Cancel the job; returns False when it is already running.
+
+        A running job cannot be stopped: it finishes in its worker and its
+        result is dropped.
+        """
+        return self.future.cancel()
+
+    def result(self):
+        try:
+            return self.future.result()
+        except BrokenProcessPool:
+            _reset_pool()
+            raise
+
+
+def submit(fn, df, dataset_key, args=(), kwargs=None):
+    """Run ``fn(df, *args, **kwargs)`` in the pool on the shared copy of ``df``.
+
+    ``fn`` must be importable by name (a module-level function). Returns a
+    ``concurrent.futures.Future``. The shared copy of ``df`` stays pinned
+    until the future completes.
+    """
+    block = _pin(df, dataset_key)
+    try:
+        future = get_pool().submit(_run, block.handle, fn, tuple(args), kwargs or {})
+    except BaseException:
+        _unpin(block)
+        raise
+    future.add_done_callback(lambda _: _unpin(block))
+    return future
+
+
+def submit_render(df, dataset_key, spec, cache_key=None):
+    """Render ``spec`` in the pool; returns a ``RenderJob``.
+
+    ``spec`` holds the ``render_static`` arguments except the frame:
+    ``library``, ``chart_type``, ``params``, ``width``, ``height`` and
+    optionally ``corr``.
+    """
+    future = submit(render_static, df, dataset_key, kwargs=dict(spec, dataset_key=dataset_key))
+    return RenderJob(future, cache_key, spec["library"], spec["chart_type"])
+
+
+def use_pool(df, dataset_key):
+    """Whether a chart over ``df`` is worth sending to the pool."""
+    return MAX_WORKERS > 0 and dataset_key is not None and len(df) >= POOL_MIN_ROWS
@@ -0,0 +1,97 @@
+"""Columnar on-disk snapshots of parsed datasets.
+
+After the first parse a dataset is written as an uncompressed Arrow IPC
+(Feather v2) file named after its content hash. Later loads memory-map that
+file instead of re-parsing the CSV; numeric columns without nulls come back
+zero-copy. Requires ``pyarrow``; without it snapshots are silently skipped.
+"""
+
+import io
+import json
+import os
+from pathlib import Path
+
+import pandas as pd
+
+SNAPSHOT_DIR = Path(os.environ.get("VIZLAB_CACHE_DIR", ".vizlab_cache")) / "snapshots"
+MAX_SNAPSHOT_BYTES = 5 * 1024 ** 3
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.feather  # noqa: F401
+    except ImportError:
+        return None
+    return pyarrow
+
+
+def available():
+    return _pyarrow() is not None
+
+
+def _paths(key, directory):
+    directory = Path(directory)
+    return directory / f"{key}.arrow", directory / f"{key}.json"
+
+
+def write_snapshot(key, df, report, directory=SNAPSHOT_DIR):
+    """Persist ``df`` (and its compaction report) under ``key``; returns the path or None."""
+    pa = _pyarrow()
+    if pa is None:
+        return None
+    data_path, meta_path = _paths(key, directory)
+    try:
+        data_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = data_path.with_suffix(".arrow.tmp")
+        # Uncompressed so the file can be memory-mapped without decoding.
+        pa.feather.write_feather(df, tmp, compression="uncompressed")
+        os.replace(tmp, data_path)
+        meta_path.write_text(json.dumps(report))
+    except (OSError, pa.ArrowException):
+        return None
+    prune_snapshots(directory)
+    return data_path
+
+
+def read_snapshot(key, directory=SNAPSHOT_DIR):
+    """Memory-map a snapshot; returns ``(df, report)`` or None when absent."""
+    pa = _pyarrow()
+    if pa is None:
+        return None
+    data_path, meta_path = _paths(key, directory)
+    if not data_path.exists():
+        return None
+    try:
+        table = pa.feather.read_table(data_path, memory_map=True)
+        df = table.to_pandas(split_blocks=True)
+        report = json.loads(meta_path.read_text()) if meta_path.exists() else None
+    except (OSError, ValueError, pa.ArrowException):
+        return None
+    os.utime(data_path)
+    return df, report
+
+
+def remove_snapshot(key, directory=SNAPSHOT_DIR):
+    """Delete the snapshot stored under ``key``, if any."""
+    for path in _paths(key, directory):
+        path.unlink(missing_ok=True)
+
+
+def read_columnar(data, kind):
+    """Parse uploaded Parquet or Feather bytes into a DataFrame."""
+    buf = io.BytesIO(data)
+    if kind == "parquet":
+        return pd.read_parquet(buf)
+    return pd.read_feather(buf)
+
+
+def prune_snapshots(directory=SNAPSHOT_DIR, max_bytes=MAX_SNAPSHOT_BYTES):
+    """Drop least recently used snapshots until the directory fits ``max_bytes``."""
+    files = sorted(Path(directory).glob("*.arrow"), key=lambda p: p.stat().st_mtime)
+    total = sum(p.stat().st_size for p in files)
+    while files and total > max_bytes and len(files) > 1:
+        oldest = files.pop(0)
+        total -= oldest.stat().st_size
+        oldest.unlink(missing_ok=True)
+        oldest.with_suffix(".json").unlink(missing_ok=True)
@@ -0,0 +1,106 @@
+"""Matplotlib and Seaborn chart builders.
+
+Each chart is described by its library, chart type and the ``params`` tuple
+the page collected, and comes back as PNG (or SVG/PDF) bytes. The same code runs inline in
+the Streamlit script and inside render-pool worker processes.
+"""
+
+from vizlab.binning import category_counts, histogram
+from vizlab.categories import collapse, collapse_counts
+from vizlab.correlation import correlation
+from vizlab.figures import encode, new_figure
+from vizlab.pairgrid import pair_panels, pairplot_figure
+from vizlab.summaries import draw_box, draw_violin, group_summary, use_summary
+
+
+def _matplotlib(df, chart_type, params, width, height, dataset_key):
+    fig, ax = new_figure(width, height)
+
+    if chart_type == "Line":
+        x, y = params
+        ax.plot(df[x], df[y])
+        ax.set_xlabel(x)
+        ax.set_ylabel(y)
+
+    elif chart_type == "Bar":
+        x, y, top_n = params
+        grouped = collapse(df, x, top_n, dataset_key=dataset_key).groupby(x, observed=True)[y].mean()
+        ax.bar(grouped.index, grouped.values)
+
+    elif chart_type == "Histogram":
+        (x,) = params
+        counts, edges = histogram(df, x, 20, dataset_key=dataset_key)
+        ax.hist(edges[:-1], bins=edges, weights=counts)
+
+    elif chart_type == "Scatter":
+        x, y = params
+        ax.scatter(df[x], df[y])
+
+    elif chart_type == "Pie":
+        x, y, top_n = params
+        grouped = collapse(df, x, top_n, by="value", value=y, dataset_key=dataset_key)
+        grouped = grouped.groupby(x, observed=True)[y].sum()
+        ax.pie(grouped.values, labels=grouped.index, autopct="%1.1f%%")
+
+    else:
+        raise ValueError(f"Unknown Matplotlib chart type: {chart_type}")
+    return fig
+
+
+def _seaborn(df, chart_type, params, width, height, dataset_key, corr):
+    if chart_type == "Pair Plot":
+        cols, panel_rows = params
+        diagonal, offdiag = pair_panels(df, cols, panel_rows, dataset_key=dataset_key)
+        return pairplot_figure(cols, diagonal, offdiag)
+
+    # Seaborn (and SciPy behind it) takes seconds to import; Matplotlib
+    # charts and pair plots never load it.
+    import seaborn as sns
+
+    fig, ax = new_figure(width, height)
+
+    if chart_type == "Count Plot":
+        x, top_n = params
+        labels, counts = collapse_counts(*category_counts(df, x, dataset_key=dataset_key), top_n)
+        sns.barplot(x=labels, y=counts, ax=ax)
+        ax.set_xlabel(x)
+        ax.set_ylabel("count")
+
+    elif chart_type == "Box Plot":
+        x, y, top_n = params
+        if use_summary(df):
+            draw_box(ax, group_summary(df, x, y, top_n, dataset_key=dataset_key), x, y)
+        else:
+            sns.boxplot(data=collapse(df, x, top_n, dataset_key=dataset_key), x=x, y=y, ax=ax)
+
+    elif chart_type == "Violin Plot":
+        x, y, top_n = params
+        if use_summary(df):
+            draw_violin(ax, group_summary(df, x, y, top_n, dataset_key=dataset_key), x, y)
+        else:
+            sns.violinplot(data=collapse(df, x, top_n, dataset_key=dataset_key), x=x, y=y, ax=ax)
+
+    elif chart_type == "Correlation Heatmap":
+        cols, method = params
+        if corr is None:
+            corr = correlation(df, cols, method, dataset_key=dataset_key)
+        sns.heatmap(corr, annot=True, cmap="coolwarm", ax=ax)
+
+    else:
+        raise ValueError(f"Unknown Seaborn chart type: {chart_type}")
+    return fig
+
+
+def render_static(df, library, chart_type, params, width, height, dataset_key=None, corr=None, fmt="png"):
+    """Build a Matplotlib or Seaborn chart and return it encoded as ``fmt``.
+
+    ``corr`` is an optional precomputed correlation matrix for the
+    Correlation Heatmap, already sliced to its columns.
+    """
+    if library == "matplotlib":
+        fig = _matplotlib(df, chart_type, params, width, height, dataset_key)
+    elif library == "seaborn":
+        fig = _seaborn(df, chart_type, params, width, height, dataset_key, corr)
+    else:
+        raise ValueError(f"Unknown static chart library: {library}")
+    return encode(fig, fmt)
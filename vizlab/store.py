@@ -0,0 +1,150 @@
+"""Process-wide, reference-counted store of loaded datasets.
+
+Sessions that load the same content share one DataFrame. Each session holds
+a ``DatasetHandle``, and the dataset stays in memory while any handle is
+alive. It is dropped as soon as the last handle is released or garbage
+collected, which happens when its Streamlit session ends. Handles hand out
+shallow copies under pandas copy-on-write, so a session that filters or
+mutates its frame only copies what it changes. Caches that hold their own
+copies of a dataset (filtered views, shared-memory render frames) register
+with :meth:`DatasetStore.on_release` to drop them when the dataset goes.
+"""
+
+import os
+import threading
+import weakref
+
+import pandas as pd
+
+if int(pd.__version__.split(".")[0]) < 3:
+    # pandas 3 always copies on write; earlier versions need opting in.
+    pd.set_option("mode.copy_on_write", True)
+
+DEFAULT_BUDGET = int(os.environ.get("VIZLAB_DATASET_BUDGET_MB", 2048)) * 1024 ** 2
+
+
+class StoreFullError(MemoryError):
+    """Adding a dataset would push the store past its memory budget."""
+
+
+class DatasetHandle:
+    """One session's read-only reference to a stored dataset."""
+
+    def __init__(self, store, key, frame, report):
+        self.key = key
+        self.report = report
+        self._frame = frame
+        self._finalizer = weakref.finalize(self, store._release, key)
+
+    @property
+    def df(self):
+        """A copy-on-write view of the shared frame."""
+        return self._frame.copy(deep=False)
+
+    @property
+    def released(self):
+        return not self._finalizer.alive
+
+    def release(self):
+        """Drop this reference now instead of at garbage collection."""
+        self._finalizer()
+
+
+class _Entry:
+    __slots__ = ("frame", "report", "nbytes", "refs")
+
+    def __init__(self, frame, report, nbytes):
+        self.frame = frame
+        self.report = report
+        self.nbytes = nbytes
+        self.refs = 0
+
+
+class DatasetStore:
+    """Datasets keyed by content hash, shared by every session in the process.
+
+    ``max_bytes`` caps the total size of the stored frames. Datasets in use
+    are never evicted, so a load that does not fit raises ``StoreFullError``.
+    ``sizeof`` measures a ``(frame, report)`` pair and defaults to the
+    report's ``after`` byte count. Callbacks registered with
+    :meth:`on_release` are called with a dataset's key once it is dropped.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_BUDGET, sizeof=None):
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof or (lambda frame, report: report["after"])
+        self._entries = {}
+        self._listeners = []
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.nbytes = 0
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def acquire(self, key, load):
+        """A new handle on ``key``, calling ``load()`` for ``(frame, report)``
+        when the dataset is not stored yet."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self.hits += 1
+                return self._handle(key, entry)
+            self.misses += 1
+        # Load outside the lock so a slow parse does not block other sessions.
+        frame, report = load()
+        nbytes = self._sizeof(frame, report)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                if self.nbytes + nbytes > self.max_bytes:
+                    raise StoreFullError(
+                        f"Dataset needs {nbytes / 1024 ** 2:.0f} MB but only "
+                        f"{(self.max_bytes - self.nbytes) / 1024 ** 2:.0f} MB of the "
+                        f"{self.max_bytes / 1024 ** 2:.0f} MB dataset budget is free."
+                    )
+                entry = self._entries[key] = _Entry(frame, report, nbytes)
+                self.nbytes += nbytes
+            return self._handle(key, entry)
+
+    def _handle(self, key, entry):
+        entry.refs += 1
+        return DatasetHandle(self, key, entry.frame, entry.report)
+
+    def on_release(self, callback):
+        """Call ``callback(key)`` whenever a dataset leaves the store."""
+        self._listeners.append(callback)
+
+    def _release(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            entry.refs -= 1
+            if entry.refs > 0:
+                return
+            del self._entries[key]
+            self.nbytes -= entry.nbytes
+            self.evictions += 1
+        # Outside the lock: listeners take their own caches' locks.
+        for callback in self._listeners:
+            callback(key)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "handles": sum(e.refs for e in self._entries.values()),
+                "bytes": self.nbytes,
+                "budget": self.max_bytes,
+            }
@@ -0,0 +1,241 @@
+"""Out-of-core CSV loading with mergeable streaming aggregates.
+
+The file is read ``chunksize`` rows at a time. Each chunk is folded into a
+:class:`StreamSummary` that keeps per-column counts, nulls, mean/variance
+(Chan et al. parallel update), min/max and a fixed-size uniform row sample.
+Every part of the summary is mergeable, so summaries of separate chunks or
+files combine without revisiting the data. Peak memory is one chunk plus the
+sample, independent of file size.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from vizlab.cache import LRUCache
+from vizlab.ingest import compact_dtypes
+
+DEFAULT_CHUNKSIZE = 100_000
+DEFAULT_SAMPLE_SIZE = 50_000
+# Directory of CSV files the server may stream; unset means uploads only.
+DATA_DIR = os.environ.get("VIZLAB_DATA_DIR")
+
+
+class ColumnMoments:
+    """Count, mean, M2, M3, min and max of one numeric column."""
+
+    __slots__ = ("count", "mean", "m2", "m3", "min", "max")
+
+    def __init__(self, count=0, mean=0.0, m2=0.0, min=np.inf, max=-np.inf, m3=0.0):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+        self.m3 = m3
+        self.min = min
+        self.max = max
+
+    @classmethod
+    def from_values(cls, values):
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return cls()
+        mean = float(values.mean())
+        centered = values - mean
+        squares = centered ** 2
+        return cls(
+            int(values.size), mean, float(squares.sum()),
+            float(values.min()), float(values.max()), float((squares * centered).sum()),
+        )
+
+    def merge(self, other):
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            return ColumnMoments(other.count, other.mean, other.m2, other.min, other.max, other.m3)
+        na, nb = self.count, other.count
+        n = na + nb
+        delta = other.mean - self.mean
+        return ColumnMoments(
+            n,
+            self.mean + delta * nb / n,
+            self.m2 + other.m2 + delta * delta * na * nb / n,
+            min(self.min, other.min),
+            max(self.max, other.max),
+            self.m3 + other.m3 + delta ** 3 * na * nb * (na - nb) / n ** 2
+            + 3 * delta * (na * other.m2 - nb * self.m2) / n,
+        )
+
+    @property
+    def std(self):
+        return float(np.sqrt(self.m2 / (self.count - 1))) if self.count > 1 else np.nan
+
+    @property
+    def skew(self):
+        """Bias-corrected sample skewness, as ``Series.skew`` computes it."""
+        n = self.count
+        if n < 3:
+            return np.nan
+        if self.m2 == 0:
+            return 0.0
+        return float(n * (n - 1) ** 0.5 / (n - 2) * self.m3 / self.m2 ** 1.5)
+
+
+class StreamSummary:
+    """Mergeable summary of a table seen in pieces."""
+
+    def __init__(self, sample_size=DEFAULT_SAMPLE_SIZE, seed=None):
+        self.sample_size = sample_size
+        self.rows = 0
+        self.columns = []
+        self.nulls = {}
+        self.moments = {}
+        self.sample = None
+        self._priorities = np.empty(0)
+        self._rng = np.random.default_rng(seed)
+        self._frame = None
+
+    # -------- folding --------
+
+    def update(self, chunk):
+        """Fold one DataFrame chunk into the summary."""
+        part = StreamSummary(self.sample_size)
+        part._rng = self._rng
+        part.rows = len(chunk)
+        part.columns = list(chunk.columns)
+        part.nulls = chunk.isna().sum().astype(int).to_dict()
+        for name in chunk.select_dtypes(include="number").columns:
+            part.moments[name] = ColumnMoments.from_values(
+                chunk[name].to_numpy(dtype="float64", na_value=np.nan)
+            )
+        # Bottom-k priority sampling: keep the rows with the smallest uniform keys,
+        # which is a uniform sample of everything seen and merges by concatenation.
+        priorities = self._rng.random(len(chunk))
+        keep = np.argsort(priorities)[: self.sample_size]
+        part.sample = chunk.iloc[keep]
+        part._priorities = priorities[keep]
+        merged = self.merge(part)
+        self.__dict__.update(merged.__dict__)
+        return self
+
+    def merge(self, other):
+        """Combine two summaries of disjoint row sets."""
+        out = StreamSummary(self.sample_size)
+        out._rng = self._rng
+        out.rows = self.rows + other.rows
+        out.columns = self.columns or other.columns
+        if self.columns and other.columns and list(other.columns) != list(self.columns):
+            raise ValueError("Cannot merge summaries with different columns.")
+        out.nulls = {
+            c: self.nulls.get(c, 0) + other.nulls.get(c, 0) for c in out.columns
+        }
+        for name in out.columns:
+            # A column stays numeric only if it parsed as numeric in every piece.
+            mine = self.moments.get(name) if self.rows else ColumnMoments()
+            theirs = other.moments.get(name) if other.rows else ColumnMoments()
+            if mine is not None and theirs is not None:
+                out.moments[name] = mine.merge(theirs)
+        if self.sample is None:
+            out.sample, out._priorities = other.sample, other._priorities
+        elif other.sample is None:
+            out.sample, out._priorities = self.sample, self._priorities
+        else:
+            priorities = np.concatenate([self._priorities, other._priorities])
+            keep = np.argsort(priorities)[: self.sample_size]
+            both = pd.concat([self.sample, other.sample])
+            out.sample = both.iloc[keep]
+            out._priorities = priorities[keep]
+        return out
+
+    # -------- reporting --------
+
+    @property
+    def numeric_columns(self):
+        return [c for c in self.columns if c in self.moments]
+
+    @property
+    def missing(self):
+        return int(sum(self.nulls.values()))
+
+    def sample_frame(self):
+        """The row sample in original order with compacted dtypes, for charting."""
+        if self._frame is None:
+            if self.sample is None:
+                self._frame = pd.DataFrame(columns=self.columns)
+            else:
+                self._frame = compact_dtypes(self.sample.sort_index())[0]
+        return self._frame
+
+    def describe(self):
+        """``DataFrame.describe()``-shaped table; counts, moments and extremes are
+        exact, quartiles are estimated from the row sample."""
+        sample = self.sample if self.sample is not None else pd.DataFrame(columns=self.columns)
+        table = {}
+        for name in self.numeric_columns:
+            m = self.moments[name]
+            q = pd.to_numeric(sample[name], errors="coerce").quantile([0.25, 0.5, 0.75])
+            table[name] = [
+                m.count, m.mean if m.count else np.nan, m.std,
+                m.min if m.count else np.nan,
+                q.iloc[0], q.iloc[1], q.iloc[2],
+                m.max if m.count else np.nan,
+            ]
+        return pd.DataFrame(
+            table, index=["count", "mean", "std", "min", "25%", "50%", "75%", "max"]
+        )
+
+
+def stream_csv(source, chunksize=DEFAULT_CHUNKSIZE, sample_size=DEFAULT_SAMPLE_SIZE, seed=0):
+    """Summarise a CSV path or file-like object without loading it whole."""
+    if hasattr(source, "seek"):
+        source.seek(0)
+    summary = StreamSummary(sample_size, seed=seed)
+    for chunk in pd.read_csv(source, chunksize=chunksize):
+        summary.update(chunk)
+    return summary
+
+
+# Summaries are small (sample + scalars), so a few can stay resident.
+STREAM_CACHE = LRUCache(max_entries=4)
+
+
+def server_csvs(data_dir=DATA_DIR):
+    """Names of the CSV files directly under ``data_dir`` (none when it is unset)."""
+    if not data_dir or not os.path.isdir(data_dir):
+        return []
+    names = (e.name for e in os.scandir(data_dir) if e.name.lower().endswith(".csv"))
+    return sorted(n for n in names if server_path(n, data_dir) is not None)
+
+
+def server_path(name, data_dir=DATA_DIR):
+    """Real path of the file ``name`` under ``data_dir``, or None when it is
+    missing or resolves (through ``..`` or symlinks) to somewhere else."""
+    if not data_dir:
+        return None
+    root = os.path.realpath(data_dir)
+    path = os.path.realpath(os.path.join(root, name))
+    if os.path.commonpath([root, path]) != root or not os.path.isfile(path):
+        return None
+    return path
+
+
+def stream_key(source, key=None):
+    """Cache key for a stream: an upload's content hash, or path + size + mtime."""
+    if key is not None:
+        return key
+    st_ = os.stat(source)
+    return f"{os.path.abspath(source)}:{st_.st_size}:{st_.st_mtime_ns}"
+
+
+def load_streaming(source, key=None, chunksize=DEFAULT_CHUNKSIZE, sample_size=DEFAULT_SAMPLE_SIZE):
+    """Cached :func:`stream_csv`; returns ``(key, summary)``.
+
+    The returned key identifies the sample frame, so it differs from the key
+    the same file gets when loaded in full.
+    """
+    key = stream_key(source, key)
+    summary = STREAM_CACHE.get_or_compute(
+        (key, chunksize, sample_size),
+        lambda: stream_csv(source, chunksize=chunksize, sample_size=sample_size),
+    )
+    return f"{key}:sample{sample_size}", summary
@@ -0,0 +1,246 @@
+"""Per-group distribution summaries behind the box and violin plots.
+
+For large frames, box and violin charts are drawn from a summary instead of
+the raw values. The summary holds quartiles, whiskers, a capped set of
+outliers and a kernel density estimate on a fixed grid. It is computed in
+one sort of the (group, value) pairs plus a few vectorized reductions over
+the sorted array. The figures then carry a handful of numbers per group, so
+their cost depends on the number of groups rather than the number of rows.
+Summaries are cached per dataset, category column, value column and top-N
+setting.
+"""
+
+import numpy as np
+import plotly.graph_objects as go
+
+from vizlab.cache import LRUCache
+from vizlab.categories import DEFAULT_TOP_N, category_codes, collapse
+
+# Below this many rows the raw-value charts are cheap and keep per-point hover.
+SUMMARY_MIN_ROWS = 20_000
+# Outliers drawn per group; beyond this an evenly spaced subset (always
+# including the extremes) is kept.
+MAX_OUTLIERS = 200
+KDE_POINTS = 256
+WHISKER = 1.5
+
+SUMMARY_CACHE = LRUCache(max_entries=64)
+
+
+class GroupSummary:
+    """Distribution statistics of ``value`` for each group of ``by``.
+
+    The array attributes have one entry per group, in ``labels`` order.
+    ``density`` has one row per group over the shared ``grid``. It is zero
+    outside each group's range and integrates to one.
+    """
+
+    def __init__(self, labels, count, mean, minimum, q1, median, q3, maximum, lower, upper,
+                 outliers, grid, density):
+        self.labels = labels
+        self.count = count
+        self.mean = mean
+        self.min = minimum
+        self.q1 = q1
+        self.median = median
+        self.q3 = q3
+        self.max = maximum
+        self.lower = lower
+        self.upper = upper
+        self.outliers = outliers
+        self.grid = grid
+        self.density = density
+
+    def __len__(self):
+        return len(self.labels)
+
+
+def _quantile(sorted_values, starts, counts, p):
+    """Linearly interpolated ``p`` quantile of every group (as ``np.quantile``)."""
+    pos = starts + p * (counts - 1)
+    lo = np.floor(pos).astype("int64")
+    hi = np.minimum(lo + 1, starts + counts - 1)
+    frac = pos - lo
+    return sorted_values[lo] * (1 - frac) + sorted_values[hi] * frac
+
+
+def _capped(values, limit=MAX_OUTLIERS):
+    if len(values) <= limit:
+        return values
+    return values[np.linspace(0, len(values) - 1, limit).round().astype("int64")]
+
+
+def _kde(values, group, n_groups, counts, std, minimum, maximum):
+    """Gaussian KDE of every group on one shared grid, by binning then smoothing."""
+    lo, hi = float(values.min()), float(values.max())
+    if hi <= lo:
+        hi = lo + 1.0
+    grid = np.linspace(lo, hi, KDE_POINTS)
+    step = grid[1] - grid[0]
+    bins = np.clip(np.rint((values - lo) / step).astype("int64"), 0, KDE_POINTS - 1)
+    hist = np.bincount(group * KDE_POINTS + bins, minlength=n_groups * KDE_POINTS)
+    hist = hist.reshape(n_groups, KDE_POINTS).astype("float64")
+
+    # Scott's rule, as in scipy.stats.gaussian_kde and Seaborn.
+    bandwidth = std * counts ** (-1 / 5)
+    density = np.empty_like(hist)
+    for g in range(n_groups):
+        sigma = max(bandwidth[g] / step, 0.5)
+        half = int(min(np.ceil(4 * sigma), KDE_POINTS))
+        offsets = np.arange(-half, half + 1)
+        kernel = np.exp(-0.5 * (offsets / sigma) ** 2)
+        smooth = np.convolve(hist[g], kernel / kernel.sum(), mode="same")
+        smooth[(grid < minimum[g]) | (grid > maximum[g])] = 0.0
+        total = smooth.sum() * step
+        density[g] = smooth / total if total > 0 else smooth
+    return grid, density
+
+
+def _summarize(df, by, value):
+    codes, categories = category_codes(df[by])
+    values = df[value].to_numpy(dtype="float64", na_value=np.nan)
+    keep = (codes >= 0) & np.isfinite(values)
+    codes, values = codes[keep], values[keep]
+    if len(values) == 0:
+        raise ValueError(f"{value} has no values to summarize by {by}.")
+
+    order = np.lexsort((values, codes))
+    codes, values = codes[order], values[order]
+    counts = np.bincount(codes, minlength=len(categories))
+    present = np.flatnonzero(counts)
+    counts = counts[present]
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    ends = starts + counts - 1
+    group = np.repeat(np.arange(len(present)), counts)
+
+    q1, median, q3 = (_quantile(values, starts, counts, p) for p in (0.25, 0.5, 0.75))
+    minimum, maximum = values[starts], values[ends]
+    mean = np.add.reduceat(values, starts) / counts
+    sq = np.add.reduceat((values - mean[group]) ** 2, starts)
+    std = np.sqrt(sq / np.maximum(counts - 1, 1))
+
+    iqr = q3 - q1
+    low_fence, high_fence = q1 - WHISKER * iqr, q3 + WHISKER * iqr
+    index = np.arange(len(values))
+    # Whiskers end at the most extreme values still inside the fences.
+    lower = values[np.minimum.reduceat(np.where(values >= low_fence[group], index, len(values)), starts)]
+    upper = values[np.maximum.reduceat(np.where(values <= high_fence[group], index, -1), starts)]
+
+    outside = (values < low_fence[group]) | (values > high_fence[group])
+    out_groups = group[outside]
+    split = np.searchsorted(out_groups, np.arange(1, len(present)))
+    outliers = [_capped(v) for v in np.split(values[outside], split)]
+
+    grid, density = _kde(values, group, len(present), counts, std, minimum, maximum)
+    return GroupSummary(
+        categories[present], counts, mean, minimum, q1, median, q3, maximum, lower, upper,
+        outliers, grid, density,
+    )
+
+
+def group_summary(df, by, value, top_n=DEFAULT_TOP_N, dataset_key=None):
+    """:class:`GroupSummary` of ``value`` per category of ``by``, after folding
+    all but the ``top_n`` most frequent categories into "Other"."""
+    def compute():
+        return _summarize(collapse(df, by, top_n, dataset_key=dataset_key), by, value)
+
+    if dataset_key is None:
+        return compute()
+    return SUMMARY_CACHE.get_or_compute((dataset_key, by, value, top_n), compute)
+
+
+def use_summary(df):
+    return len(df) >= SUMMARY_MIN_ROWS
+
+
+# ------------------ PLOTLY TRACES ------------------
+
+def _outlier_trace(summary, x_values, color):
+    xs = np.concatenate([np.full(len(o), x, dtype=object) for x, o in zip(x_values, summary.outliers)])
+    return go.Scatter(
+        x=xs, y=np.concatenate(summary.outliers), mode="markers", marker=dict(color=color, size=4),
+        name="outliers", showlegend=False, hoverinfo="y",
+    )
+
+
+def box_figure(summary, x, y):
+    """Plotly box plot drawn from ``summary``, with its capped outliers."""
+    labels = [str(label) for label in summary.labels]
+    color = "#636efa"
+    fig = go.Figure([
+        go.Box(
+            x=labels, q1=summary.q1, median=summary.median, q3=summary.q3, mean=summary.mean,
+            lowerfence=summary.lower, upperfence=summary.upper, name=y, marker_color=color,
+            boxpoints=False, showlegend=False,
+        ),
+        _outlier_trace(summary, labels, color),
+    ])
+    fig.update_layout(xaxis_title=x, yaxis_title=y)
+    return fig
+
+
+def violin_figure(summary, x, y, width=0.8):
+    """Plotly violin plot: each group's density as a filled outline around an
+    inner box, at positions 0..n-1 labelled with the groups."""
+    color = "#636efa"
+    positions = np.arange(len(summary))
+    traces = []
+    for i, density in enumerate(summary.density):
+        inside = density > 0
+        grid, half = summary.grid[inside], density[inside]
+        if half.size:
+            half = half / half.max() * width / 2
+        traces.append(go.Scatter(
+            x=np.concatenate([i - half, (i + half)[::-1]]), y=np.concatenate([grid, grid[::-1]]),
+            fill="toself", mode="lines", line=dict(color=color, width=1), opacity=0.6,
+            name=str(summary.labels[i]), showlegend=False, hoverinfo="skip",
+        ))
+    traces.append(go.Box(
+        x=positions, q1=summary.q1, median=summary.median, q3=summary.q3,
+        lowerfence=summary.lower, upperfence=summary.upper, width=0.08,
+        fillcolor="white", line=dict(color="#444", width=1), boxpoints=False, showlegend=False,
+    ))
+    fig = go.Figure(traces)
+    fig.update_layout(
+        xaxis=dict(title=x, tickmode="array", tickvals=positions, ticktext=[str(v) for v in summary.labels]),
+        yaxis_title=y,
+    )
+    return fig
+
+
+# ------------------ MATPLOTLIB ------------------
+
+def draw_box(ax, summary, x, y, color="C0"):
+    """Box plot of ``summary`` on a Matplotlib axis."""
+    stats = [
+        dict(label=str(summary.labels[i]), med=summary.median[i], q1=summary.q1[i], q3=summary.q3[i],
+             whislo=summary.lower[i], whishi=summary.upper[i], mean=summary.mean[i], fliers=summary.outliers[i])
+        for i in range(len(summary))
+    ]
+    ax.bxp(stats, patch_artist=True, boxprops=dict(facecolor=color),
+           medianprops=dict(color="black"), flierprops=dict(markersize=3))
+    ax.set_xlabel(x)
+    ax.set_ylabel(y)
+
+
+def draw_violin(ax, summary, x, y, color="C0"):
+    """Violin plot of ``summary`` with an inner box, as Seaborn draws it."""
+    stats = []
+    for i in range(len(summary)):
+        inside = summary.density[i] > 0
+        stats.append(dict(
+            coords=summary.grid[inside], vals=summary.density[i][inside], mean=summary.mean[i],
+            median=summary.median[i], min=summary.min[i], max=summary.max[i],
+        ))
+    positions = np.arange(len(summary))
+    parts = ax.violin(stats, positions, widths=0.8, showextrema=False)
+    for body in parts["bodies"]:
+        body.set_facecolor(color)
+        body.set_edgecolor("#333")
+        body.set_alpha(0.8)
+    ax.vlines(positions, summary.lower, summary.upper, color="#333", linewidth=1)
+    ax.vlines(positions, summary.q1, summary.q3, color="#333", linewidth=5)
+    ax.scatter(positions, summary.median, color="white", s=12, zorder=3)
+    ax.set_xticks(positions, [str(v) for v in summary.labels])
+    ax.set_xlabel(x)
+    ax.set_ylabel(y)